@@ -5,13 +5,20 @@ from typing import List, Optional
 from protostar.cli import ActivityIndicator, Command
 from protostar.compiler import ProjectCompiler, ProjectCompilerConfig
 from protostar.utils import log_color_provider
+from protostar.utils.compiler.compiler_profiler import CompilerProfiler
 
 
 class BuildCommand(Command):
-    def __init__(self, project_compiler: ProjectCompiler, logger: Logger) -> None:
+    def __init__(
+        self,
+        project_compiler: ProjectCompiler,
+        logger: Logger,
+        compiler_profile_path: Optional[Path] = None,
+    ) -> None:
         super().__init__()
         self._project_compiler = project_compiler
         self._logger = logger
+        self._compiler_profile_path = compiler_profile_path
 
     @property
     def example(self) -> Optional[str]:
@@ -46,6 +53,15 @@ class BuildCommand(Command):
                 type="path",
                 default="build",
             ),
+            Command.Argument(
+                name="profile-compiler",
+                description=(
+                    "Print wall time and memory allocated by each stage of the compiler, "
+                    "and save them to `.protostar_cache/compiler_profile.json`. "
+                    "Contracts which are up to date aren't compiled, so they aren't measured."
+                ),
+                type="bool",
+            ),
         ]
 
     async def run(self, args):
@@ -53,6 +69,7 @@ class BuildCommand(Command):
             output_dir=args.output,
             disable_hint_validation=args.disable_hint_validation,
             relative_cairo_path=args.cairo_path,
+            profile_compiler=args.profile_compiler,
         )
 
     async def build(
@@ -60,7 +77,9 @@ class BuildCommand(Command):
         output_dir: Path,
         disable_hint_validation=False,
         relative_cairo_path: Optional[List[Path]] = None,
+        profile_compiler: bool = False,
     ):
+        compiler_profiler = CompilerProfiler() if profile_compiler else None
         with ActivityIndicator(
             log_color_provider.colorize("GRAY", "Building projects' contracts")
         ):
@@ -71,8 +90,18 @@ class BuildCommand(Command):
                         hint_validation_disabled=disable_hint_validation,
                         relative_cairo_path=relative_cairo_path or [],
                     ),
+                    compiler_profiler=compiler_profiler,
                 )
             except BaseException as exc:
                 self._logger.error("Build failed")
                 raise exc
+            finally:
+                if compiler_profiler is not None:
+                    self._log_compiler_profile(compiler_profiler)
         self._logger.info("Built the project successfully")
+
+    def _log_compiler_profile(self, compiler_profiler: CompilerProfiler) -> None:
+        compiler_profile = compiler_profiler.collect()
+        self._logger.info("Compiler profile:\n%s", compiler_profile.format())
+        if self._compiler_profile_path is not None:
+            compiler_profile.save(self._compiler_profile_path)
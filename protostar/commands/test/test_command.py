@@ -1,6 +1,7 @@
+import multiprocessing
 from logging import Logger
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, NoReturn, Optional, Set
 
 from protostar.cli.activity_indicator import ActivityIndicator
 from protostar.cli.command import Command
@@ -11,22 +12,33 @@ from protostar.commands.test.test_result_formatter import format_test_result
 from protostar.commands.test.testing_live_logger import TestingLiveLogger
 from protostar.compiler import ProjectCairoPathBuilder
 from protostar.testing import (
+    CairoFilesWatcher,
+    ChangedTestsSelector,
+    ShardSummary,
     TestCollector,
+    TestDependencyGraph,
     TestingSummary,
     TestResult,
+    TestResultsCache,
     TestRunner,
     TestScheduler,
+    TestShard,
+    TestTimingsHistory,
+    TestWorkersPool,
     determine_testing_seed,
 )
+from protostar.utils.compiler.compilation_cache import CompilationCache
+from protostar.utils.compiler.compiler_profiler import CompilerProfiler
 from protostar.utils.compiler.pass_managers import (
     StarknetPassManagerFactory,
     TestCollectorPassManagerFactory,
 )
 from protostar.utils.log_color_provider import LogColorProvider
-from protostar.utils.protostar_directory import ProtostarDirectory
+from protostar.utils.protostar_directory import ProtostarDirectory, VersionManager
 from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
 
 
+# pylint: disable=too-many-instance-attributes
 class TestCommand(Command):
     def __init__(
         self,
@@ -35,6 +47,13 @@ class TestCommand(Command):
         project_cairo_path_builder: ProjectCairoPathBuilder,
         log_color_provider: LogColorProvider,
         logger: Logger,
+        compilation_cache: Optional[CompilationCache] = None,
+        fuzz_examples_databases_path: Optional[Path] = None,
+        test_timings_history_path: Optional[Path] = None,
+        test_dependencies_records_path: Optional[Path] = None,
+        test_results_cache_path: Optional[Path] = None,
+        compiler_profile_path: Optional[Path] = None,
+        version_manager: Optional[VersionManager] = None,
     ) -> None:
         super().__init__()
         self._logger = logger
@@ -42,6 +61,13 @@ class TestCommand(Command):
         self._project_root_path = project_root_path
         self._protostar_directory = protostar_directory
         self._project_cairo_path_builder = project_cairo_path_builder
+        self._compilation_cache = compilation_cache
+        self._fuzz_examples_databases_path = fuzz_examples_databases_path
+        self._test_timings_history_path = test_timings_history_path
+        self._test_dependencies_records_path = test_dependencies_records_path
+        self._test_results_cache_path = test_results_cache_path
+        self._compiler_profile_path = compiler_profile_path
+        self._version_manager = version_manager
 
     @property
     def name(self) -> str:
@@ -120,9 +146,147 @@ A glob or globs to a directory or a test suite, for example:
                 description="Print slowest tests at the end.",
                 default=0,
             ),
+            Command.Argument(
+                name="split-test-suites",
+                type="bool",
+                description=(
+                    "Distribute test cases of each test suite across all workers. "
+                    "Every worker compiles a test suite and runs its `__setup__` hook once "
+                    "for the test cases it picks up. A test suite which fails to compile "
+                    "or set up is reported once."
+                ),
+            ),
+            Command.Argument(
+                name="fuzz-processes",
+                type="int",
+                description=(
+                    "Split examples of each fuzz test between the given number of processes. "
+                    "Every process runs a part of examples with its own seed derived from the testing seed."
+                ),
+                default=1,
+            ),
+            Command.Argument(
+                name="changed",
+                type="bool",
+                description=(
+                    "Run only test cases affected by changes since the last run with this flag: "
+                    "test suites which depend on modified files and test cases "
+                    "which didn't pass last time."
+                ),
+            ),
+            Command.Argument(
+                name="changed-since",
+                type="str",
+                description=(
+                    "Run only test suites which depend on files changed since the given git ref, "
+                    "e.g. `main`."
+                ),
+            ),
+            Command.Argument(
+                name="cache-results",
+                type="bool",
+                description=(
+                    "Don't run test cases which passed in a previous run with this flag, "
+                    "if the test suite, contracts and modules it depends on, "
+                    "Protostar and cairo-lang versions, and, for fuzz tests, the seed are unchanged. "
+                    "Such test cases are reported as cached passes."
+                ),
+            ),
+            Command.Argument(
+                name="flat-state-reader",
+                type="bool",
+                description=(
+                    "Keep the state of tests in plain dictionaries instead of Patricia trees, "
+                    "so storage reads and writes don't compute Pedersen hashes. "
+                    "State roots of such tests aren't meaningful."
+                ),
+            ),
+            Command.Argument(
+                name="lazy-debug-info",
+                type="bool",
+                description=(
+                    "Compile test suites without debug info, which makes compiling and running them faster. "
+                    "Test cases which fail or break are run again with debug info to show the Cairo traceback."
+                ),
+            ),
+            Command.Argument(
+                name="profile-compiler",
+                type="bool",
+                description=(
+                    "Print wall time and memory allocated by each stage of the compiler "
+                    "while collecting tests, compiling test suites and contracts they declare, "
+                    "and save them to `.protostar_cache/compiler_profile.json`. "
+                    "Contracts taken from the compilation cache aren't measured. "
+                    "Execution times of profiled runs aren't recorded in the test timings history."
+                ),
+            ),
+            Command.Argument(
+                name="watch",
+                type="bool",
+                description=(
+                    "Keep running and rerun test suites affected by changes in Cairo files "
+                    "of the project and the cairo path. Workers are reused between runs."
+                ),
+            ),
+            Command.Argument(
+                name="shard",
+                type="str",
+                description=(
+                    "Run only the given shard of collected test suites, in the INDEX/TOTAL format, "
+                    "e.g. `1/4`. Test suites are balanced across shards by durations recorded "
+                    "in previous runs if available, or by numbers of test cases otherwise, "
+                    "so all shards must start with the same `.protostar_cache/test_timings.json`."
+                ),
+            ),
+            Command.Argument(
+                name="summary-output",
+                type="path",
+                description=(
+                    "Save results of the run to a JSON file, "
+                    "which can be merged with results of other shards with `--merge-summaries`."
+                ),
+            ),
+            Command.Argument(
+                name="merge-summaries",
+                type="path",
+                is_array=True,
+                description=(
+                    "Instead of running tests, merge results saved by shards with `--summary-output` "
+                    "and print a summary of all of them."
+                ),
+            ),
         ]
 
     async def run(self, args) -> TestingSummary:
+        if args.merge_summaries:
+            summary = self.merge_summaries(
+                args.merge_summaries,
+                slowest_tests_to_report_count=args.report_slowest_tests,
+            )
+            summary.assert_all_passed()
+            return summary
+
+        if args.watch:
+            await self.watch(
+                targets=args.target,
+                ignored_targets=args.ignore,
+                cairo_path=args.cairo_path,
+                disable_hint_validation=args.disable_hint_validation,
+                no_progress_bar=args.no_progress_bar,
+                safe_collecting=args.safe_collecting,
+                exit_first=args.exit_first,
+                seed=args.seed,
+                slowest_tests_to_report_count=args.report_slowest_tests,
+                split_test_suites=args.split_test_suites,
+                fuzz_processes_count=args.fuzz_processes,
+                changed=args.changed,
+                changed_since=args.changed_since,
+                cache_results=args.cache_results,
+                lazy_debug_info=args.lazy_debug_info,
+                profile_compiler=args.profile_compiler,
+                use_flat_state_reader=args.flat_state_reader,
+            )
+
         summary = await self.test(
             targets=args.target,
             ignored_targets=args.ignore,
@@ -133,6 +297,16 @@ A glob or globs to a directory or a test suite, for example:
             exit_first=args.exit_first,
             seed=args.seed,
             slowest_tests_to_report_count=args.report_slowest_tests,
+            split_test_suites=args.split_test_suites,
+            fuzz_processes_count=args.fuzz_processes,
+            changed=args.changed,
+            changed_since=args.changed_since,
+            cache_results=args.cache_results,
+            shard=TestShard.parse(args.shard) if args.shard else None,
+            summary_output_path=args.summary_output,
+            lazy_debug_info=args.lazy_debug_info,
+            profile_compiler=args.profile_compiler,
+            use_flat_state_reader=args.flat_state_reader,
         )
         summary.assert_all_passed()
         return summary
@@ -148,6 +322,18 @@ A glob or globs to a directory or a test suite, for example:
         exit_first: bool = False,
         seed: Optional[int] = None,
         slowest_tests_to_report_count: int = 0,
+        split_test_suites: bool = False,
+        fuzz_processes_count: int = 1,
+        changed: bool = False,
+        changed_since: Optional[str] = None,
+        cache_results: bool = False,
+        shard: Optional[TestShard] = None,
+        summary_output_path: Optional[Path] = None,
+        changed_files: Optional[Set[str]] = None,
+        workers_pool: Optional[TestWorkersPool] = None,
+        lazy_debug_info: bool = False,
+        profile_compiler: bool = False,
+        use_flat_state_reader: bool = False,
     ) -> TestingSummary:
         include_paths = [
             str(path)
@@ -165,6 +351,7 @@ A glob or globs to a directory or a test suite, for example:
         )
 
         testing_seed = determine_testing_seed(seed)
+        compiler_profiler = CompilerProfiler() if profile_compiler else None
 
         with ActivityIndicator(
             self._log_color_provider.colorize("GRAY", "Collecting tests")
@@ -175,39 +362,202 @@ A glob or globs to a directory or a test suite, for example:
                         disable_hint_validation=True, include_paths=include_paths
                     ),
                     pass_manager_factory=factory,
+                    profiler=compiler_profiler,
+                ),
+                config=TestCollector.Config(
+                    safe_collecting=safe_collecting,
+                    processes_count=multiprocessing.cpu_count(),
                 ),
-                config=TestCollector.Config(safe_collecting=safe_collecting),
             ).collect(
                 targets=targets,
                 ignored_targets=ignored_targets,
                 default_test_suite_glob=str(self._project_root_path),
             )
 
+        test_timings_history = self._load_test_timings_history()
+
+        dependency_graph = TestDependencyGraph(include_paths)
+
+        changed_tests_selector: Optional[ChangedTestsSelector] = None
+        if changed or changed_since is not None or changed_files is not None:
+            changed_tests_selector = ChangedTestsSelector(
+                dependency_graph,
+                records_path=self._test_dependencies_records_path,
+                project_root_path=self._project_root_path,
+                changed_since=changed_since,
+                changed_files=changed_files,
+            )
+            test_collector_result = changed_tests_selector.select(test_collector_result)
+
+        if shard is not None:
+            test_collector_result = shard.select(
+                test_collector_result, test_timings_history
+            )
+
         self._log_test_collector_result(test_collector_result)
 
         testing_summary = TestingSummary(
             case_results=test_collector_result.broken_test_suites,  # type: ignore | pyright bug?
             testing_seed=testing_seed,
+            test_timings_history=test_timings_history,
         )
 
-        if test_collector_result.test_cases_count > 0:
-            live_logger = TestingLiveLogger(
-                logger=self._logger,
-                testing_summary=testing_summary,
-                no_progress_bar=no_progress_bar,
-                exit_first=exit_first,
-                slowest_tests_to_report_count=slowest_tests_to_report_count,
+        test_results_cache: Optional[TestResultsCache] = None
+        test_collector_result_to_run = test_collector_result
+        if cache_results and self._test_results_cache_path is not None:
+            test_results_cache = TestResultsCache(
+                self._test_results_cache_path,
+                protostar_version=self._get_protostar_version(),
+            )
+            test_collector_result_to_run, cached_results = test_results_cache.split(
+                test_collector_result,
+                dependency_graph,
+                settings={
+                    "include_paths": include_paths,
+                    "disable_hint_validation": disable_hint_validation,
+                },
+                testing_seed=testing_seed,
             )
+            for cached_result in cached_results:
+                self._log_formatted_test_result(cached_result)
+            testing_summary.extend(cached_results)
+
+        live_logger = TestingLiveLogger(
+            logger=self._logger,
+            testing_summary=testing_summary,
+            no_progress_bar=no_progress_bar,
+            exit_first=exit_first,
+            slowest_tests_to_report_count=slowest_tests_to_report_count,
+            collected_test_collector_result=test_collector_result,
+        )
+        if test_collector_result_to_run.test_cases_count > 0:
             TestScheduler(live_logger, worker=TestRunner.worker).run(
                 include_paths=include_paths,
-                test_collector_result=test_collector_result,
+                test_collector_result=test_collector_result_to_run,
                 disable_hint_validation=disable_hint_validation,
                 exit_first=exit_first,
                 testing_seed=testing_seed,
+                split_test_suites=split_test_suites,
+                compilation_cache=self._compilation_cache,
+                fuzz_processes_count=fuzz_processes_count,
+                fuzz_examples_databases_path=self._fuzz_examples_databases_path,
+                test_timings_history=test_timings_history,
+                workers_pool=workers_pool,
+                lazy_debug_info=lazy_debug_info,
+                compiler_profiler=compiler_profiler,
+                use_flat_state_reader=use_flat_state_reader,
             )
+        elif test_collector_result.test_cases_count > 0:
+            live_logger.log_testing_summary(test_collector_result)
+
+        if compiler_profiler is not None:
+            self._log_compiler_profile(compiler_profiler)
+        else:
+            # Compiling under tracemalloc inflates execution times of profiled runs.
+            self._record_test_timings(test_timings_history, testing_summary)
+        if changed_tests_selector is not None:
+            changed_tests_selector.record(testing_summary.case_results)
+        if test_results_cache is not None:
+            test_results_cache.record(testing_summary.case_results, testing_seed)
+
+        if summary_output_path is not None:
+            ShardSummary.from_testing_summary(
+                testing_summary, test_collector_result, shard
+            ).save(summary_output_path)
 
         return testing_summary
 
+    async def watch(
+        self,
+        targets: List[str],
+        cairo_path: Optional[List[Path]] = None,
+        **test_kwargs: Any,
+    ) -> NoReturn:
+        """
+        Run tests, then rerun test suites affected by changes in Cairo files until interrupted.
+        Worker processes are reused, so only the first run pays for starting them.
+        """
+        files_watcher = CairoFilesWatcher(
+            [self._project_root_path, *(cairo_path or [])]
+        )
+        workers_pool = TestWorkersPool(multiprocessing.cpu_count())
+        changed_files: Optional[Set[str]] = None
+        try:
+            while True:
+                await self.test(
+                    targets,
+                    cairo_path=cairo_path,
+                    changed_files=changed_files,
+                    workers_pool=workers_pool,
+                    **test_kwargs,
+                )
+                self._logger.info("Watching for changes, press CTRL+C to exit")
+                # Changes made while tests are running are picked up by the next run.
+                changed_files = files_watcher.wait_for_changes()
+                test_kwargs.update(changed=False, changed_since=None)
+        finally:
+            workers_pool.close()
+
+    def merge_summaries(
+        self,
+        summary_paths: List[Path],
+        slowest_tests_to_report_count: int = 0,
+    ) -> TestingSummary:
+        merged_summary = ShardSummary.merge(
+            [ShardSummary.load(summary_path) for summary_path in summary_paths]
+        )
+        test_timings_history = self._load_test_timings_history()
+        testing_summary = TestingSummary(
+            case_results=merged_summary.test_results,
+            testing_seed=merged_summary.testing_seed,
+            test_timings_history=test_timings_history,
+        )
+
+        for test_result in [
+            *testing_summary.broken_suites,
+            *testing_summary.broken,
+            *testing_summary.failed,
+        ]:
+            self._log_formatted_test_result(test_result)
+        testing_summary.log(
+            logger=self._logger,
+            collected_test_cases_count=merged_summary.collected_test_cases_count,
+            collected_test_suites_count=merged_summary.collected_test_suites_count,
+            slowest_test_cases_to_report_count=slowest_tests_to_report_count,
+        )
+
+        self._record_test_timings(test_timings_history, testing_summary)
+        return testing_summary
+
+    def _get_protostar_version(self) -> Optional[str]:
+        if self._version_manager is None:
+            return None
+        protostar_version = self._version_manager.protostar_version
+        return str(protostar_version) if protostar_version is not None else None
+
+    def _log_compiler_profile(self, compiler_profiler: CompilerProfiler) -> None:
+        compiler_profile = compiler_profiler.collect()
+        self._logger.info("Compiler profile:\n%s", compiler_profile.format())
+        if self._compiler_profile_path is not None:
+            compiler_profile.save(self._compiler_profile_path)
+
+    def _load_test_timings_history(self) -> Optional[TestTimingsHistory]:
+        if self._test_timings_history_path is None:
+            return None
+        return TestTimingsHistory.load(self._test_timings_history_path)
+
+    def _record_test_timings(
+        self,
+        test_timings_history: Optional[TestTimingsHistory],
+        testing_summary: TestingSummary,
+    ) -> None:
+        if test_timings_history is None or self._test_timings_history_path is None:
+            return
+        # The testing summary compares execution times with the history from before this run.
+        updated_test_timings_history = test_timings_history.copy()
+        updated_test_timings_history.record(testing_summary.case_results)
+        updated_test_timings_history.save(self._test_timings_history_path)
+
     def _log_test_collector_result(
         self, test_collector_result: TestCollector.Result
     ) -> None:
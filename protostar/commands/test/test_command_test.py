@@ -0,0 +1,67 @@
+import json
+from logging import getLogger
+from pathlib import Path
+from typing import cast
+
+from pytest_mock import MockerFixture
+
+from protostar.commands.test.test_command import TestCommand
+from protostar.compiler import ProjectCairoPathBuilder
+from protostar.testing import ShardSummary, TestShard
+from protostar.testing.test_results import (
+    CachedPassedTestCaseResult,
+    PassedTestCaseResult,
+)
+from protostar.utils.log_color_provider import LogColorProvider
+from protostar.utils.protostar_directory import ProtostarDirectory
+
+
+def test_merging_summaries_with_cached_results(
+    tmp_path: Path, mocker: MockerFixture
+):
+    test_path = tmp_path / "test_foo.cairo"
+    for shard_index, test_result in enumerate(
+        [
+            PassedTestCaseResult(
+                file_path=test_path,
+                test_case_name="test_passed",
+                captured_stdout={},
+                execution_time=1.5,
+                execution_resources=None,
+            ),
+            CachedPassedTestCaseResult(
+                file_path=test_path,
+                test_case_name="test_cached",
+                captured_stdout={},
+                execution_time=0.0,
+                execution_resources=None,
+            ),
+        ],
+        1,
+    ):
+        ShardSummary(
+            shard=TestShard(shard_index, 2),
+            testing_seed=42,
+            collected_test_cases_count=1,
+            collected_test_suites_count=1,
+            test_results=[test_result],
+        ).save(tmp_path / f"summary_{shard_index}.json")
+    test_timings_history_path = tmp_path / "test_timings.json"
+
+    testing_summary = TestCommand(
+        project_root_path=tmp_path,
+        protostar_directory=cast(ProtostarDirectory, mocker.MagicMock()),
+        project_cairo_path_builder=cast(
+            ProjectCairoPathBuilder, mocker.MagicMock()
+        ),
+        log_color_provider=LogColorProvider(),
+        logger=getLogger(),
+        test_timings_history_path=test_timings_history_path,
+    ).merge_summaries([tmp_path / "summary_1.json", tmp_path / "summary_2.json"])
+
+    assert {type(result) for result in testing_summary.case_results} == {
+        PassedTestCaseResult,
+        CachedPassedTestCaseResult,
+    }
+    test_timings = json.loads(test_timings_history_path.read_text("utf-8"))
+    assert list(test_timings["test_suites"].values()) == [{"test_passed": [1.5]}]
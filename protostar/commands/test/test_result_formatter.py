@@ -7,6 +7,7 @@ from protostar.testing import (
     BrokenFuzzTestCaseResult,
     BrokenTestCaseResult,
     BrokenTestSuiteResult,
+    CachedPassedTestCaseResult,
     FailedFuzzTestCaseResult,
     FailedTestCaseResult,
     OutputName,
@@ -24,6 +25,8 @@ LogCallback = Callable[[str], None]
 
 # pylint: disable=too-many-return-statements
 def format_test_result(test_result: TestResult) -> str:
+    if isinstance(test_result, CachedPassedTestCaseResult):
+        return _format_cached_passed_test_case_result(test_result)
     if isinstance(test_result, PassedFuzzTestCaseResult):
         return _format_passed_fuzz_test_case_result(test_result)
     if isinstance(test_result, FailedFuzzTestCaseResult):
@@ -56,6 +59,7 @@ def _format_passed_test_case_result(
             execution_time=passed_test_case_result.execution_time,
             test_case_name=passed_test_case_result.test_case_name,
             fuzz_runs_count=None,
+            fuzz_examples_per_second=None,
         )
     )
 
@@ -163,6 +167,12 @@ def _format_passed_fuzz_test_case_result(
             f"fuzz_runs={log_color_provider.bold(passed_fuzz_test_case_result.fuzz_runs_count)}"
         )
 
+    if passed_fuzz_test_case_result.fuzz_examples_per_second is not None:
+        formatted_examples_per_second = log_color_provider.bold(
+            f"{passed_fuzz_test_case_result.fuzz_examples_per_second:.1f}"
+        )
+        info_items.append(f"fuzz_runs_per_second={formatted_examples_per_second}")
+
     if passed_fuzz_test_case_result.execution_resources:
         if passed_fuzz_test_case_result.execution_resources.n_steps:
             info_items.append(
@@ -213,6 +223,21 @@ def _format_passed_fuzz_test_case_result(
     return first_line
 
 
+def _format_cached_passed_test_case_result(
+    cached_passed_test_case_result: CachedPassedTestCaseResult,
+) -> str:
+    formatted_file_path = _get_formatted_file_path(
+        cached_passed_test_case_result.file_path
+    )
+    return " ".join(
+        [
+            f"[{log_color_provider.colorize('GREEN', 'PASS')}]",
+            f"{formatted_file_path} {cached_passed_test_case_result.test_case_name}",
+            log_color_provider.colorize("GRAY", "(cached)"),
+        ]
+    )
+
+
 def _format_skipped_test_case_result(skipped_test_case_result: SkippedTestCaseResult):
     result: List[str] = []
     first_line: List[str] = []
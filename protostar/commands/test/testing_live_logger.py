@@ -1,6 +1,6 @@
 import queue
 from logging import Logger
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 from tqdm import tqdm as bar
 
@@ -24,16 +24,21 @@ class TestingLiveLogger:
         no_progress_bar: bool,
         exit_first: bool,
         slowest_tests_to_report_count: int,
+        collected_test_collector_result: Optional["TestCollector.Result"] = None,
     ) -> None:
         self._logger = logger
         self._no_progress_bar = no_progress_bar
         self.testing_summary = testing_summary
         self.exit_first = exit_first
         self.slowest_tests_to_report_count = slowest_tests_to_report_count
+        # Test cases reported without running them (e.g. cached ones) count as collected too.
+        self._collected_test_collector_result = collected_test_collector_result
 
     def log_testing_summary(
         self, test_collector_result: "TestCollector.Result"
     ) -> None:
+        if self._collected_test_collector_result is not None:
+            test_collector_result = self._collected_test_collector_result
         self.testing_summary.log(
             logger=self._logger,
             collected_test_cases_count=test_collector_result.test_cases_count,
@@ -61,6 +66,11 @@ class TestingLiveLogger:
                     while tests_left_n > 0:
                         test_result: TestResult = shared_tests_state.get_result()
 
+                        is_already_reported = isinstance(
+                            test_result, BrokenTestSuiteResult
+                        ) and self.testing_summary.has_broken_test_suite(
+                            test_result.file_path
+                        )
                         self.testing_summary.extend([test_result])
 
                         cast(Any, progress_bar).colour = (
@@ -69,8 +79,9 @@ class TestingLiveLogger:
                             else "GREEN"
                         )
 
-                        formatted_test_result = format_test_result(test_result)
-                        progress_bar.write(formatted_test_result)
+                        if not is_already_reported:
+                            formatted_test_result = format_test_result(test_result)
+                            progress_bar.write(formatted_test_result)
 
                         if (
                             self.exit_first
@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+
+from protostar.utils.compiler.compilation_cache import (
+    ModuleFingerprint,
+    ModuleName,
+    are_modules_up_to_date,
+    hash_file,
+)
+
+
+@dataclass(frozen=True)
+class BuildInputs:
+    source_paths: List[Path]
+    include_paths: List[str]
+    hint_validation_disabled: bool
+    debugging_info_attached: bool
+
+    def get_key(self) -> str:
+        key_data = {
+            "sources": [
+                [str(path.resolve()), hash_file(str(path))]
+                for path in self.source_paths
+            ],
+            "include_paths": [os.path.abspath(path) for path in self.include_paths],
+            "hint_validation_disabled": self.hint_validation_disabled,
+            "debugging_info_attached": self.debugging_info_attached,
+            "cairo_lang_version": cairo_lang_version,
+        }
+        return hashlib.sha256(
+            json.dumps(key_data, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+
+class BuildManifest:
+    """
+    Inputs and artifacts of contracts built by `protostar build`, keyed by the output directory
+    and the contract name. A contract is up to date if its sources, modules imported by them,
+    the cairo path and compilation flags didn't change, and its artifacts weren't modified.
+    """
+
+    def __init__(self, manifest_path: Path):
+        self._manifest_path = manifest_path
+        self._entries = self._load_entries()
+
+    def is_up_to_date(
+        self, output_dir: Path, contract_name: str, inputs: BuildInputs
+    ) -> bool:
+        entry = self._entries.get(_to_key(output_dir, contract_name))
+        if entry is None:
+            return False
+        try:
+            return (
+                entry["inputs"] == inputs.get_key()
+                and are_modules_up_to_date(entry["dependencies"], inputs.include_paths)
+                and all(
+                    hash_file(artifact_path) == artifact_hash
+                    for artifact_path, artifact_hash in entry["artifacts"].items()
+                )
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    def record(
+        self,
+        output_dir: Path,
+        contract_name: str,
+        inputs_key: str,
+        dependencies: Dict[ModuleName, ModuleFingerprint],
+        artifact_paths: List[Path],
+    ) -> None:
+        self._entries[_to_key(output_dir, contract_name)] = {
+            "inputs": inputs_key,
+            "dependencies": dependencies,
+            "artifacts": {
+                str(artifact_path.resolve()): hash_file(str(artifact_path))
+                for artifact_path in artifact_paths
+            },
+        }
+
+    def save(self) -> None:
+        try:
+            self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(
+                dir=self._manifest_path.parent, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                    json.dump({"contracts": self._entries}, file)
+                os.replace(tmp_path, self._manifest_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # The manifest is an optimization, failing to save it must not fail the build.
+            pass
+
+    def _load_entries(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            entries = json.loads(self._manifest_path.read_text("utf-8"))["contracts"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+
+def _to_key(output_dir: Path, contract_name: str) -> str:
+    return f"{output_dir.resolve()}::{contract_name}"
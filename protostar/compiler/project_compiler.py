@@ -1,6 +1,7 @@
+import multiprocessing
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     PreprocessorError,
@@ -14,9 +15,17 @@ from protostar.protostar_exception import ProtostarException
 from protostar.protostar_toml.protostar_contracts_section import (
     ProtostarContractsSection,
 )
+from protostar.utils.compiler.compilation_cache import (
+    CompilationCache,
+    ModuleFingerprint,
+    ModuleName,
+    fingerprint_modules,
+)
+from protostar.utils.compiler.compiler_profiler import CompilerProfiler
 from protostar.utils.compiler.pass_managers import StarknetPassManagerFactory
 from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
 
+from .build_manifest import BuildInputs, BuildManifest
 from .project_cairo_path_builder import ProjectCairoPathBuilder
 
 ContractName = str
@@ -31,6 +40,24 @@ class ProjectCompilerConfig:
     hint_validation_disabled: bool = False
 
 
+@dataclass(frozen=True)
+class ContractBuildTask:
+    contract_name: str
+    inputs: BuildInputs
+    output_dir: Path
+    parsed_modules_cache_dir: Optional[Path] = None
+    compiler_profiler: Optional[CompilerProfiler] = None
+    compilation_cache: Optional[CompilationCache] = None
+
+
+@dataclass(frozen=True)
+class BuiltContract:
+    inputs_key: str
+    dependencies: Dict[ModuleName, ModuleFingerprint]
+    artifact_paths: List[Path]
+    error: Optional[Exception] = None
+
+
 class ProjectCompiler:
     def __init__(
         self,
@@ -38,6 +65,9 @@ class ProjectCompiler:
         project_cairo_path_builder: ProjectCairoPathBuilder,
         contracts_section_loader: ProtostarContractsSection.Loader,
         default_config: Optional[ProjectCompilerConfig] = None,
+        compilation_cache: Optional[CompilationCache] = None,
+        build_manifest_path: Optional[Path] = None,
+        parsed_modules_cache_dir: Optional[Path] = None,
     ):
         self._project_root_path = project_root_path
         self._project_cairo_path_builder = project_cairo_path_builder
@@ -45,17 +75,85 @@ class ProjectCompiler:
         self._default_config = default_config or ProjectCompilerConfig(
             relative_cairo_path=[]
         )
+        self._compilation_cache = compilation_cache
+        self._build_manifest_path = build_manifest_path
+        self._parsed_modules_cache_dir = parsed_modules_cache_dir
 
     def compile_project(
-        self, output_dir: Path, config: Optional[ProjectCompilerConfig] = None
+        self,
+        output_dir: Path,
+        config: Optional[ProjectCompilerConfig] = None,
+        compiler_profiler: Optional[CompilerProfiler] = None,
     ) -> None:
+        """
+        Compile contracts in a pool of processes. Contracts recorded in the build manifest
+        as up to date are skipped.
+        """
+        current_config = config or self._default_config
+        output_dir = self._get_compilation_output_dir(output_dir)
+        include_paths = self._build_str_cairo_path_list(
+            current_config.relative_cairo_path
+        )
+        build_manifest = (
+            BuildManifest(self._build_manifest_path)
+            if self._build_manifest_path is not None
+            else None
+        )
+
+        tasks: List[ContractBuildTask] = []
         contracts_section = self._contracts_section_loader.load()
         for contract_name in contracts_section.get_contract_names():
-            contract = self.compile_contract_from_contract_name(contract_name, config)
-            CompiledContractWriter(contract, contract_name).save(
-                output_dir=self._get_compilation_output_dir(output_dir)
+            inputs = BuildInputs(
+                source_paths=self._map_contract_name_to_contract_source_paths(
+                    contract_name
+                ),
+                include_paths=include_paths,
+                hint_validation_disabled=current_config.hint_validation_disabled,
+                debugging_info_attached=current_config.debugging_info_attached,
+            )
+            if build_manifest is not None and build_manifest.is_up_to_date(
+                output_dir, contract_name, inputs
+            ):
+                continue
+            tasks.append(
+                ContractBuildTask(
+                    contract_name,
+                    inputs,
+                    output_dir,
+                    parsed_modules_cache_dir=self._parsed_modules_cache_dir,
+                    compiler_profiler=compiler_profiler,
+                    compilation_cache=self._compilation_cache,
+                )
             )
 
+        try:
+            for task, built_contract in zip(tasks, self._build_contracts(tasks)):
+                if built_contract.error is not None:
+                    raise CompilationException(
+                        task.contract_name, built_contract.error
+                    ) from built_contract.error
+                if build_manifest is not None:
+                    build_manifest.record(
+                        output_dir,
+                        task.contract_name,
+                        inputs_key=built_contract.inputs_key,
+                        dependencies=built_contract.dependencies,
+                        artifact_paths=built_contract.artifact_paths,
+                    )
+        finally:
+            if build_manifest is not None:
+                build_manifest.save()
+
+    @staticmethod
+    def _build_contracts(tasks: List[ContractBuildTask]) -> Iterable[BuiltContract]:
+        processes_count = min(multiprocessing.cpu_count(), len(tasks))
+        if processes_count <= 1:
+            yield from map(build_contract, tasks)
+            return
+        with multiprocessing.Pool(processes=processes_count) as pool:
+            # Results are yielded in the order of tasks, so the first failing contract is reported.
+            yield from pool.imap(build_contract, tasks)
+
     def compile_contract_from_contract_identifier(
         self,
         contract_identifier: ContractIdentifier,
@@ -91,8 +189,10 @@ class ProjectCompiler:
                     current_config.relative_cairo_path
                 ),
                 disable_hint_validation=current_config.hint_validation_disabled,
+                parsed_modules_cache_dir=self._parsed_modules_cache_dir,
             ),
             pass_manager_factory=StarknetPassManagerFactory,
+            cache=self._compilation_cache,
         ).compile_contract(
             *contract_paths, add_debug_info=current_config.debugging_info_attached
         )
@@ -144,3 +244,41 @@ class CompilationException(ProtostarException):
         super().__init__(
             f"Protostar couldn't compile '{contract_name}' contract\n{str(err)}"
         )
+
+
+# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
+def build_contract(task: ContractBuildTask) -> BuiltContract:
+    inputs = task.inputs
+    try:
+        contract, module_names = StarknetCompiler(
+            config=CompilerConfig(
+                include_paths=inputs.include_paths,
+                disable_hint_validation=inputs.hint_validation_disabled,
+                parsed_modules_cache_dir=task.parsed_modules_cache_dir,
+            ),
+            pass_manager_factory=StarknetPassManagerFactory,
+            profiler=task.compiler_profiler,
+            cache=task.compilation_cache,
+        ).compile_contract_with_dependencies(
+            *inputs.source_paths, add_debug_info=inputs.debugging_info_attached
+        )
+    except (StarkException, VmException, PreprocessorError) as err:
+        return BuiltContract(
+            inputs_key="", dependencies={}, artifact_paths=[], error=err
+        )
+
+    save_result = CompiledContractWriter(contract, task.contract_name).save(
+        output_dir=task.output_dir
+    )
+    return BuiltContract(
+        inputs_key=inputs.get_key(),
+        dependencies=fingerprint_modules(module_names, inputs.include_paths),
+        artifact_paths=[
+            artifact_path
+            for artifact_path in [
+                save_result.compiled_contract_path,
+                save_result.compiled_contract_path_abi,
+            ]
+            if artifact_path is not None
+        ],
+    )
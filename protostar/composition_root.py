@@ -49,6 +49,7 @@ from protostar.utils import (
     VersionManager,
     log_color_provider,
 )
+from protostar.utils.compiler.compilation_cache import CompilationCache
 
 
 @dataclass
@@ -89,12 +90,27 @@ def build_di_container(script_root: Path, start_time: float = 0):
         project_section_loader=ProtostarProjectSection.Loader(protostar_toml_reader),
     )
 
+    compilation_cache = CompilationCache(
+        project_root_path / ".protostar_cache" / "compilation"
+    )
+
     project_compiler = ProjectCompiler(
         project_root_path=project_root_path,
         project_cairo_path_builder=project_cairo_path_builder,
         contracts_section_loader=ProtostarContractsSection.Loader(
             protostar_toml_reader
         ),
+        compilation_cache=compilation_cache,
+        build_manifest_path=project_root_path
+        / ".protostar_cache"
+        / "build_manifest.json",
+        parsed_modules_cache_dir=project_root_path
+        / ".protostar_cache"
+        / "parsed_modules",
+    )
+
+    compiler_profile_path = (
+        project_root_path / ".protostar_cache" / "compiler_profile.json"
     )
 
     gateway_facade_factory = GatewayFacadeFactory(
@@ -118,7 +134,11 @@ def build_di_container(script_root: Path, start_time: float = 0):
                 version_manager,
             ),
         ),
-        BuildCommand(project_compiler, logger),
+        BuildCommand(
+            project_compiler,
+            logger,
+            compiler_profile_path=compiler_profile_path,
+        ),
         InstallCommand(
             log_color_provider=log_color_provider,
             logger=logger,
@@ -156,6 +176,21 @@ def build_di_container(script_root: Path, start_time: float = 0):
             project_cairo_path_builder,
             logger=logger,
             log_color_provider=log_color_provider,
+            compilation_cache=compilation_cache,
+            fuzz_examples_databases_path=project_root_path
+            / ".protostar_cache"
+            / "fuzzing",
+            test_timings_history_path=project_root_path
+            / ".protostar_cache"
+            / "test_timings.json",
+            test_dependencies_records_path=project_root_path
+            / ".protostar_cache"
+            / "test_dependencies.json",
+            test_results_cache_path=project_root_path
+            / ".protostar_cache"
+            / "test_results.json",
+            compiler_profile_path=compiler_profile_path,
+            version_manager=version_manager,
         ),
         DeployCommand(
             logger=logger,
@@ -165,7 +200,7 @@ def build_di_container(script_root: Path, start_time: float = 0):
         MigrateCommand(
             migrator_builder=Migrator.Builder(
                 migrator_execution_environment_builder=MigratorExecutionEnvironment.Builder(
-                    project_compiler
+                    project_compiler, compilation_cache=compilation_cache
                 ),
                 project_root_path=project_root_path,
             ),
@@ -11,6 +11,7 @@ from protostar.starknet.execution_state import ExecutionState
 from protostar.starknet.forkable_starknet import ForkableStarknet
 from protostar.starknet_gateway.gateway_facade import GatewayFacade
 from protostar.testing.environments.execution_environment import ExecutionEnvironment
+from protostar.utils.compiler.compilation_cache import CompilationCache
 from protostar.utils.compiler.pass_managers import StarknetPassManagerFactory
 from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
 
@@ -22,8 +23,13 @@ class MigratorExecutionEnvironment(ExecutionEnvironment[None]):
     Config = MigratorCheatcodeFactory.Config
 
     class Builder:
-        def __init__(self, project_compiler: ProjectCompiler):
+        def __init__(
+            self,
+            project_compiler: ProjectCompiler,
+            compilation_cache: Optional[CompilationCache] = None,
+        ):
             self._project_compiler = project_compiler
+            self._compilation_cache = compilation_cache
             self._gateway_facade: Optional[GatewayFacade] = None
             self._migrator_datetime_state: Optional[MigratorDateTimeState] = None
             self._signer: Optional[BaseSigner] = None
@@ -53,6 +59,7 @@ class MigratorExecutionEnvironment(ExecutionEnvironment[None]):
             starknet_compiler = StarknetCompiler(
                 pass_manager_factory=StarknetPassManagerFactory,
                 config=compiler_config,
+                cache=self._compilation_cache,
             )
             contract_class = starknet_compiler.compile_contract(
                 migration_file_path, add_debug_info=False
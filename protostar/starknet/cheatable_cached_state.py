@@ -8,6 +8,7 @@ from starkware.starknet.public.abi import AbiType
 from typing_extensions import Self
 
 from protostar.starknet.cheaters import BlockInfoCheater, Cheaters
+from protostar.starknet.copy_on_write_dict import CopyOnWriteDict
 from protostar.starknet.types import AddressType, ClassHashType, SelectorType
 
 
@@ -16,14 +17,26 @@ class CheatableCachedState(CachedState):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.pranked_contracts_map: Dict[int, int] = {}
-        self.mocked_calls_map: Dict[AddressType, Dict[SelectorType, List[int]]] = {}
-        self.event_selector_to_name_map: Dict[int, str] = {}
-
-        self.event_name_to_contract_abi_map: Dict[str, AbiType] = {}
-        self.class_hash_to_contract_abi_map: Dict[ClassHashType, AbiType] = {}
-        self.class_hash_to_contract_path_map: Dict[ClassHashType, Path] = {}
-        self.contract_address_to_class_hash_map: Dict[AddressType, ClassHashType] = {}
+        # Cheats maps are copied on every fork of the state (for each test case, fuzz run and
+        #   contract call), so they share items with their copies until modified.
+        self.pranked_contracts_map: CopyOnWriteDict[int, int] = CopyOnWriteDict()
+        self.mocked_calls_map: CopyOnWriteDict[
+            AddressType, Dict[SelectorType, List[int]]
+        ] = CopyOnWriteDict()
+        self.event_selector_to_name_map: CopyOnWriteDict[int, str] = CopyOnWriteDict()
+
+        self.event_name_to_contract_abi_map: CopyOnWriteDict[
+            str, AbiType
+        ] = CopyOnWriteDict()
+        self.class_hash_to_contract_abi_map: CopyOnWriteDict[
+            ClassHashType, AbiType
+        ] = CopyOnWriteDict()
+        self.class_hash_to_contract_path_map: CopyOnWriteDict[
+            ClassHashType, Path
+        ] = CopyOnWriteDict()
+        self.contract_address_to_class_hash_map: CopyOnWriteDict[
+            AddressType, ClassHashType
+        ] = CopyOnWriteDict()
 
         self.cheaters = Cheaters(block_info=BlockInfoCheater(self.block_info))
 
@@ -55,47 +68,35 @@ class CheatableCachedState(CachedState):
         assert isinstance(parent, self.__class__)
         super()._apply(parent)
 
-        parent.pranked_contracts_map = {
-            **parent.pranked_contracts_map,
-            **self.pranked_contracts_map,
-        }
+        self.pranked_contracts_map.apply(parent.pranked_contracts_map)
+        self.mocked_calls_map.apply(parent.mocked_calls_map)
+        self.event_selector_to_name_map.apply(parent.event_selector_to_name_map)
 
-        parent.mocked_calls_map = {**parent.mocked_calls_map}
-
-        # pylint: disable=consider-using-dict-items
-        for address in self.mocked_calls_map:
-            if address in parent.mocked_calls_map:
-                parent.mocked_calls_map[address] = {
-                    **parent.mocked_calls_map[address],
-                    **self.mocked_calls_map[address],
-                }
-            else:
-                parent.mocked_calls_map[address] = self.mocked_calls_map[address]
-
-        parent.event_selector_to_name_map = {
-            **parent.event_selector_to_name_map,
-            **self.event_selector_to_name_map,
-        }
+        self.event_name_to_contract_abi_map.apply(parent.event_name_to_contract_abi_map)
+        self.class_hash_to_contract_path_map.apply(
+            parent.class_hash_to_contract_path_map
+        )
+        self.class_hash_to_contract_abi_map.apply(parent.class_hash_to_contract_abi_map)
+        self.contract_address_to_class_hash_map.apply(
+            parent.contract_address_to_class_hash_map
+        )
 
-        parent.event_name_to_contract_abi_map = {
-            **parent.event_name_to_contract_abi_map,
-            **self.event_name_to_contract_abi_map,
-        }
+        parent.cheaters.apply(self.cheaters)
 
-        parent.class_hash_to_contract_path_map = {
-            **parent.class_hash_to_contract_path_map,
-            **self.class_hash_to_contract_path_map,
-        }
-        parent.class_hash_to_contract_abi_map = {
-            **parent.class_hash_to_contract_abi_map,
-            **self.class_hash_to_contract_abi_map,
-        }
-        parent.contract_address_to_class_hash_map = {
-            **parent.contract_address_to_class_hash_map,
-            **self.contract_address_to_class_hash_map,
+    def set_mocked_call(
+        self, contract_address: AddressType, selector: SelectorType, ret_data: List[int]
+    ):
+        # Mocked calls of a contract are shared with copies of this state, so they are replaced
+        #   instead of being modified in place.
+        self.mocked_calls_map[contract_address] = {
+            **self.mocked_calls_map.get(contract_address, {}),
+            selector: ret_data,
         }
 
-        parent.cheaters.apply(self.cheaters)
+    def remove_mocked_call(self, contract_address: AddressType, selector: SelectorType):
+        mocked_calls = dict(self.mocked_calls_map[contract_address])
+        del mocked_calls[selector]
+        self.mocked_calls_map[contract_address] = mocked_calls
 
     def update_event_selector_to_name_map(
         self, local_event_selector_to_name_map: Dict[int, str]
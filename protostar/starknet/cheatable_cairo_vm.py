@@ -1,16 +1,89 @@
+from types import CodeType
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Optional, Tuple
+
 from starkware.cairo.lang.vm.vm_core import VirtualMachine
 
 from protostar.starknet.delayed_builder import DelayedBuilder
+from protostar.starknet.lazy_hint_locals import (
+    LazyHintLocals,
+    get_loaded_global_names,
+    has_undefined_names,
+)
 
 
 class CheatableVirtualMachine(VirtualMachine):
     """
-    `VirtualMachine` with modified `step` function that builds cheatcodes created with `DelayedBuilder`.
+    `VirtualMachine` with modified `exec_hint` function that builds `LazyHintLocals` and cheatcodes
+    created with `DelayedBuilder`, and `compile_hint` function that reuses already compiled hints.
+    """
+
+    _compiled_hints: ClassVar[Dict[Tuple[str, str], CodeType]] = {}
+    """
+    Hint code objects compiled in this process, keyed by the hint source and its `<hint{id}>` filename.
+    Hint ids depend only on the order of hints in the program, so every run of the same contract
+    reuses the code objects compiled by the first one.
+    """
+    _loaded_global_names: ClassVar[Dict[int, FrozenSet[str]]] = {}
+    """
+    `get_loaded_global_names` of compiled hints, keyed by ids of their code objects,
+    which are kept alive by `_compiled_hints`.
     """
 
+    def __init__(self, program, run_context, hint_locals, *args, **kwargs):
+        super().__init__(program, run_context, hint_locals, *args, **kwargs)
+        self._build_hint_locals: Optional[Callable[[], Dict[str, Any]]] = (
+            hint_locals.build_hint_locals
+            if isinstance(hint_locals, LazyHintLocals)
+            else None
+        )
+        self._delayed_builder_names = self._find_delayed_builder_names()
+
     def exec_hint(self, code, globals_, hint_index):
-        for name, value in globals_.items():
-            if isinstance(value, DelayedBuilder):
-                globals_[name] = value.internal_build(globals_)
+        if globals_ is self.exec_scopes[0]:
+            if self._build_hint_locals is not None and self._uses_undefined_names(
+                code, globals_
+            ):
+                self._add_lazy_hint_locals(globals_)
+
+            # Delayed cheatcodes live in the main scope and are built by the first hint run in it.
+            if self._delayed_builder_names:
+                for name in self._delayed_builder_names:
+                    globals_[name] = globals_[name].internal_build(globals_)
+                self._delayed_builder_names = []
 
         return super().exec_hint(code, globals_, hint_index)
+
+    def compile_hint(self, source, filename, hint_index, pc):
+        cache_key = (source, filename)
+        compiled_hint = CheatableVirtualMachine._compiled_hints.get(cache_key)
+        if compiled_hint is None:
+            compiled_hint = super().compile_hint(source, filename, hint_index, pc)
+            CheatableVirtualMachine._compiled_hints[cache_key] = compiled_hint
+            CheatableVirtualMachine._loaded_global_names[
+                id(compiled_hint)
+            ] = get_loaded_global_names(compiled_hint)
+        return compiled_hint
+
+    def _uses_undefined_names(self, code: CodeType, globals_: dict) -> bool:
+        loaded_global_names = CheatableVirtualMachine._loaded_global_names.get(
+            id(code)
+        )
+        if loaded_global_names is None:
+            loaded_global_names = get_loaded_global_names(code)
+        return has_undefined_names(loaded_global_names, globals_)
+
+    def _add_lazy_hint_locals(self, main_scope: dict) -> None:
+        assert self._build_hint_locals is not None
+        build_hint_locals = self._build_hint_locals
+        self._build_hint_locals = None
+        for name, value in build_hint_locals().items():
+            # Values assigned by previous hints take precedence.
+            main_scope.setdefault(name, value)
+        self._delayed_builder_names = self._find_delayed_builder_names()
+
+    def _find_delayed_builder_names(self):
+        return [
+            name
+            for name, value in self.exec_scopes[0].items()
+            if isinstance(value, DelayedBuilder)
+        ]
@@ -0,0 +1,53 @@
+from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo
+
+from .cheatable_cairo_function_runner import CheatableCairoFunctionRunner
+from .delayed_builder import DelayedBuilder
+
+
+def test_delayed_builder_is_built_once_by_first_hint():
+    program = compile_cairo(
+        """
+        func main() {
+            %{ first_value = delayed %}
+            %{ second_value = delayed %}
+            return ();
+        }
+        """,
+        prime=DEFAULT_PRIME,
+    )
+    build_calls = []
+
+    def build(exec_locals):
+        build_calls.append(exec_locals)
+        return len(build_calls)
+
+    runner = CheatableCairoFunctionRunner(program=program, layout="all")
+    runner.run("main", hint_locals={"delayed": DelayedBuilder(build)})
+
+    main_scope = runner.vm.exec_scopes[0]
+    assert len(build_calls) == 1
+    assert build_calls[0] is main_scope
+    assert main_scope["first_value"] == 1
+    assert main_scope["second_value"] == 1
+
+
+def test_reusing_compiled_hints_between_runs():
+    program = compile_cairo(
+        """
+        func main() {
+            %{ value = 1 %}
+            return ();
+        }
+        """,
+        prime=DEFAULT_PRIME,
+    )
+
+    first_runner = CheatableCairoFunctionRunner(program=program, layout="all")
+    first_runner.run("main")
+    second_runner = CheatableCairoFunctionRunner(program=program, layout="all")
+    second_runner.run("main")
+
+    [first_hint] = list(first_runner.vm.hints.values())[0]
+    [second_hint] = list(second_runner.vm.hints.values())[0]
+    assert first_hint.compiled is second_hint.compiled
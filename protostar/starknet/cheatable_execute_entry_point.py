@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING, Optional, Tuple, cast, Any
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Set, Tuple, cast
 
 from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
 from starkware.cairo.lang.vm.relocatable import RelocatableValue
@@ -23,6 +23,7 @@ from starkware.starknet.core.os import os_utils, syscall_utils
 from starkware.starknet.definitions.error_codes import StarknetErrorCode
 from starkware.starknet.definitions.general_config import StarknetGeneralConfig
 from starkware.starknet.public import abi as starknet_abi
+from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starkware_utils.error_handling import (
     StarkException,
     wrap_with_stark_exception,
@@ -33,6 +34,7 @@ from protostar.starknet.cheatable_cairo_function_runner import (
 )
 from protostar.starknet.cheatable_syscall_handler import CheatableSysCallHandler
 from protostar.starknet.cheatcode import Cheatcode
+from protostar.starknet.lazy_hint_locals import LazyHintLocals
 
 if TYPE_CHECKING:
     from protostar.starknet.cheatcode_factory import CheatcodeFactory
@@ -42,6 +44,7 @@ logger = logging.getLogger(__name__)
 
 class CheatableExecuteEntryPoint(ExecuteEntryPoint):
     cheatcode_factory: Optional["CheatcodeFactory"] = None
+    _validated_class_hashes: ClassVar[Set[bytes]] = set()
 
     def _run(
         self,
@@ -61,7 +64,9 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
         # Prepare input for Cairo function runner.
         class_hash = self._get_code_class_hash(state=state)
         contract_class = state.get_contract_class(class_hash=class_hash)
-        contract_class.validate()
+        # region Modified Starknet code.
+        self._validate_contract_class(class_hash, contract_class)
+        # endregion
 
         entry_point = self._get_selected_entry_point(
             contract_class=contract_class, class_hash=class_hash
@@ -97,22 +102,24 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
 
         syscall_handler = CheatableSysCallHandler(**syscall_dependencies)
 
-        hint_locals: dict[str, Any] = {}
-
         cheatcode_factory = CheatableExecuteEntryPoint.cheatcode_factory
         assert (
             cheatcode_factory is not None
         ), "Tried to use CheatableExecuteEntryPoint without cheatcodes."
 
-        cheatcodes = cheatcode_factory.build_cheatcodes(
-            syscall_dependencies=syscall_dependencies,
-            internal_calls=syscall_handler.internal_calls,
-        )
-        for cheatcode in cheatcodes:
-            hint_locals[cheatcode.name] = cheatcode.build()
+        def build_hint_locals() -> Dict[str, Any]:
+            assert cheatcode_factory is not None
+            hint_locals: Dict[str, Any] = {}
+            cheatcodes = cheatcode_factory.build_cheatcodes(
+                syscall_dependencies=syscall_dependencies,
+                internal_calls=syscall_handler.internal_calls,
+            )
+            for cheatcode in cheatcodes:
+                hint_locals[cheatcode.name] = cheatcode.build()
 
-        for custom_hint_local in cheatcode_factory.build_hint_locals():
-            hint_locals[custom_hint_local.name] = custom_hint_local.build()
+            for custom_hint_local in cheatcode_factory.build_hint_locals():
+                hint_locals[custom_hint_local.name] = custom_hint_local.build()
+            return hint_locals
 
         # endregion
 
@@ -133,10 +140,10 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
                 entry_point.offset,
                 *entry_points_args,
                 # region Modified Starknet code.
-                hint_locals={
-                    **hint_locals,
-                    "syscall_handler": syscall_handler,
-                },
+                hint_locals=LazyHintLocals(
+                    {"syscall_handler": syscall_handler},
+                    build_hint_locals=build_hint_locals,
+                ),
                 # endregion
                 static_locals={
                     "__find_element_max_size": 2**20,
@@ -198,3 +205,10 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
         runner.mark_as_accessed(address=args_ptr, size=len(entry_points_args))
 
         return runner, syscall_handler
+
+    @staticmethod
+    def _validate_contract_class(class_hash: bytes, contract_class: ContractClass):
+        """Validates each contract class once per process, as its hash identifies its content."""
+        if class_hash not in CheatableExecuteEntryPoint._validated_class_hashes:
+            contract_class.validate()
+            CheatableExecuteEntryPoint._validated_class_hashes.add(class_hash)
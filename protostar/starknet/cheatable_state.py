@@ -1,4 +1,4 @@
-from typing import List, Optional, Union, cast
+from typing import ClassVar, Dict, List, Optional, Union, cast
 
 from starkware.cairo.lang.vm.crypto import pedersen_hash_func
 from starkware.starknet.business_logic.execution.objects import (
@@ -11,6 +11,7 @@ from starkware.starknet.business_logic.fact_state.patricia_state import (
 from starkware.starknet.business_logic.fact_state.state import (
     SharedState,
 )
+from starkware.starknet.business_logic.state.state_api import StateReader
 from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
 from starkware.starknet.definitions import constants
 from starkware.starknet.definitions.general_config import StarknetGeneralConfig
@@ -25,9 +26,16 @@ from protostar.starknet.cheatable_execute_entry_point import CheatableExecuteEnt
 from protostar.starknet.cheatable_invoke_function import (
     create_cheatable_invoke_function,
 )
+from protostar.starknet.flat_state_reader import FlatStateReader
 
 
 class CheatableStarknetState(StarknetState):
+    _empty_state_readers: ClassVar[Dict[str, PatriciaStateReader]] = {}
+    """
+    Readers of the empty shared state built in this process, keyed by the serialized general config.
+    The reader is never written to, so every empty state can be built on top of the same one.
+    """
+
     def __init__(
         self,
         state: CheatableCachedState,
@@ -100,17 +108,21 @@ class CheatableStarknetState(StarknetState):
 
     @classmethod
     async def empty(
-        cls, general_config: Optional[StarknetGeneralConfig] = None
+        cls,
+        general_config: Optional[StarknetGeneralConfig] = None,
+        use_flat_state_reader: bool = False,
     ) -> "CheatableStarknetState":
+        """
+        ``use_flat_state_reader`` backs the state with ``FlatStateReader`` instead of
+        ``PatriciaStateReader``, for users that never need state commitments, like tests.
+        """
         if general_config is None:
             general_config = StarknetGeneralConfig()
 
-        ffc = FactFetchingContext(storage=DictStorage(), hash_func=pedersen_hash_func)
-        empty_shared_state = await SharedState.empty(
-            ffc=ffc, general_config=general_config
-        )
-        state_reader = PatriciaStateReader(
-            global_state_root=empty_shared_state.contract_states, ffc=ffc
+        state_reader: StateReader = (
+            FlatStateReader()
+            if use_flat_state_reader
+            else await cls._get_empty_state_reader(general_config)
         )
         # region Modified Starknet code.
         state = CheatableCachedState(
@@ -123,5 +135,22 @@ class CheatableStarknetState(StarknetState):
 
         return cls(state=state, general_config=general_config)
 
+    @classmethod
+    async def _get_empty_state_reader(
+        cls, general_config: StarknetGeneralConfig
+    ) -> PatriciaStateReader:
+        cache_key = general_config.dumps(sort_keys=True)
+        if cache_key not in cls._empty_state_readers:
+            ffc = FactFetchingContext(
+                storage=DictStorage(), hash_func=pedersen_hash_func
+            )
+            empty_shared_state = await SharedState.empty(
+                ffc=ffc, general_config=general_config
+            )
+            cls._empty_state_readers[cache_key] = PatriciaStateReader(
+                global_state_root=empty_shared_state.contract_states, ffc=ffc
+            )
+        return cls._empty_state_readers[cache_key]
+
     def copy(self) -> "CheatableStarknetState":
         return cast(CheatableStarknetState, super().copy())
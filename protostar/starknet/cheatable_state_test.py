@@ -0,0 +1,32 @@
+from .cheatable_state import CheatableStarknetState
+from .flat_state_reader import FlatStateReader
+
+
+async def test_empty_states_share_state_reader():
+    first_state = await CheatableStarknetState.empty()
+    second_state = await CheatableStarknetState.empty()
+
+    assert first_state.state is not second_state.state
+    assert first_state.state.state_reader is second_state.state.state_reader
+
+
+async def test_empty_states_are_isolated():
+    first_state = await CheatableStarknetState.empty()
+    second_state = await CheatableStarknetState.empty()
+
+    await first_state.state.set_storage_at(contract_address=1, key=2, value=3)
+
+    assert await first_state.state.get_storage_at(contract_address=1, key=2) == 3
+    assert await second_state.state.get_storage_at(contract_address=1, key=2) == 0
+
+
+async def test_state_with_flat_state_reader():
+    state = await CheatableStarknetState.empty(use_flat_state_reader=True)
+
+    assert isinstance(state.state.state_reader, FlatStateReader)
+    assert await state.state.get_storage_at(contract_address=1, key=2) == 0
+    assert await state.state.get_class_hash_at(contract_address=1) == bytes(32)
+
+    await state.state.set_storage_at(contract_address=1, key=2, value=3)
+
+    assert await state.state.get_storage_at(contract_address=1, key=2) == 3
@@ -77,7 +77,7 @@ class CheatableSysCallHandler(BusinessLogicSysCallHandler):
             raise CheatableSysCallHandlerException(
                 f"Couldn't find mocked selector {selector} for an address {contract_address}."
             )
-        del self.cheatable_state.mocked_calls_map[contract_address][selector]
+        self.cheatable_state.remove_mocked_call(contract_address, selector)
 
     def _call_contract(
         self,
@@ -0,0 +1,83 @@
+from typing import Any, Dict, Iterator, Mapping, MutableMapping, Optional, Set, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class CopyOnWriteDict(MutableMapping[K, V]):
+    """
+    A dict which shares its items with its copies until one of them is modified, so copying
+    (including ``deepcopy``) takes constant time regardless of the number of items.
+    Keys modified since the copy was made are recorded, so modifications can be applied back
+    to the original dict in time proportional to the number of modifications.
+
+    Values are shared between copies, so they must never be mutated in place.
+    """
+
+    def __init__(self, items: Optional[Mapping[K, V]] = None):
+        self._items: Dict[K, V] = dict(items or {})
+        self._is_shared = False
+        self._modified_keys: Set[K] = set()
+
+    def copy(self) -> "CopyOnWriteDict[K, V]":
+        # pylint: disable=protected-access
+        copied: CopyOnWriteDict[K, V] = CopyOnWriteDict()
+        copied._items = self._items
+        copied._is_shared = True
+        self._is_shared = True
+        return copied
+
+    def __copy__(self) -> "CopyOnWriteDict[K, V]":
+        return self.copy()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CopyOnWriteDict[K, V]":
+        copied = self.copy()
+        memo[id(self)] = copied
+        return copied
+
+    def apply(self, parent: "CopyOnWriteDict[K, V]") -> None:
+        """
+        Apply modifications made since this dict was copied from the ``parent``.
+        """
+        for key in self._modified_keys:
+            if key in self._items:
+                parent[key] = self._items[key]
+            elif key in parent:
+                del parent[key]
+
+    def __getitem__(self, key: K) -> V:
+        return self._items[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:  # type: ignore
+        return self._items.get(key, default)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._get_own_items()[key] = value
+        self._modified_keys.add(key)
+
+    def __delitem__(self, key: K) -> None:
+        del self._get_own_items()[key]
+        self._modified_keys.add(key)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CopyOnWriteDict):
+            return self._items == other._items
+        return self._items == other
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._items!r})"
+
+    def _get_own_items(self) -> Dict[K, V]:
+        if self._is_shared:
+            self._items = dict(self._items)
+            self._is_shared = False
+        return self._items
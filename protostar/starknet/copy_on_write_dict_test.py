@@ -0,0 +1,50 @@
+from copy import deepcopy
+
+from .copy_on_write_dict import CopyOnWriteDict
+
+
+def test_copies_are_isolated():
+    original = CopyOnWriteDict({"a": 1, "b": 2})
+
+    copied = original.copy()
+    copied["a"] = 10
+    del copied["b"]
+    original["c"] = 3
+
+    assert dict(original) == {"a": 1, "b": 2, "c": 3}
+    assert dict(copied) == {"a": 10}
+
+
+def test_deepcopy_shares_items_until_modified():
+    values = [1]
+    original = CopyOnWriteDict({"a": values})
+
+    copied = deepcopy(original)
+
+    assert copied["a"] is values
+    copied["b"] = [2]
+    assert "b" not in original
+
+
+def test_applying_modifications_to_parent():
+    parent = CopyOnWriteDict({"kept": 1, "updated": 2, "deleted": 3})
+    child = parent.copy()
+    child["updated"] = 20
+    child["added"] = 4
+    del child["deleted"]
+    child["temporary"] = 5
+    del child["temporary"]
+
+    child.apply(parent)
+
+    assert parent == {"kept": 1, "updated": 20, "added": 4}
+
+
+def test_applying_only_modifications_made_since_copy():
+    parent = CopyOnWriteDict({"a": 1})
+    child = parent.copy()
+    parent["a"] = 2
+
+    child.apply(parent)
+
+    assert parent == {"a": 2}
@@ -0,0 +1,51 @@
+from typing import Dict, Optional, Tuple
+
+from starkware.starknet.business_logic.state.state_api import StateReader
+from starkware.starknet.definitions import constants, fields
+from starkware.starknet.definitions.error_codes import StarknetErrorCode
+from starkware.starknet.services.api.contract_class import ContractClass
+from starkware.starkware_utils.error_handling import StarkException
+
+from protostar.starknet.types import AddressType
+
+
+class FlatStateReader(StateReader):
+    """
+    `StateReader` keeping contracts and storage in plain dicts.
+
+    Unlike `PatriciaStateReader`, it doesn't keep the state in commitment trees, so reading a value
+    is a dict lookup instead of a tree traversal. Tests never need state roots, and all their writes
+    are kept by `CachedState` anyway, so the reader is only asked for values that were never written.
+    """
+
+    def __init__(
+        self,
+        contract_classes: Optional[Dict[bytes, ContractClass]] = None,
+        class_hashes: Optional[Dict[AddressType, bytes]] = None,
+        nonces: Optional[Dict[AddressType, int]] = None,
+        storage: Optional[Dict[Tuple[AddressType, int], int]] = None,
+    ):
+        self.contract_classes = contract_classes or {}
+        self.class_hashes = class_hashes or {}
+        self.nonces = nonces or {}
+        self.storage = storage or {}
+
+    async def get_contract_class(self, class_hash: bytes) -> ContractClass:
+        if class_hash not in self.contract_classes:
+            formatted_class_hash = fields.class_hash_from_bytes(class_hash=class_hash)
+            raise StarkException(
+                code=StarknetErrorCode.UNDECLARED_CLASS,
+                message=f"Class with hash {formatted_class_hash} is not declared.",
+            )
+        return self.contract_classes[class_hash]
+
+    async def get_class_hash_at(self, contract_address: int) -> bytes:
+        return self.class_hashes.get(
+            contract_address, constants.UNINITIALIZED_CLASS_HASH
+        )
+
+    async def get_nonce_at(self, contract_address: int) -> int:
+        return self.nonces.get(contract_address, 0)
+
+    async def get_storage_at(self, contract_address: int, key: int) -> int:
+        return self.storage.get((contract_address, key), 0)
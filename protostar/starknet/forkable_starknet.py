@@ -25,10 +25,15 @@ class ForkableStarknet(Starknet):
 
     @classmethod
     async def empty(
-        cls, general_config: Optional[StarknetGeneralConfig] = None
+        cls,
+        general_config: Optional[StarknetGeneralConfig] = None,
+        use_flat_state_reader: bool = False,
     ) -> "ForkableStarknet":
         return ForkableStarknet(
-            state=await CheatableStarknetState.empty(general_config=general_config)
+            state=await CheatableStarknetState.empty(
+                general_config=general_config,
+                use_flat_state_reader=use_flat_state_reader,
+            )
         )
 
     def copy_and_adapt_contract(self, deployed_contract: StarknetContract):
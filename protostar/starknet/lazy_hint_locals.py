@@ -0,0 +1,54 @@
+import builtins
+import dis
+from types import CodeType
+from typing import Any, Callable, Dict, FrozenSet, Iterator
+
+BUILTIN_NAMES = frozenset(vars(builtins))
+
+GLOBAL_LOADING_OPNAMES = frozenset({"LOAD_NAME", "LOAD_GLOBAL"})
+GLOBAL_STORING_OPNAMES = frozenset({"STORE_NAME", "STORE_GLOBAL"})
+
+
+class LazyHintLocals(dict):
+    """
+    Initial hint locals and a function building the remaining ones (e.g. cheatcodes).
+    `CheatableVirtualMachine` builds them before the first hint which loads a name that isn't defined
+    in the main scope, so contract calls which don't use cheatcodes never build them.
+
+    The main scope itself stays a plain `dict`: CPython looks up globals and builtins
+    much faster in a `dict` than in its subclass, and hints look them up all the time.
+    """
+
+    def __init__(
+        self,
+        initial_locals: Dict[str, Any],
+        build_hint_locals: Callable[[], Dict[str, Any]],
+    ):
+        super().__init__(initial_locals)
+        self.build_hint_locals = build_hint_locals
+
+
+def get_loaded_global_names(code: CodeType) -> FrozenSet[str]:
+    """
+    Names loaded from globals by the code and functions or comprehensions defined in it,
+    except builtins and names the code assigns itself.
+    """
+    loaded_names = set()
+    stored_names = set()
+    for instruction in _iter_instructions(code):
+        if instruction.opname in GLOBAL_LOADING_OPNAMES:
+            loaded_names.add(instruction.argval)
+        elif instruction.opname in GLOBAL_STORING_OPNAMES:
+            stored_names.add(instruction.argval)
+    return frozenset(loaded_names - stored_names - BUILTIN_NAMES)
+
+
+def _iter_instructions(code: CodeType) -> Iterator[dis.Instruction]:
+    yield from dis.get_instructions(code)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _iter_instructions(const)
+
+
+def has_undefined_names(loaded_global_names: FrozenSet[str], scope: dict) -> bool:
+    return not scope.keys() >= loaded_global_names
@@ -0,0 +1,110 @@
+from typing import Any, Dict
+
+from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo
+
+from .cheatable_cairo_function_runner import CheatableCairoFunctionRunner
+from .delayed_builder import DelayedBuilder
+from .lazy_hint_locals import LazyHintLocals, get_loaded_global_names
+
+
+class HintLocalsBuilder:
+    def __init__(self, hint_locals: Dict[str, Any]):
+        self._hint_locals = hint_locals
+        self.calls_count = 0
+
+    def __call__(self) -> Dict[str, Any]:
+        self.calls_count += 1
+        return self._hint_locals
+
+
+def run_hints(*hints: str, hint_locals: LazyHintLocals) -> dict:
+    hints_code = "\n".join(f"%{{ {hint} %}}" for hint in hints)
+    program = compile_cairo(
+        f"""
+        func main() {{
+            {hints_code}
+            return ();
+        }}
+        """,
+        prime=DEFAULT_PRIME,
+    )
+    runner = CheatableCairoFunctionRunner(program=program, layout="all")
+    runner.run("main", hint_locals=hint_locals)
+    main_scope = runner.vm.exec_scopes[0]
+    assert type(main_scope) is dict  # pylint: disable=unidiomatic-typecheck
+    return main_scope
+
+
+def test_not_building_hint_locals_when_hint_does_not_use_them():
+    builder = HintLocalsBuilder({"cheatcode": lambda: 42})
+
+    main_scope = run_hints(
+        "result = len([initial])",
+        hint_locals=LazyHintLocals({"initial": 1}, build_hint_locals=builder),
+    )
+
+    assert main_scope["result"] == 1
+    assert builder.calls_count == 0
+
+
+def test_building_hint_locals_once_on_first_reference():
+    builder = HintLocalsBuilder({"cheatcode": lambda: 42, "other": lambda: 0})
+
+    main_scope = run_hints(
+        "first = cheatcode()",
+        "second = other()",
+        hint_locals=LazyHintLocals({}, build_hint_locals=builder),
+    )
+
+    assert (main_scope["first"], main_scope["second"]) == (42, 0)
+    assert builder.calls_count == 1
+
+
+def test_building_hint_locals_referenced_in_comprehensions():
+    builder = HintLocalsBuilder({"cheatcode": lambda value: value * 2})
+
+    main_scope = run_hints(
+        "result = [cheatcode(value) for value in range(2)]",
+        hint_locals=LazyHintLocals({}, build_hint_locals=builder),
+    )
+
+    assert main_scope["result"] == [0, 2]
+
+
+def test_building_delayed_builders_with_main_scope():
+    builder = HintLocalsBuilder(
+        {"delayed": DelayedBuilder(lambda exec_locals: exec_locals["initial"])}
+    )
+
+    main_scope = run_hints(
+        "result = delayed",
+        hint_locals=LazyHintLocals(
+            {"initial": "initial_value"}, build_hint_locals=builder
+        ),
+    )
+
+    assert main_scope["result"] == "initial_value"
+
+
+def test_keeping_values_assigned_by_hints():
+    builder = HintLocalsBuilder({"context": "cheatcode_context", "other": 0})
+
+    main_scope = run_hints(
+        "context = 'hint_context'",
+        "result = other",
+        hint_locals=LazyHintLocals({}, build_hint_locals=builder),
+    )
+
+    assert main_scope["context"] == "hint_context"
+    assert builder.calls_count == 1
+
+
+def test_getting_loaded_global_names():
+    code = compile(
+        "x = ids.value\nresult = [cheatcode(v) for v in range(x)]",
+        "<hint>",
+        "exec",
+    )
+
+    assert get_loaded_global_names(code) == {"ids", "cheatcode"}
@@ -1,10 +1,15 @@
+from .cairo_files_watcher import CairoFilesWatcher
+from .changed_tests_selector import ChangedTestsSelector
+from .shard_summary import ShardSummary
 from .test_collector import TestCollector
+from .test_dependency_graph import TestDependencyGraph
 from .test_output_recorder import OutputName, format_output_name
 from .test_results import (
     BrokenFuzzTestCaseResult,
     BrokenSetupCaseResult,
     BrokenTestCaseResult,
     BrokenTestSuiteResult,
+    CachedPassedTestCaseResult,
     FailedFuzzTestCaseResult,
     FailedTestCaseResult,
     PassedFuzzTestCaseResult,
@@ -19,8 +24,12 @@ from .test_results import (
     TimedTestResult,
     UnexpectedBrokenTestSuiteResult,
 )
+from .test_results_cache import TestResultsCache
 from .test_runner import TestRunner
 from .test_scheduler import TestScheduler
+from .test_shard import TestShard
 from .test_shared_tests_state import SharedTestsState
+from .test_timings_history import TestTimingsHistory
+from .test_workers_pool import TestWorkersPool
 from .testing_seed import determine_testing_seed
 from .testing_summary import TestingSummary
@@ -0,0 +1,55 @@
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+
+class CairoFilesWatcher:
+    """
+    Polls modification times of Cairo files in the given directories.
+    Hidden directories (e.g. `.git` or `.protostar_cache`) are skipped.
+    """
+
+    POLL_INTERVAL = 0.3
+
+    def __init__(self, directories: List[Path]):
+        self._directories = directories
+        self._modification_times = self._scan()
+
+    def wait_for_changes(self) -> Set[str]:
+        """
+        Block until Cairo files are created, modified or removed, and return their resolved paths.
+        """
+        while True:
+            time.sleep(self.POLL_INTERVAL)
+            modification_times = self._scan()
+            changed_file_paths = {
+                file_path
+                for file_path in modification_times.keys()
+                | self._modification_times.keys()
+                if modification_times.get(file_path)
+                != self._modification_times.get(file_path)
+            }
+            self._modification_times = modification_times
+            if changed_file_paths:
+                return changed_file_paths
+
+    def _scan(self) -> Dict[str, int]:
+        modification_times: Dict[str, int] = {}
+        for directory in self._directories:
+            for dir_path, dir_names, file_names in os.walk(directory):
+                dir_names[:] = [
+                    dir_name for dir_name in dir_names if not dir_name.startswith(".")
+                ]
+                for file_name in file_names:
+                    if not file_name.endswith(".cairo"):
+                        continue
+                    file_path = Path(dir_path, file_name).resolve()
+                    try:
+                        modification_times[
+                            str(file_path)
+                        ] = file_path.stat().st_mtime_ns
+                    except OSError:
+                        # The file was removed in the meantime.
+                        continue
+        return modification_times
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pytest
+
+from .cairo_files_watcher import CairoFilesWatcher
+
+
+@pytest.fixture(autouse=True)
+def short_poll_interval(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(CairoFilesWatcher, "POLL_INTERVAL", 0.01)
+
+
+def test_detecting_changed_cairo_files(tmp_path: Path):
+    (tmp_path / "src").mkdir()
+    modified_path = tmp_path / "src" / "main.cairo"
+    modified_path.write_text("%lang starknet\n")
+    removed_path = tmp_path / "src" / "removed.cairo"
+    removed_path.write_text("%lang starknet\n")
+    (tmp_path / ".protostar_cache").mkdir()
+    watcher = CairoFilesWatcher([tmp_path])
+
+    modified_path.write_text("%lang starknet\nconst A = 1;\n")
+    removed_path.unlink()
+    (tmp_path / "src" / "notes.txt").write_text("")
+    (tmp_path / ".protostar_cache" / "ignored.cairo").write_text("")
+
+    changed_file_paths = watcher.wait_for_changes()
+
+    assert changed_file_paths == {
+        str(modified_path.resolve()),
+        str(removed_path.resolve()),
+    }
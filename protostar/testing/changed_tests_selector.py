@@ -0,0 +1,192 @@
+import dataclasses
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from git import GitCommandError, InvalidGitRepositoryError
+from git.repo import Repo
+
+from protostar.protostar_exception import ProtostarException
+
+from .test_collector import TestCollector
+from .test_dependency_graph import TestDependencyGraph, TestSuiteDependencies
+from .test_results import (
+    BrokenTestSuiteResult,
+    PassedTestCaseResult,
+    SkippedTestCaseResult,
+    TestCaseResult,
+    TestResult,
+)
+from .test_suite import TestSuite
+
+
+class ChangedTestsSelector:
+    """
+    Selects test cases affected by changes, using `TestDependencyGraph`.
+
+    With a git ref, test suites depending on files changed since the ref are selected.
+    Similarly, given changed files (e.g. by the watch mode), test suites depending on them are selected.
+    Otherwise, the selector compares dependencies with the ones recorded when test cases passed
+    last time and selects test suites whose dependencies changed, as well as test cases which
+    didn't pass (or weren't run) since then.
+    Test suites with dependencies which can't be found statically are always selected.
+    """
+
+    def __init__(
+        self,
+        dependency_graph: TestDependencyGraph,
+        records_path: Optional[Path],
+        project_root_path: Path,
+        changed_since: Optional[str] = None,
+        changed_files: Optional[Set[str]] = None,
+    ):
+        self._dependency_graph = dependency_graph
+        self._records_path = records_path
+        self._project_root_path = project_root_path
+        self._changed_since = changed_since
+        self._changed_files = changed_files
+        self._records = self._load_records()
+        self._test_suites_dependencies: Dict[str, TestSuiteDependencies] = {}
+
+    def select(
+        self, test_collector_result: TestCollector.Result
+    ) -> TestCollector.Result:
+        changed_files = self._changed_files
+        if self._changed_since is not None:
+            changed_files = self._get_files_changed_since(self._changed_since)
+        selected_test_suites: List[TestSuite] = []
+        for test_suite in test_collector_result.test_suites:
+            dependencies = self._dependency_graph.get_test_suite_dependencies(
+                test_suite.test_path,
+                test_collector_result.imported_modules.get(test_suite.test_path),
+            )
+            self._test_suites_dependencies[_to_key(test_suite.test_path)] = dependencies
+
+            if changed_files is not None:
+                if not dependencies.is_complete or (
+                    dependencies.file_paths & changed_files
+                ):
+                    selected_test_suites.append(test_suite)
+                continue
+
+            up_to_date_test_case_names = self._get_recorded_up_to_date_test_case_names(
+                _to_key(test_suite.test_path), dependencies
+            )
+            test_cases = [
+                test_case
+                for test_case in test_suite.test_cases
+                if test_case.test_fn_name not in up_to_date_test_case_names
+            ]
+            if test_cases:
+                selected_test_suites.append(
+                    dataclasses.replace(test_suite, test_cases=test_cases)
+                )
+
+        return TestCollector.Result(
+            test_suites=selected_test_suites,
+            broken_test_suites=test_collector_result.broken_test_suites,
+            duration=test_collector_result.duration,
+            imported_modules=test_collector_result.imported_modules,
+        )
+
+    def record(self, test_results: List[TestResult]) -> None:
+        """
+        Record test cases which passed (or were skipped) along with dependencies of their test suites.
+        """
+        test_suites_results: Dict[str, List[TestResult]] = {}
+        for test_result in test_results:
+            test_suites_results.setdefault(_to_key(test_result.file_path), []).append(
+                test_result
+            )
+
+        for test_suite_key, test_suite_results in test_suites_results.items():
+            dependencies = self._test_suites_dependencies.get(test_suite_key)
+            if dependencies is None or not dependencies.is_complete:
+                self._records.pop(test_suite_key, None)
+                continue
+
+            up_to_date_test_case_names = self._get_recorded_up_to_date_test_case_names(
+                test_suite_key, dependencies
+            )
+            for test_result in test_suite_results:
+                if isinstance(test_result, BrokenTestSuiteResult):
+                    up_to_date_test_case_names.difference_update(
+                        test_result.test_case_names
+                    )
+                elif isinstance(
+                    test_result, (PassedTestCaseResult, SkippedTestCaseResult)
+                ):
+                    up_to_date_test_case_names.add(test_result.test_case_name)
+                elif isinstance(test_result, TestCaseResult):
+                    up_to_date_test_case_names.discard(test_result.test_case_name)
+
+            self._records[test_suite_key] = {
+                "dependencies": dependencies.file_hashes,
+                "up_to_date_test_cases": sorted(up_to_date_test_case_names),
+            }
+        self._save_records()
+
+    def _get_recorded_up_to_date_test_case_names(
+        self, test_suite_key: str, dependencies: TestSuiteDependencies
+    ) -> Set[str]:
+        record = self._records.get(test_suite_key) or {}
+        if (
+            not dependencies.is_complete
+            or record.get("dependencies") != dependencies.file_hashes
+        ):
+            return set()
+        return set(record.get("up_to_date_test_cases", []))
+
+    def _get_files_changed_since(self, git_ref: str) -> Set[str]:
+        try:
+            repo = Repo(self._project_root_path, search_parent_directories=True)
+            changed_relative_paths = [
+                *repo.git.diff("--name-only", git_ref).splitlines(),
+                *repo.untracked_files,
+            ]
+        except InvalidGitRepositoryError as ex:
+            raise ProtostarException(
+                "A git repository is required to select tests changed since a git ref"
+            ) from ex
+        except GitCommandError as ex:
+            raise ProtostarException(
+                f"Couldn't find files changed since {git_ref}", str(ex.stderr).strip()
+            ) from ex
+        working_tree_dir = Path(str(repo.working_tree_dir))
+        return {
+            str((working_tree_dir / relative_path).resolve())
+            for relative_path in changed_relative_paths
+        }
+
+    def _load_records(self) -> Dict[str, Dict[str, Any]]:
+        if self._records_path is None:
+            return {}
+        try:
+            records = json.loads(self._records_path.read_text("utf-8"))["test_suites"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+        return records if isinstance(records, dict) else {}
+
+    def _save_records(self) -> None:
+        if self._records_path is None:
+            return
+        try:
+            self._records_path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(
+                dir=self._records_path.parent, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                    json.dump({"test_suites": self._records}, file)
+                os.replace(tmp_path, self._records_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+
+def _to_key(test_path: Path) -> str:
+    return str(test_path.resolve())
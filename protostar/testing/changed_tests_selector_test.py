@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+from git.repo import Repo
+
+from protostar.starknet import ReportedException
+
+from .changed_tests_selector import ChangedTestsSelector
+from .test_collector import TestCollector
+from .test_dependency_graph import TestDependencyGraph
+from .test_results import FailedTestCaseResult, PassedTestCaseResult, TestResult
+from .test_suite import TestCase, TestSuite
+
+
+@pytest.fixture(name="project_path")
+def project_path_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.cairo").write_text("const A = 1;\n")
+    (tmp_path / "src" / "b.cairo").write_text("const B = 1;\n")
+    (tmp_path / "tests").mkdir()
+    for name in ["a", "b"]:
+        (tmp_path / "tests" / f"test_{name}.cairo").write_text(
+            f"%lang starknet\nfrom src.{name} import {name.upper()}\n"
+        )
+    return tmp_path
+
+
+def create_test_collector_result(project_path: Path) -> TestCollector.Result:
+    test_suites = []
+    for name in ["a", "b"]:
+        test_path = project_path / "tests" / f"test_{name}.cairo"
+        test_suites.append(
+            TestSuite(
+                test_path=test_path,
+                test_cases=[
+                    TestCase(test_path=test_path, test_fn_name="test_passing"),
+                    TestCase(test_path=test_path, test_fn_name="test_failing"),
+                ],
+            )
+        )
+    return TestCollector.Result(test_suites=test_suites)
+
+
+def run_test_suites(test_collector_result: TestCollector.Result) -> List[TestResult]:
+    test_results: List[TestResult] = []
+    for test_suite in test_collector_result.test_suites:
+        for test_case in test_suite.test_cases:
+            if test_case.test_fn_name == "test_passing":
+                test_results.append(
+                    PassedTestCaseResult(
+                        file_path=test_suite.test_path,
+                        test_case_name=test_case.test_fn_name,
+                        captured_stdout={},
+                        execution_time=0.0,
+                        execution_resources=None,
+                    )
+                )
+            else:
+                test_results.append(
+                    FailedTestCaseResult(
+                        file_path=test_suite.test_path,
+                        test_case_name=test_case.test_fn_name,
+                        captured_stdout={},
+                        execution_time=0.0,
+                        exception=ReportedException(),
+                    )
+                )
+    return test_results
+
+
+def select_test_case_ids(
+    project_path: Path, changed_since: Optional[str] = None
+) -> List[str]:
+    selector = ChangedTestsSelector(
+        TestDependencyGraph(include_paths=[str(project_path)]),
+        records_path=project_path / ".protostar_cache" / "test_dependencies.json",
+        project_root_path=project_path,
+        changed_since=changed_since,
+    )
+    selected = selector.select(create_test_collector_result(project_path))
+    selector.record(run_test_suites(selected))
+    return [
+        f"{test_suite.test_path.name}::{test_case.test_fn_name}"
+        for test_suite in selected.test_suites
+        for test_case in test_suite.test_cases
+    ]
+
+
+def test_selecting_test_cases_changed_since_last_run(project_path: Path):
+    assert len(select_test_case_ids(project_path)) == 4
+
+    assert select_test_case_ids(project_path) == [
+        "test_a.cairo::test_failing",
+        "test_b.cairo::test_failing",
+    ]
+
+    (project_path / "src" / "a.cairo").write_text("const A = 2;\n")
+
+    assert select_test_case_ids(project_path) == [
+        "test_a.cairo::test_passing",
+        "test_a.cairo::test_failing",
+        "test_b.cairo::test_failing",
+    ]
+
+
+def test_selecting_test_suites_changed_since_git_ref(project_path: Path):
+    repo = Repo.init(project_path)
+    repo.index.add(["src/a.cairo", "src/b.cairo", "tests"])
+    repo.index.commit("Initial commit")
+
+    assert select_test_case_ids(project_path, changed_since="HEAD") == []
+
+    (project_path / "src" / "b.cairo").write_text("const B = 2;\n")
+
+    assert select_test_case_ids(project_path, changed_since="HEAD") == [
+        "test_b.cairo::test_passing",
+        "test_b.cairo::test_failing",
+    ]
@@ -1,10 +1,12 @@
 import asyncio
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Optional, Tuple
 
 from starkware.python.utils import from_bytes
 from starkware.starknet.business_logic.transaction.objects import InternalDeclare
 from starkware.starknet.public.abi import AbiType
+from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starknet.services.api.gateway.transaction import (
     DEFAULT_DECLARE_SENDER_ADDRESS,
 )
@@ -16,10 +18,35 @@ from protostar.migrator.cheatcodes.migrator_declare_cheatcode import (
     DeclaredContract,
 )
 from protostar.starknet import Cheatcode, KeywordOnlyArgumentCheatcodeException
+from protostar.utils.compiler.compilation_cache import (
+    ModuleFingerprint,
+    ModuleName,
+    are_modules_up_to_date,
+    fingerprint_modules,
+    hash_file,
+)
 from protostar.utils.starknet_compilation import StarknetCompiler
 
 
+@dataclass(frozen=True)
+class PreparedDeclaration:
+    contract_class: ContractClass
+    declare_tx: InternalDeclare
+    abi: AbiType
+    event_selector_to_name_map: Dict[int, str]
+    source_hash: str
+    dependencies: Dict[ModuleName, ModuleFingerprint]
+    """Modules imported (transitively) by the contract, see `fingerprint_modules`."""
+
+
 class DeclareCheatcode(Cheatcode):
+    _prepared_declarations: ClassVar[Dict[Tuple, PreparedDeclaration]] = {}
+    """
+    Contracts declared in this process, keyed by the contract path and the compiler config.
+    Declaring the same contract again only writes it to the state, unless the contract
+    or any module it imports was modified in the meantime (e.g. between runs of `--watch`).
+    """
+
     def __init__(
         self,
         syscall_dependencies: Cheatcode.SyscallDependencies,
@@ -28,6 +55,10 @@ class DeclareCheatcode(Cheatcode):
         super().__init__(syscall_dependencies)
         self._starknet_compiler = starknet_compiler
 
+    @classmethod
+    def forget_prepared_declarations(cls) -> None:
+        cls._prepared_declarations = {}
+
     @property
     def name(self) -> str:
         return "declare"
@@ -60,40 +91,88 @@ class DeclareCheatcode(Cheatcode):
         return DeclaredContract(class_hash)
 
     async def _declare_contract(self, contract_path: Path):
-        contract_class = self._starknet_compiler.compile_contract(contract_path)
-
-        tx = InternalDeclare.create(
-            contract_class=contract_class,
-            chain_id=self.general_config.chain_id.value,
-            sender_address=DEFAULT_DECLARE_SENDER_ADDRESS,
-            max_fee=0,
-            version=0,
-            signature=[],
-            nonce=0,
-        )
+        prepared_declaration = self._get_or_prepare_declaration(contract_path)
+        tx = prepared_declaration.declare_tx
 
         with self.cheatable_state.copy_and_apply() as state_copy:
             await tx.apply_state_updates(
                 state=state_copy, general_config=self.general_config
             )
 
-        abi = get_abi(contract_class=contract_class)
-        self._add_event_abi_to_state(abi)
+        self._add_event_abi_to_state(prepared_declaration)
         class_hash = tx.class_hash
         assert class_hash is not None
-        await self.cheatable_state.set_contract_class(class_hash, contract_class)
+        await self.cheatable_state.set_contract_class(
+            class_hash, prepared_declaration.contract_class
+        )
 
         return DeclaredClass(
             class_hash=from_bytes(class_hash),
-            abi=get_abi(contract_class=contract_class),
+            abi=prepared_declaration.abi,
+        )
+
+    def _get_or_prepare_declaration(self, contract_path: Path) -> PreparedDeclaration:
+        if not contract_path.is_file():
+            # Let the compiler report the missing file.
+            return self._prepare_declaration(contract_path)
+
+        cache_key = (
+            str(contract_path.resolve()),
+            self._starknet_compiler.config_key,
+            self.general_config.chain_id.value,
+        )
+        prepared_declaration = DeclareCheatcode._prepared_declarations.get(cache_key)
+        if prepared_declaration is None or not self._is_up_to_date(
+            prepared_declaration, contract_path
+        ):
+            prepared_declaration = self._prepare_declaration(contract_path)
+            DeclareCheatcode._prepared_declarations[cache_key] = prepared_declaration
+        return prepared_declaration
+
+    def _is_up_to_date(
+        self, prepared_declaration: PreparedDeclaration, contract_path: Path
+    ) -> bool:
+        return hash_file(
+            str(contract_path)
+        ) == prepared_declaration.source_hash and are_modules_up_to_date(
+            prepared_declaration.dependencies, self._starknet_compiler.include_paths
         )
 
-    def _add_event_abi_to_state(self, abi: AbiType):
+    def _prepare_declaration(self, contract_path: Path) -> PreparedDeclaration:
+        (
+            contract_class,
+            module_names,
+        ) = self._starknet_compiler.compile_contract_with_dependencies(contract_path)
+
+        tx = InternalDeclare.create(
+            contract_class=contract_class,
+            chain_id=self.general_config.chain_id.value,
+            sender_address=DEFAULT_DECLARE_SENDER_ADDRESS,
+            max_fee=0,
+            version=0,
+            signature=[],
+            nonce=0,
+        )
+
+        abi = get_abi(contract_class=contract_class)
         event_manager = EventManager(abi=abi)
-        self.cheatable_state.update_event_selector_to_name_map(
+        return PreparedDeclaration(
+            contract_class=contract_class,
+            declare_tx=tx,
+            abi=abi,
             # pylint: disable=protected-access
-            event_manager._selector_to_name
+            event_selector_to_name_map=event_manager._selector_to_name,
+            source_hash=hash_file(str(contract_path)),
+            dependencies=fingerprint_modules(
+                module_names, self._starknet_compiler.include_paths
+            ),
+        )
+
+    def _add_event_abi_to_state(self, prepared_declaration: PreparedDeclaration):
+        self.cheatable_state.update_event_selector_to_name_map(
+            prepared_declaration.event_selector_to_name_map
         )
-        # pylint: disable=protected-access
-        for event_name in event_manager._selector_to_name.values():
-            self.cheatable_state.event_name_to_contract_abi_map[event_name] = abi
+        for event_name in prepared_declaration.event_selector_to_name_map.values():
+            self.cheatable_state.event_name_to_contract_abi_map[
+                event_name
+            ] = prepared_declaration.abi
@@ -31,15 +31,12 @@ class MockCallCheatcode(Cheatcode):
                 contract_address, fn_name, ret_data
             )
 
-        if contract_address not in self.cheatable_state.mocked_calls_map:
-            self.cheatable_state.mocked_calls_map[contract_address] = {}
-
-        if selector in self.cheatable_state.mocked_calls_map[contract_address]:
+        if selector in self.cheatable_state.mocked_calls_map.get(contract_address, {}):
             raise CheatcodeException(
                 self,
                 f"'{fn_name}' in the contract with address {contract_address} has been already mocked",
             )
-        self.cheatable_state.mocked_calls_map[contract_address][selector] = ret_data
+        self.cheatable_state.set_mocked_call(contract_address, selector, ret_data)
 
         def clear_mock():
             if contract_address not in self.cheatable_state.mocked_calls_map:
@@ -52,7 +49,7 @@ class MockCallCheatcode(Cheatcode):
                     self,
                     f"Couldn't find mocked selector {selector} for an address {contract_address}.",
                 )
-            del self.cheatable_state.mocked_calls_map[contract_address][selector]
+            self.cheatable_state.remove_mocked_call(contract_address, selector)
 
         return clear_mock
 
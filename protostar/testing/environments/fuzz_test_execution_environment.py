@@ -1,7 +1,10 @@
+import asyncio
 import dataclasses
+import functools
+import time
 from asyncio import to_thread
-from dataclasses import dataclass
-from typing import Any, Dict, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
 
 from hypothesis import given, seed, settings
 from hypothesis.database import ExampleDatabase, InMemoryExampleDatabase
@@ -17,6 +20,7 @@ from protostar.testing.fuzzing.exceptions import HypothesisRejectException
 from protostar.testing.fuzzing.fuzz_input_exception_metadata import (
     FuzzInputExceptionMetadata,
 )
+from protostar.testing.fuzzing.forked_processes import run_in_forked_processes
 from protostar.testing.fuzzing.hypothesis.aio import wrap_in_sync
 from protostar.testing.fuzzing.hypothesis.reporter import (
     HYPOTHESIS_VERBOSITY,
@@ -26,8 +30,10 @@ from protostar.testing.fuzzing.hypothesis.runs_counter import RunsCounter
 from protostar.testing.fuzzing.strategy_collector import collect_search_strategies
 from protostar.testing.starkware.execution_resources_summary import (
     ExecutionResourcesSummary,
+    ExecutionResourcesSummaryAccumulator,
 )
 from protostar.testing.starkware.test_execution_state import TestExecutionState
+from protostar.testing.testing_seed import Seed, derive_seed
 from protostar.utils.abi import get_function_parameters
 
 from .test_execution_environment import (
@@ -40,12 +46,40 @@ from .test_execution_environment import (
 @dataclass
 class FuzzTestExecutionResult(TestExecutionResult):
     fuzz_runs_count: int
+    fuzz_examples_per_second: float
+
+
+@dataclass
+class FuzzTestShard:
+    """
+    A part of fuzz test examples budget run with its own seed, possibly in a separate process.
+    """
+
+    seed: Seed
+    max_examples: int
+
+
+@dataclass
+class FuzzTestShardResult:
+    runs_count: int
+    execution_resources: Optional[ExecutionResourcesSummary]
+    failure: Optional[ReportedException] = None
+    failure_inputs: Optional[Dict[str, Any]] = None
+    runs_captures: Dict[int, str] = field(default_factory=dict)
+    """
+    Outputs of runs made in a forked process, keyed by run number within the shard.
+    """
 
 
 class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
-    def __init__(self, state: TestExecutionState):
+    def __init__(
+        self,
+        state: TestExecutionState,
+        example_database: Optional[ExampleDatabase] = None,
+    ):
         super().__init__(state)
         self.initial_state = state
+        self._example_database = example_database
 
     async def execute(self, function_name: str) -> FuzzTestExecutionResult:
         abi = self.state.contract.abi
@@ -54,44 +88,149 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
             parameters
         ), f"{self.__class__.__name__} expects at least one function parameter."
 
-        execution_resources: List[ExecutionResourcesSummary] = []
-
-        database = InMemoryExampleDatabase()
-        runs_counter = RunsCounter(budget=self.state.config.fuzz_max_examples)
-
         given_strategies = collect_search_strategies(
             declared_strategies=self.state.config.fuzz_declared_strategies,
             parameters=parameters,
         )
+        shards = self._split_into_shards()
+
+        start_time = time.perf_counter()
+        with self.state.output_recorder.redirect("test"):
+            if len(shards) == 1:
+                shard_results: List[Union[FuzzTestShardResult, BaseException]] = [
+                    await to_thread(
+                        self._run_shard, function_name, given_strategies, shards[0]
+                    )
+                ]
+            else:
+                # Processes are forked from the main thread, blocking the event loop until they finish.
+                shard_results = run_in_forked_processes(
+                    [
+                        functools.partial(
+                            self._run_shard_in_forked_process,
+                            function_name,
+                            given_strategies,
+                            shard,
+                        )
+                        for shard in shards
+                    ],
+                )
+        elapsed_time = time.perf_counter() - start_time
+
+        return self._merge_shard_results(shard_results, elapsed_time)
+
+    def _split_into_shards(self) -> List["FuzzTestShard"]:
+        """
+        Split the examples budget between fuzzing processes. Each process uses a seed derived
+        from the testing seed, so inputs (and reported failures) are reproducible with ``--seed``
+        as long as the number of processes is the same.
+        """
+        max_examples = self.state.config.fuzz_max_examples
+        processes_count = max(
+            1, min(self.state.config.fuzz_processes_count, max_examples)
+        )
+        if processes_count == 1:
+            return [
+                FuzzTestShard(seed=self.state.config.seed, max_examples=max_examples)
+            ]
+
+        quotient, remainder = divmod(max_examples, processes_count)
+        return [
+            FuzzTestShard(
+                seed=derive_seed(self.state.config.seed, index),
+                max_examples=quotient + (1 if index < remainder else 0),
+            )
+            for index in range(processes_count)
+        ]
+
+    def _run_shard(
+        self,
+        function_name: str,
+        given_strategies: Dict[str, SearchStrategy],
+        shard: "FuzzTestShard",
+    ) -> "FuzzTestShardResult":
+        execution_resources = ExecutionResourcesSummaryAccumulator()
+        runs_counter = RunsCounter(budget=shard.max_examples)
 
         # NOTE: Hypothesis' ``reporter`` global is a thread local variable.
         #   Because we are running Hypothesis from separate thread, and the test itself is
         #   running in a separate thread executor, we must set the ``reporter`` each first time
         #   we invoke Hypothesis code in new thread.
-
-        def test_thread():
+        try:
             with with_reporter(protostar_reporter):
                 self.build_and_run_test(
                     function_name=function_name,
-                    database=database,
+                    database=self._example_database or InMemoryExampleDatabase(),
                     execution_resources=execution_resources,
                     runs_counter=runs_counter,
                     given_strategies=given_strategies,
+                    testing_seed=shard.seed,
                 )
-
-        try:
-            with self.state.output_recorder.redirect("test"):
-                await to_thread(test_thread)
         except HypothesisFailureSmugglingError as escape_err:
-            escape_err.error.execution_info["fuzz_runs"] = runs_counter.count
-            escape_err.error.metadata.append(
-                FuzzInputExceptionMetadata(escape_err.inputs)
+            return FuzzTestShardResult(
+                runs_count=runs_counter.count,
+                execution_resources=execution_resources.build(),
+                failure=escape_err.error,
+                failure_inputs=escape_err.inputs,
             )
-            raise escape_err.error
+
+        return FuzzTestShardResult(
+            runs_count=runs_counter.count,
+            execution_resources=execution_resources.build(),
+        )
+
+    def _run_shard_in_forked_process(
+        self,
+        function_name: str,
+        given_strategies: Dict[str, SearchStrategy],
+        shard: "FuzzTestShard",
+    ) -> "FuzzTestShardResult":
+        shard_result = self._run_shard(function_name, given_strategies, shard)
+        shard_result.runs_captures = {
+            name[1]: value
+            for name, value in self.state.output_recorder.get_captures().items()
+            if isinstance(name, tuple) and name[0] == "test"
+        }
+        return shard_result
+
+    def _merge_shard_results(
+        self,
+        shard_results: List[Union["FuzzTestShardResult", BaseException]],
+        elapsed_time: float,
+    ) -> FuzzTestExecutionResult:
+        runs_count = 0
+        for shard_result in shard_results:
+            if isinstance(shard_result, BaseException):
+                continue
+            # Outputs of runs are numbered consecutively, in the order of processes.
+            for run_no, value in sorted(shard_result.runs_captures.items()):
+                self.state.output_recorder.record(("test", runs_count + run_no)).write(
+                    value
+                )
+            runs_count += shard_result.runs_count
+
+        # Report the failure of the first process, so it doesn't depend on processes timing.
+        for shard_result in shard_results:
+            if isinstance(shard_result, BaseException):
+                raise shard_result
+            if shard_result.failure is not None:
+                shard_result.failure.execution_info["fuzz_runs"] = runs_count
+                shard_result.failure.metadata.append(
+                    FuzzInputExceptionMetadata(shard_result.failure_inputs or {})
+                )
+                raise shard_result.failure
 
         return FuzzTestExecutionResult(
-            execution_resources=ExecutionResourcesSummary.sum(execution_resources),
-            fuzz_runs_count=runs_counter.count,
+            execution_resources=ExecutionResourcesSummary.sum(
+                shard_result.execution_resources
+                for shard_result in shard_results
+                if isinstance(shard_result, FuzzTestShardResult)
+                and shard_result.execution_resources is not None
+            ),
+            fuzz_runs_count=runs_count,
+            fuzz_examples_per_second=runs_count / elapsed_time
+            if elapsed_time > 0
+            else 0.0,
         )
 
     def fork_state_for_test(self):
@@ -122,13 +261,16 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
         self,
         function_name: str,
         database: ExampleDatabase,
-        execution_resources: List[ExecutionResourcesSummary],
+        execution_resources: ExecutionResourcesSummaryAccumulator,
         runs_counter: RunsCounter,
         given_strategies: Dict[str, SearchStrategy],
+        testing_seed: Seed,
     ):
+        loop = asyncio.new_event_loop()
         try:
 
-            @seed(self.state.config.seed)
+            # NOTE: ``@seed`` disables the example database in settings it was applied to,
+            #   so ``@settings`` must be applied after it to keep replaying saved examples.
             @settings(
                 database=database,
                 deadline=None,
@@ -137,6 +279,7 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
                 report_multiple_bugs=False,
                 verbosity=HYPOTHESIS_VERBOSITY,
             )
+            @seed(testing_seed)
             @given(**given_strategies)
             async def test(**inputs: Any):
                 self.fork_state_for_test()
@@ -150,7 +293,7 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
                                 function_name, **inputs
                             )
                             if this_run_resources is not None:
-                                execution_resources.append(this_run_resources)
+                                execution_resources.add(this_run_resources)
                         except HypothesisRejectException as reject_ex:
                             raise reject_ex.unsatisfied_assumption_exc
                         except ReportedException as reported_ex:
@@ -159,7 +302,7 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
                                 inputs=inputs,
                             ) from reported_ex
 
-            test.hypothesis.inner_test = wrap_in_sync(test.hypothesis.inner_test)  # type: ignore
+            test.hypothesis.inner_test = wrap_in_sync(test.hypothesis.inner_test, loop)  # type: ignore
 
             # NOTE: The ``test`` function does not expect any arguments at this point,
             #   because the @given decorator provides all of them behind the scenes.
@@ -168,6 +311,8 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
             # This exception is sometimes raised by Hypothesis during runtime when user messes up
             # strategy arguments. For example, invalid range for `integers` strategy is caught here.
             raise CheatcodeException("given", str(ex)) from ex
+        finally:
+            loop.close()
 
 
 @dataclass
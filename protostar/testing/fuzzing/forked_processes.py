@@ -0,0 +1,84 @@
+import os
+import threading
+import traceback
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from typing import Callable, List, Sequence, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class ForkedProcessError(Exception):
+    """
+    Raised in the parent process in place of an exception, which was raised in a forked process
+    but could not be sent back.
+    """
+
+
+def run_in_forked_processes(
+    tasks: Sequence[Callable[[], T]]
+) -> List[Union[T, BaseException]]:
+    """
+    Run each task in a separate process forked from the current one and return task results
+    (or exceptions raised by tasks) in the order of tasks.
+
+    Processes are forked instead of spawned with ``multiprocessing``, because tests are run
+    in daemonic pool workers, which are not allowed to have children. Forked processes inherit
+    the whole state of the parent (compiled contracts, prepared test suite state), so they start
+    immediately. Task results are sent back to the parent through pipes, hence they must be picklable.
+
+    Only the forking thread exists in a forked process, so locks held by other threads at the moment
+    of forking would never be released. Processes are therefore forked only from the main thread,
+    while it runs no other work, and tasks run in a new thread of the forked process, which allows them
+    to run their own event loop even if the parent forked from a running one.
+    """
+    assert (
+        threading.current_thread() is threading.main_thread()
+    ), "Processes can be forked only from the main thread."
+    processes: List[Tuple[int, Connection]] = []
+    try:
+        for task in tasks:
+            reader, writer = Pipe(duplex=False)
+            pid = os.fork()
+            if pid == 0:
+                reader.close()
+                _run_forked_task(task, writer)
+            writer.close()
+            processes.append((pid, reader))
+
+        return [_receive_task_result(reader) for _, reader in processes]
+    finally:
+        for pid, reader in processes:
+            reader.close()
+            os.waitpid(pid, 0)
+
+
+def _run_forked_task(task: Callable[[], T], writer: Connection):
+    try:
+        results: List[Union[T, BaseException]] = []
+        thread = threading.Thread(target=lambda: results.append(_call_task(task)))
+        thread.start()
+        thread.join()
+        result = results[0]
+
+        try:
+            writer.send(result)
+        except BaseException:  # pylint: disable=broad-except
+            writer.send(ForkedProcessError(traceback.format_exc()))
+    finally:
+        # Skip cleanup of the state inherited from the parent (e.g. ``atexit`` handlers).
+        os._exit(0)  # pylint: disable=protected-access
+
+
+def _call_task(task: Callable[[], T]) -> Union[T, BaseException]:
+    try:
+        return task()
+    except BaseException as ex:  # pylint: disable=broad-except
+        return ex
+
+
+def _receive_task_result(reader: Connection) -> Union[T, BaseException]:
+    try:
+        return reader.recv()
+    except EOFError:
+        return ForkedProcessError("Forked process exited without sending a result.")
@@ -0,0 +1,52 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from .forked_processes import ForkedProcessError, run_in_forked_processes
+
+
+def test_results_are_returned_in_order_of_tasks():
+    parent_pid = os.getpid()
+
+    results = run_in_forked_processes(
+        [lambda: (1, os.getpid()), lambda: (2, os.getpid())]
+    )
+
+    assert [value for value, _ in results] == [1, 2]
+    assert all(pid != parent_pid for _, pid in results)
+
+
+def test_exceptions_are_returned_instead_of_results():
+    def fail():
+        raise ValueError("failure")
+
+    [result] = run_in_forked_processes([fail])
+
+    assert isinstance(result, ValueError)
+    assert str(result) == "failure"
+
+
+def test_unpicklable_result_is_reported():
+    [result] = run_in_forked_processes([lambda: lambda: None])
+
+    assert isinstance(result, ForkedProcessError)
+
+
+def test_running_event_loop_in_task_forked_from_running_event_loop():
+    async def get_value() -> int:
+        return 42
+
+    async def run_forked_tasks():
+        return run_in_forked_processes([lambda: asyncio.run(get_value())])
+
+    assert asyncio.run(run_forked_tasks()) == [42]
+
+
+def test_forking_from_other_thread_is_not_allowed():
+    with ThreadPoolExecutor() as executor:
+        future = executor.submit(run_in_forked_processes, [lambda: None])
+
+    with pytest.raises(AssertionError):
+        future.result()
@@ -1,15 +1,16 @@
 import asyncio
 import functools
 import inspect
-from typing import Callable, Awaitable, Any
+from typing import Any, Awaitable, Callable
 
 
-def wrap_in_sync(func: Callable[..., Awaitable[Any]]):
+def wrap_in_sync(func: Callable[..., Awaitable[Any]], loop: asyncio.AbstractEventLoop):
     """
-    Return a sync wrapper around an async function executing it in separate event loop.
+    Return a sync wrapper around an async function executing it in the given event loop.
 
     Separate event loop is used, because Hypothesis engine is running in current executor
-    and is effectively blocking it.
+    and is effectively blocking it. The loop is reused by every call, so running thousands
+    of examples doesn't create thousands of loops.
 
     Partially borrowed from pytest-asyncio.
     """
@@ -19,7 +20,6 @@ def wrap_in_sync(func: Callable[..., Awaitable[Any]]):
         coro = func(*args, **kwargs)
         assert inspect.isawaitable(coro)
 
-        loop = asyncio.new_event_loop()
         task = asyncio.ensure_future(coro, loop=loop)
         try:
             loop.run_until_complete(task)
@@ -0,0 +1,32 @@
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from hypothesis.database import (
+    DirectoryBasedExampleDatabase,
+    ExampleDatabase,
+    InMemoryExampleDatabase,
+)
+
+from protostar.testing.test_suite import TestCase
+
+
+def build_example_database(
+    databases_root_path: Optional[Path], test_case: TestCase
+) -> ExampleDatabase:
+    """
+    Build Hypothesis example database of the fuzz test case.
+
+    All fuzz tests are run by the same Hypothesis test function, so each test case gets its own
+    directory (keyed by the test suite path and the test case name) instead of relying on
+    Hypothesis' database keys. Hypothesis replays examples saved in the database before generating
+    new ones, so failures found in previous runs are checked first, before shrinking starts again.
+
+    Without ``databases_root_path``, examples are kept in memory only for the current run.
+    """
+    if databases_root_path is None:
+        return InMemoryExampleDatabase()
+
+    test_case_id = f"{test_case.test_path.resolve()}::{test_case.test_fn_name}"
+    directory_name = hashlib.sha256(test_case_id.encode()).hexdigest()[:32]
+    return DirectoryBasedExampleDatabase(str(databases_root_path / directory_name))
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from hypothesis.database import DirectoryBasedExampleDatabase, InMemoryExampleDatabase
+
+from protostar.testing.test_suite import TestCase
+
+from .example_database import build_example_database
+
+
+def test_keeping_examples_in_memory_without_databases_path():
+    database = build_example_database(None, TestCase(Path("test.cairo"), "test_a"))
+
+    assert isinstance(database, InMemoryExampleDatabase)
+
+
+def test_each_test_case_has_own_database(tmp_path: Path):
+    def get_database_path(test_path: str, test_fn_name: str) -> str:
+        database = build_example_database(
+            tmp_path, TestCase(Path(test_path), test_fn_name)
+        )
+        assert isinstance(database, DirectoryBasedExampleDatabase)
+        return database.path
+
+    assert get_database_path("test.cairo", "test_a") == get_database_path(
+        "test.cairo", "test_a"
+    )
+    assert get_database_path("test.cairo", "test_a") != get_database_path(
+        "test.cairo", "test_b"
+    )
+    assert get_database_path("test.cairo", "test_a") != get_database_path(
+        "other_test.cairo", "test_a"
+    )
@@ -0,0 +1,207 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from protostar.protostar_exception import ProtostarException
+from protostar.starknet import ReportedException
+
+from .test_collector import TestCollector
+from .test_results import (
+    BrokenTestCaseResult,
+    BrokenTestSuiteResult,
+    CachedPassedTestCaseResult,
+    FailedTestCaseResult,
+    PassedTestCaseResult,
+    SkippedTestCaseResult,
+    TestResult,
+)
+from .test_shard import TestShard
+from .testing_seed import Seed
+from .testing_summary import TestingSummary
+
+
+class ShardReportedException(ReportedException):
+    """
+    An exception reported by another `protostar test` run, of which only the message is preserved.
+    """
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+
+@dataclass
+class ShardSummary:
+    """
+    Results of a (sharded) `protostar test` run, which can be saved to a file
+    and merged with summaries of other shards.
+    """
+
+    shard: Optional[TestShard]
+    testing_seed: Seed
+    collected_test_cases_count: int
+    collected_test_suites_count: int
+    test_results: List[TestResult]
+
+    @classmethod
+    def from_testing_summary(
+        cls,
+        testing_summary: TestingSummary,
+        test_collector_result: TestCollector.Result,
+        shard: Optional[TestShard] = None,
+    ) -> "ShardSummary":
+        return cls(
+            shard=shard,
+            testing_seed=testing_summary.testing_seed,
+            collected_test_cases_count=test_collector_result.test_cases_count,
+            collected_test_suites_count=len(test_collector_result.test_suites),
+            test_results=testing_summary.case_results,
+        )
+
+    @classmethod
+    def merge(cls, summaries: List["ShardSummary"]) -> "ShardSummary":
+        if not summaries:
+            raise ProtostarException("No test summaries to merge")
+        cls._validate_shards(summaries)
+        return cls(
+            shard=None,
+            testing_seed=summaries[0].testing_seed,
+            collected_test_cases_count=sum(
+                summary.collected_test_cases_count for summary in summaries
+            ),
+            collected_test_suites_count=sum(
+                summary.collected_test_suites_count for summary in summaries
+            ),
+            test_results=[
+                test_result
+                for summary in summaries
+                for test_result in summary.test_results
+            ],
+        )
+
+    def save(self, file_path: Path) -> None:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(
+            json.dumps(
+                {
+                    "shard": str(self.shard) if self.shard else None,
+                    "testing_seed": self.testing_seed,
+                    "collected_test_cases_count": self.collected_test_cases_count,
+                    "collected_test_suites_count": self.collected_test_suites_count,
+                    "test_results": [
+                        _serialize_test_result(test_result)
+                        for test_result in self.test_results
+                    ],
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def load(cls, file_path: Path) -> "ShardSummary":
+        try:
+            content = json.loads(file_path.read_text("utf-8"))
+            return cls(
+                shard=TestShard.parse(content["shard"]) if content["shard"] else None,
+                testing_seed=content["testing_seed"],
+                collected_test_cases_count=content["collected_test_cases_count"],
+                collected_test_suites_count=content["collected_test_suites_count"],
+                test_results=[
+                    _deserialize_test_result(serialized_test_result)
+                    for serialized_test_result in content["test_results"]
+                ],
+            )
+        except (OSError, ValueError, KeyError, TypeError) as ex:
+            raise ProtostarException(
+                f"Couldn't load test summary from {file_path}", str(ex)
+            ) from ex
+
+    @staticmethod
+    def _validate_shards(summaries: List["ShardSummary"]) -> None:
+        shards = [summary.shard for summary in summaries if summary.shard]
+        if not shards:
+            return
+        if len(shards) != len(summaries) or len({shard.total for shard in shards}) > 1:
+            raise ProtostarException(
+                "Test summaries don't come from shards of the same run"
+            )
+        if len(set(shards)) != len(shards):
+            raise ProtostarException("Test summaries contain duplicated shards")
+        missing_shards = [
+            str(TestShard(index=index, total=shards[0].total))
+            for index in range(1, shards[0].total + 1)
+            if TestShard(index=index, total=shards[0].total) not in shards
+        ]
+        if missing_shards:
+            raise ProtostarException(
+                f"Missing test summaries of shards: {', '.join(missing_shards)}"
+            )
+
+
+def _serialize_test_result(test_result: TestResult) -> Dict[str, Any]:
+    serialized_test_result: Dict[str, Any] = {"file_path": str(test_result.file_path)}
+    if isinstance(test_result, BrokenTestSuiteResult):
+        serialized_test_result.update(
+            type="broken_test_suite",
+            test_case_names=test_result.test_case_names,
+            message=str(test_result.exception),
+        )
+        return serialized_test_result
+    if isinstance(test_result, CachedPassedTestCaseResult):
+        serialized_test_result.update(type="cached_passed")
+    elif isinstance(test_result, PassedTestCaseResult):
+        serialized_test_result.update(type="passed")
+    elif isinstance(test_result, FailedTestCaseResult):
+        serialized_test_result.update(type="failed", message=str(test_result.exception))
+    elif isinstance(test_result, BrokenTestCaseResult):
+        serialized_test_result.update(type="broken", message=str(test_result.exception))
+    elif isinstance(test_result, SkippedTestCaseResult):
+        serialized_test_result.update(type="skipped", reason=test_result.reason)
+    else:
+        raise NotImplementedError(f"Unsupported test result: {type(test_result)}")
+    serialized_test_result.update(
+        test_case_name=test_result.test_case_name,
+        execution_time=test_result.execution_time,
+    )
+    return serialized_test_result
+
+
+def _deserialize_test_result(serialized_test_result: Dict[str, Any]) -> TestResult:
+    result_type = serialized_test_result["type"]
+    file_path = Path(serialized_test_result["file_path"])
+    if result_type == "broken_test_suite":
+        return BrokenTestSuiteResult(
+            file_path=file_path,
+            test_case_names=serialized_test_result["test_case_names"],
+            exception=ShardReportedException(serialized_test_result["message"]),
+        )
+    common_fields: Dict[str, Any] = {
+        "file_path": file_path,
+        "test_case_name": serialized_test_result["test_case_name"],
+        "execution_time": serialized_test_result["execution_time"],
+        "captured_stdout": {},
+    }
+    if result_type == "cached_passed":
+        return CachedPassedTestCaseResult(**common_fields, execution_resources=None)
+    if result_type == "passed":
+        return PassedTestCaseResult(**common_fields, execution_resources=None)
+    if result_type == "failed":
+        return FailedTestCaseResult(
+            **common_fields,
+            exception=ShardReportedException(serialized_test_result["message"]),
+        )
+    if result_type == "broken":
+        return BrokenTestCaseResult(
+            **common_fields,
+            exception=ShardReportedException(serialized_test_result["message"]),
+        )
+    if result_type == "skipped":
+        return SkippedTestCaseResult(
+            **common_fields, reason=serialized_test_result["reason"]
+        )
+    raise ValueError(f"Unknown test result type: {result_type}")
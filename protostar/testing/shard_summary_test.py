@@ -0,0 +1,112 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from protostar.protostar_exception import ProtostarException
+
+from .shard_summary import ShardReportedException, ShardSummary
+from .test_results import (
+    BrokenTestSuiteResult,
+    CachedPassedTestCaseResult,
+    FailedTestCaseResult,
+    PassedTestCaseResult,
+    SkippedTestCaseResult,
+)
+from .test_shard import TestShard
+
+
+def create_summary(shard: Optional[TestShard]) -> ShardSummary:
+    test_path = Path("test_foo.cairo")
+    return ShardSummary(
+        shard=shard,
+        testing_seed=42,
+        collected_test_cases_count=4,
+        collected_test_suites_count=2,
+        test_results=[
+            PassedTestCaseResult(
+                file_path=test_path,
+                test_case_name="test_passed",
+                captured_stdout={},
+                execution_time=1.0,
+                execution_resources=None,
+            ),
+            FailedTestCaseResult(
+                file_path=test_path,
+                test_case_name="test_failed",
+                captured_stdout={},
+                execution_time=2.0,
+                exception=ShardReportedException("assertion failed"),
+            ),
+            SkippedTestCaseResult(
+                file_path=test_path,
+                test_case_name="test_skipped",
+                captured_stdout={},
+                execution_time=0.0,
+                reason="not ready",
+            ),
+            CachedPassedTestCaseResult(
+                file_path=test_path,
+                test_case_name="test_cached",
+                captured_stdout={},
+                execution_time=0.0,
+                execution_resources=None,
+            ),
+            BrokenTestSuiteResult(
+                file_path=Path("test_broken.cairo"),
+                test_case_names=["test_a"],
+                exception=ShardReportedException("syntax error"),
+            ),
+        ],
+    )
+
+
+def test_saving_and_loading(tmp_path: Path):
+    summary = create_summary(TestShard(1, 2))
+    summary_path = tmp_path / "summary.json"
+
+    summary.save(summary_path)
+    loaded_summary = ShardSummary.load(summary_path)
+
+    assert loaded_summary.shard == TestShard(1, 2)
+    assert loaded_summary.testing_seed == 42
+    assert loaded_summary.collected_test_cases_count == 4
+    assert [type(result) for result in loaded_summary.test_results] == [
+        type(result) for result in summary.test_results
+    ]
+    failed_result = loaded_summary.test_results[1]
+    assert isinstance(failed_result, FailedTestCaseResult)
+    assert failed_result.execution_time == 2.0
+    assert str(failed_result.exception) == "assertion failed"
+
+
+def test_loading_malformed_summary(tmp_path: Path):
+    summary_path = tmp_path / "summary.json"
+    summary_path.write_text("{}", encoding="utf-8")
+
+    with pytest.raises(ProtostarException):
+        ShardSummary.load(summary_path)
+
+
+def test_merging():
+    merged_summary = ShardSummary.merge(
+        [create_summary(TestShard(1, 2)), create_summary(TestShard(2, 2))]
+    )
+
+    assert merged_summary.collected_test_cases_count == 8
+    assert merged_summary.collected_test_suites_count == 4
+    assert len(merged_summary.test_results) == 10
+
+
+@pytest.mark.parametrize(
+    "shards",
+    [
+        [TestShard(1, 3), TestShard(2, 3)],
+        [TestShard(1, 2), TestShard(1, 2)],
+        [TestShard(1, 2), TestShard(2, 3)],
+        [TestShard(1, 2), None],
+    ],
+)
+def test_merging_summaries_of_incomplete_or_mismatched_shards(shards):
+    with pytest.raises(ProtostarException):
+        ShardSummary.merge([create_summary(shard) for shard in shards])
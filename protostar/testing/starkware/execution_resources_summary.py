@@ -1,9 +1,8 @@
 import dataclasses
-import statistics
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Iterable, Optional
+from typing import Dict, Iterable, Optional
 from typing_extensions import Self
 
 from starkware.cairo.lang.vm.cairo_pie import ExecutionResources
@@ -19,9 +18,10 @@ class Statistic(ABC):
         ...
 
     def add_observation(self, other: "Statistic") -> "CountSeriesStatistic":
-        self_series = CountSeriesStatistic.from_statistic(self)
-        other_series = CountSeriesStatistic.from_statistic(other)
-        return CountSeriesStatistic(self_series.series + other_series.series)
+        result = CountSeriesStatistic()
+        result.add_statistic(self)
+        result.add_statistic(other)
+        return result
 
 
 @dataclass
@@ -35,25 +35,116 @@ class CountStatistic(Statistic):
         return bool(self.value)
 
 
-@dataclass
 class CountSeriesStatistic(Statistic):
-    series: List[int] = field(default_factory=list)
+    """
+    Summary of a series of counts, which takes constant time to update and constant memory
+    regardless of the series length (e.g. the number of fuzz runs).
+
+    Mean, min and max are exact. Counts are kept in a histogram with values rounded
+    to ``HISTOGRAM_PRECISION_BITS`` significant bits, so the median of large counts is approximate
+    (relative error below 0.4%), while the median of small counts is exact.
+    """
+
+    HISTOGRAM_PRECISION_BITS = 8
+
+    def __init__(self, series: Iterable[int] = ()):
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        self.histogram: Dict[int, int] = {}
+        for value in series:
+            self.add(value)
+
+    def add(self, value: int, occurrences: int = 1):
+        self.count += occurrences
+        self.total += value * occurrences
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        bucket = self._to_histogram_bucket(value)
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + occurrences
+
+    def add_statistic(self, statistic: Statistic):
+        """
+        Add observations of the other statistic to this one in place.
+        """
+        if isinstance(statistic, CountStatistic):
+            if statistic.value != 0:
+                self.add(statistic.value)
+            return
+
+        if isinstance(statistic, CountSeriesStatistic):
+            if not statistic.count:
+                return
+            assert statistic.min is not None and statistic.max is not None
+            self.count += statistic.count
+            self.total += statistic.total
+            self.min = (
+                statistic.min if self.min is None else min(self.min, statistic.min)
+            )
+            self.max = (
+                statistic.max if self.max is None else max(self.max, statistic.max)
+            )
+            for bucket, occurrences in statistic.histogram.items():
+                self.histogram[bucket] = self.histogram.get(bucket, 0) + occurrences
+            return
+
+        raise TypeError("Unknown statistic type.")
+
+    @property
+    def median(self) -> float:
+        assert self.count, "Median of an empty series is undefined."
+        middle = self._nth_smallest((self.count - 1) // 2)
+        if self.count % 2:
+            return middle
+        return (middle + self._nth_smallest(self.count // 2)) / 2
+
+    def _nth_smallest(self, index: int) -> int:
+        for bucket in sorted(self.histogram):
+            index -= self.histogram[bucket]
+            if index < 0:
+                return bucket
+        raise IndexError(index)
+
+    @classmethod
+    def _to_histogram_bucket(cls, value: int) -> int:
+        shift = abs(value).bit_length() - cls.HISTOGRAM_PRECISION_BITS
+        if shift <= 0:
+            return value
+        # The middle of the range of values sharing the most significant bits.
+        bucket = ((abs(value) >> shift) << shift) + (1 << (shift - 1))
+        return bucket if value >= 0 else -bucket
 
     def __str__(self) -> str:
-        if not self.series:
+        if not self.count:
             return "0"
 
-        if len(self.series) == 1:
-            return str(self.series[0])
+        if self.count == 1:
+            return str(self.min)
 
-        mean_v = round(statistics.mean(self.series), 2)
-        median_v = statistics.median(self.series)
-        min_v = min(self.series)
-        max_v = max(self.series)
+        mean_v = round(self.total / self.count, 2)
+        median_v = self.median
+        min_v = self.min
+        max_v = self.max
         return f"μ: {mean_v:g}, Md: {median_v:g}, min: {min_v:g}, max: {max_v:g}"
 
     def __bool__(self) -> bool:
-        return bool(self.series)
+        return bool(self.count)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CountSeriesStatistic) and (
+            self.count,
+            self.total,
+            self.min,
+            self.max,
+            self.histogram,
+        ) == (other.count, other.total, other.min, other.max, other.histogram)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(count={self.count}, total={self.total}, "
+            f"min={self.min}, max={self.max})"
+        )
 
     @classmethod
     def from_statistic(cls, statistic: Statistic) -> Self:
@@ -105,10 +196,43 @@ class ExecutionResourcesSummary:
     def sum(
         items: Iterable["ExecutionResourcesSummary"],
     ) -> Optional["ExecutionResourcesSummary"]:
-        result = None
+        accumulator = ExecutionResourcesSummaryAccumulator()
         for item in items:
-            if result is None:
-                result = item
-            else:
-                result = result.add_observation(item)
-        return result
+            accumulator.add(item)
+        return accumulator.build()
+
+
+class ExecutionResourcesSummaryAccumulator:
+    """
+    Sums execution resources summaries in place, e.g. of fuzz test runs, without keeping them.
+    The result is equal to folding summaries with ``ExecutionResourcesSummary.add_observation``.
+    """
+
+    def __init__(self):
+        self._first: Optional[ExecutionResourcesSummary] = None
+        self._n_steps = CountSeriesStatistic()
+        self._n_memory_holes = CountSeriesStatistic()
+        self._builtin_name_to_count_map: Dict[str, CountSeriesStatistic] = defaultdict(
+            CountSeriesStatistic
+        )
+        self._items_count = 0
+
+    def add(self, item: ExecutionResourcesSummary):
+        if self._first is None:
+            self._first = item
+        self._items_count += 1
+        self._n_steps.add_statistic(item.n_steps)
+        self._n_memory_holes.add_statistic(item.n_memory_holes)
+        for name, statistic in item.builtin_name_to_count_map.items():
+            self._builtin_name_to_count_map[name].add_statistic(statistic)
+
+    def build(self) -> Optional[ExecutionResourcesSummary]:
+        if self._items_count <= 1:
+            return self._first
+
+        return dataclasses.replace(
+            self._first,
+            n_steps=self._n_steps,
+            n_memory_holes=self._n_memory_holes,
+            builtin_name_to_count_map=dict(self._builtin_name_to_count_map),
+        )
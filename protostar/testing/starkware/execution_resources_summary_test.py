@@ -175,3 +175,32 @@ def test_execution_resources_summary_add_observation_is_associative():
     assert ers_a.add_observation(ers_b).add_observation(ers_c) == ers_a.add_observation(
         ers_b.add_observation(ers_c)
     )
+
+
+def test_count_series_statistic_memory_is_bounded():
+    css = CountSeriesStatistic(range(100_000))
+
+    assert css.count == 100_000
+    assert (css.min, css.max) == (0, 99_999)
+    assert len(css.histogram) < 2_000
+    assert str(css).startswith("μ: 49999.5, Md: ")
+    assert abs(css.median - 49_999.5) / 49_999.5 < 0.004
+
+
+def test_execution_resources_summary_sum():
+    items = [
+        ExecutionResourcesSummary(
+            n_steps=CountStatistic(steps),
+            n_memory_holes=CountStatistic(0),
+            builtin_name_to_count_map={"foo": CountStatistic(steps % 3)},
+        )
+        for steps in range(1, 50)
+    ]
+
+    folded = items[0]
+    for item in items[1:]:
+        folded = folded.add_observation(item)
+
+    assert ExecutionResourcesSummary.sum([]) is None
+    assert ExecutionResourcesSummary.sum(items[:1]) is items[0]
+    assert ExecutionResourcesSummary.sum(items) == folded
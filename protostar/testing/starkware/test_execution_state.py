@@ -31,7 +31,9 @@ class TestExecutionState(ExecutionState):
         test_config: TestConfig,
         contract_path: Path,
     ) -> Self:
-        starknet = await ForkableStarknet.empty()
+        starknet = await ForkableStarknet.empty(
+            use_flat_state_reader=test_config.use_flat_state_reader
+        )
         contract = await starknet.deploy(contract_class=test_suite_definition)
         assert test_suite_definition.abi is not None
         starknet.cheatable_state.cheatable_state.class_hash_to_contract_abi_map[
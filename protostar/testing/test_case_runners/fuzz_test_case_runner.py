@@ -42,7 +42,10 @@ class FuzzTestCaseRunner(TestCaseRunner[FuzzTestExecutionResult]):
         )
         return PassedFuzzTestCaseResult.from_passed_test_case_result(
             passed_test_case_result,
-            fuzz_result=FuzzResult(fuzz_runs_count=execution_result.fuzz_runs_count),
+            fuzz_result=FuzzResult(
+                fuzz_runs_count=execution_result.fuzz_runs_count,
+                fuzz_examples_per_second=execution_result.fuzz_examples_per_second,
+            ),
         )
 
     def _map_reported_exception_to_failed_test_result(
@@ -82,6 +85,8 @@ class FuzzTestCaseRunner(TestCaseRunner[FuzzTestExecutionResult]):
         if fuzz_input:
             fuzz_runs_count = reported_exception.execution_info["fuzz_runs"]
             assert isinstance(fuzz_runs_count, int)
-            return FuzzResult(fuzz_runs_count=fuzz_runs_count)
+            return FuzzResult(
+                fuzz_runs_count=fuzz_runs_count, fuzz_examples_per_second=None
+            )
 
         return None
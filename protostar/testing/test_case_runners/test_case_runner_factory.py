@@ -4,6 +4,9 @@ from protostar.testing.environments.fuzz_test_execution_environment import (
 from protostar.testing.environments.test_execution_environment import (
     TestExecutionEnvironment,
 )
+from protostar.testing.fuzzing.hypothesis.example_database import (
+    build_example_database,
+)
 from protostar.testing.starkware.test_execution_state import TestExecutionState
 from protostar.testing.test_config import TestMode
 from protostar.testing.test_suite import TestCase
@@ -25,7 +28,10 @@ class TestCaseRunnerFactory:
         if mode is TestMode.FUZZ:
             return FuzzTestCaseRunner(
                 fuzz_test_execution_environment=FuzzTestExecutionEnvironment(
-                    self._state
+                    self._state,
+                    example_database=build_example_database(
+                        self._state.config.fuzz_examples_databases_path, test_case
+                    ),
                 ),
                 test_case=test_case,
                 output_recorder=self._state.output_recorder,
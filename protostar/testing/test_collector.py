@@ -1,11 +1,13 @@
+import multiprocessing
 import re
+import signal
 from collections import defaultdict
 from dataclasses import dataclass
 from fnmatch import fnmatch
 from glob import glob
 from pathlib import Path
 from time import time
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import ClassVar, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     LocationError,
@@ -27,6 +29,8 @@ TestCaseGlob = str
 Target = str
 """e.g. `tests/**/::test_*`"""
 TestCaseGlobsDict = Dict[TestSuitePath, Set[TestCaseGlob]]
+CollectedTestSuite = Union[BrokenTestSuiteResult, Tuple[TestSuite, Optional[List[str]]]]
+"""A broken test suite, or a test suite with modules it imports (if known)."""
 
 
 @dataclass(frozen=True)
@@ -83,6 +87,13 @@ class TestCollector:
     @dataclass
     class Config:
         safe_collecting: bool = False
+        processes_count: int = 1
+        """
+        Test suites are preprocessed by a pool of processes if greater than 1 and there are at least
+        as many test suites. Starting the pool costs more than preprocessing a few test suites.
+        """
+
+    _worker_instance: ClassVar[Optional["TestCollector"]] = None
 
     class Result:
         def __init__(
@@ -90,6 +101,7 @@ class TestCollector:
             test_suites: List[TestSuite],
             broken_test_suites: Optional[List[BrokenTestSuiteResult]] = None,
             duration: float = 0.0,
+            imported_modules: Optional[Dict[Path, List[str]]] = None,
         ) -> None:
             self.test_suites = test_suites
             self.broken_test_suites: List[BrokenTestSuiteResult] = (
@@ -99,6 +111,7 @@ class TestCollector:
                 len(test_suite.test_cases) for test_suite in test_suites
             )
             self.duration = duration
+            self.imported_modules: Dict[Path, List[str]] = imported_modules or {}
 
     def __init__(
         self, starknet_compiler: StarknetCompiler, config: Optional[Config] = None
@@ -149,6 +162,7 @@ class TestCollector:
         (
             test_suites,
             broken_test_suites,
+            imported_modules,
         ) = self._build_test_suites_from_test_suite_info_dict(test_suite_info_dict)
 
         non_empty_test_suites = [
@@ -161,6 +175,7 @@ class TestCollector:
             non_empty_test_suites,
             broken_test_suites=broken_test_suites,
             duration=end_time - start_time,
+            imported_modules=imported_modules,
         )
 
     def build_test_case_globs_dict(
@@ -247,33 +262,68 @@ class TestCollector:
     def _build_test_suites_from_test_suite_info_dict(
         self,
         test_suite_info_dict: TestSuiteInfoDict,
-    ) -> Tuple[List[TestSuite], List[BrokenTestSuiteResult]]:
+    ) -> Tuple[List[TestSuite], List[BrokenTestSuiteResult], Dict[Path, List[str]]]:
         test_suites: List[TestSuite] = []
         broken_test_suites: List[BrokenTestSuiteResult] = []
-
-        for test_suite_info in test_suite_info_dict.values():
-            try:
-                test_suites.append(
-                    self._build_test_suite_from_test_suite_info(
-                        test_suite_info,
-                    )
-                )
-            except (PreprocessorError, LocationError) as err:
-                broken_test_suites.append(
-                    BrokenTestSuiteResult(
-                        file_path=test_suite_info.path,
-                        test_case_names=[],
-                        exception=err,
-                    )
-                )
-
-        return test_suites, broken_test_suites
+        imported_modules: Dict[Path, List[str]] = {}
+
+        for collected_test_suite in self._collect_test_suites(
+            list(test_suite_info_dict.values())
+        ):
+            if isinstance(collected_test_suite, BrokenTestSuiteResult):
+                broken_test_suites.append(collected_test_suite)
+                continue
+            test_suite, test_suite_imported_modules = collected_test_suite
+            test_suites.append(test_suite)
+            if test_suite_imported_modules is not None:
+                imported_modules[test_suite.test_path] = test_suite_imported_modules
+
+        return test_suites, broken_test_suites, imported_modules
+
+    def _collect_test_suites(
+        self, test_suite_infos: List[TestSuiteInfo]
+    ) -> List[CollectedTestSuite]:
+        processes_count = self._config.processes_count
+        if processes_count <= 1 or len(test_suite_infos) < processes_count:
+            return [
+                self._collect_test_suite(test_suite_info)
+                for test_suite_info in test_suite_infos
+            ]
+        with multiprocessing.Pool(
+            processes=processes_count,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            # Results are returned in the order of test suite infos, so the collection is deterministic.
+            return pool.map(_collect_test_suite_in_worker, test_suite_infos)
+
+    def _collect_test_suite(self, test_suite_info: TestSuiteInfo) -> CollectedTestSuite:
+        try:
+            preprocessed = self._starknet_compiler.preprocess_contract(
+                test_suite_info.path
+            )
+            return (
+                self._build_test_suite_from_test_suite_info(
+                    test_suite_info, preprocessed
+                ),
+                preprocessed.imported_modules
+                if isinstance(preprocessed, TestCollectorPreprocessedProgram)
+                else None,
+            )
+        except (PreprocessorError, LocationError) as err:
+            return BrokenTestSuiteResult(
+                file_path=test_suite_info.path,
+                test_case_names=[],
+                exception=err,
+            )
 
     def _build_test_suite_from_test_suite_info(
         self,
         test_suite_info: TestSuiteInfo,
+        preprocessed: Union[
+            StarknetPreprocessedProgram, TestCollectorPreprocessedProgram
+        ],
     ) -> TestSuite:
-        preprocessed = self._starknet_compiler.preprocess_contract(test_suite_info.path)
         setup_fn_name = self._collect_setup_hook_name(preprocessed)
 
         test_cases = list(
@@ -328,3 +378,20 @@ class TestCollector:
         if function_names.count(hook_name) == 1:
             return hook_name
         return None
+
+
+# Note: These functions have to be top-level functions, because they are being pickled by multiprocessing.
+def _init_worker(test_collector: TestCollector):
+    # Prevent showing a stacktrace on CMD/CTRL+C.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    TestCollector._worker_instance = test_collector  # pylint: disable=protected-access
+
+
+def _collect_test_suite_in_worker(test_suite_info: TestSuiteInfo) -> CollectedTestSuite:
+    test_collector = TestCollector._worker_instance  # pylint: disable=protected-access
+    assert (
+        test_collector is not None
+    ), "TestCollector was not registered in this worker."
+    return test_collector._collect_test_suite(  # pylint: disable=protected-access
+        test_suite_info
+    )
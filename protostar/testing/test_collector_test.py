@@ -8,7 +8,8 @@ from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     PreprocessorError,
 )
 
-from protostar.utils.starknet_compilation import StarknetCompiler
+from protostar.utils.compiler.pass_managers import TestCollectorPassManagerFactory
+from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
 
 from .test_collector import TestCollector
 from .test_suite import TestCase, TestSuite
@@ -287,3 +288,61 @@ def test_testing_all_test_cases_despite_one_of_points_to_specific_test_case(
 
     assert_tested_suites(result.test_suites, ["test_foo.cairo"])
     assert result.test_cases_count == 2
+
+
+def test_collecting_in_multiple_processes(tmp_path: Path):
+    project_path = tmp_path / "parallel"
+    project_path.mkdir()
+    for index in range(4):
+        (project_path / f"test_{index}.cairo").write_text(
+            "%lang starknet\n"
+            "@external\n"
+            f"func test_case_{index}() {{\n"
+            "    return ();\n"
+            "}\n"
+        )
+    (project_path / "test_broken.cairo").write_text("%lang starknet\nfunc test(\n")
+    starknet_compiler = StarknetCompiler(
+        config=CompilerConfig(include_paths=[], disable_hint_validation=True),
+        pass_manager_factory=TestCollectorPassManagerFactory,
+    )
+
+    results = [
+        TestCollector(
+            starknet_compiler,
+            config=TestCollector.Config(processes_count=processes_count),
+        ).collect([str(project_path)])
+        for processes_count in [1, 2]
+    ]
+
+    assert [
+        (test_suite.test_path, [case.test_fn_name for case in test_suite.test_cases])
+        for test_suite in results[1].test_suites
+    ] == [
+        (test_suite.test_path, [case.test_fn_name for case in test_suite.test_cases])
+        for test_suite in results[0].test_suites
+    ]
+    assert len(results[1].test_suites) == 4
+    assert [
+        broken_test_suite.file_path
+        for broken_test_suite in results[1].broken_test_suites
+    ] == [project_path / "test_broken.cairo"]
+    assert results[1].imported_modules == results[0].imported_modules
+
+
+def test_collecting_few_test_suites_in_process(tmp_path: Path, mocker: MockerFixture):
+    (tmp_path / "test_single.cairo").write_text(
+        "%lang starknet\n@external\nfunc test_case() {\n    return ();\n}\n"
+    )
+    pool_mock = mocker.patch("multiprocessing.Pool")
+    starknet_compiler = StarknetCompiler(
+        config=CompilerConfig(include_paths=[], disable_hint_validation=True),
+        pass_manager_factory=TestCollectorPassManagerFactory,
+    )
+
+    result = TestCollector(
+        starknet_compiler, config=TestCollector.Config(processes_count=2)
+    ).collect([str(tmp_path)])
+
+    pool_mock.assert_not_called()
+    assert result.test_cases_count == 1
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional
 
 from starkware.starknet.testing.contract import StarknetContract
 from typing_extensions import Self
@@ -85,9 +86,18 @@ class TestConfig:
     seed: Seed = field(default_factory=random_seed)
 
     fuzz_max_examples: int = 100
+    fuzz_processes_count: int = 1
+    fuzz_examples_databases_path: Optional[Path] = None
+    """
+    A directory with Hypothesis example databases of fuzz tests. Examples aren't persisted if not set.
+    """
     fuzz_declared_strategies: Dict[str, StrategyDescriptor] = field(
         default_factory=dict
     )
+    use_flat_state_reader: bool = False
+    """
+    Back the test state with ``FlatStateReader`` instead of Patricia trees, see ``CheatableStarknetState.empty``.
+    """
 
     def convert_mode_to(self, to_mode: TestMode):
         self.mode = self.mode.convert_to(to_mode)
@@ -0,0 +1,124 @@
+import hashlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set
+
+from starkware.cairo.lang.compiler.error_handling import LocationError
+from starkware.cairo.lang.compiler.import_loader import collect_imports
+from starkware.cairo.lang.compiler.module_reader import ModuleNotFoundException
+
+from protostar.utils.compiler.module_index import get_indexed_module_reader
+
+CONTRACT_PATH_LITERAL_PATTERN = re.compile(r"""["']([^"'\n]+\.cairo)["']""")
+NON_LITERAL_CONTRACT_PATH_PATTERN = re.compile(
+    r"""\b(?:declare|deploy_contract)\(\s*(?!["'])"""
+)
+
+FileHashes = Dict[str, str]
+"""SHA-256 of files, keyed by their resolved paths."""
+
+
+@dataclass(frozen=True)
+class TestSuiteDependencies:
+    file_hashes: FileHashes
+    is_complete: bool
+    """
+    False if a test suite declares or deploys a contract from a path which isn't a string literal,
+    so the contract can't be found without running the test suite.
+    """
+
+    @property
+    def file_paths(self) -> FrozenSet[str]:
+        return frozenset(self.file_hashes)
+
+
+class TestDependencyGraph:
+    """
+    Files each test suite depends on: the test suite, modules imported by it (transitively),
+    contracts declared or deployed in its hints (found by paths to Cairo files in string literals),
+    and modules imported by those contracts.
+    """
+
+    def __init__(self, include_paths: List[str]):
+        self._module_reader = get_indexed_module_reader(cairo_path=include_paths)
+        self._contracts_dependencies: Dict[Path, Set[Path]] = {}
+        self._test_suites_dependencies: Dict[Path, TestSuiteDependencies] = {}
+
+    def get_test_suite_dependencies(
+        self, test_suite_path: Path, imported_modules: Optional[List[str]] = None
+    ) -> TestSuiteDependencies:
+        if test_suite_path not in self._test_suites_dependencies:
+            self._test_suites_dependencies[
+                test_suite_path
+            ] = self._find_test_suite_dependencies(test_suite_path, imported_modules)
+        return self._test_suites_dependencies[test_suite_path]
+
+    def _find_test_suite_dependencies(
+        self, test_suite_path: Path, imported_modules: Optional[List[str]]
+    ) -> TestSuiteDependencies:
+        if imported_modules is None:
+            imported_modules = self._collect_imported_modules(test_suite_path)
+
+        file_paths = {test_suite_path.resolve()}
+        for module_name in imported_modules:
+            file_paths.add(self._resolve_module(module_name))
+
+        file_hashes: FileHashes = {}
+        is_complete = True
+        contract_paths: Set[Path] = set()
+        for file_path in file_paths:
+            content = file_path.read_bytes()
+            file_hashes[str(file_path)] = hashlib.sha256(content).hexdigest()
+            text = content.decode("utf-8", errors="replace")
+            if NON_LITERAL_CONTRACT_PATH_PATTERN.search(text):
+                is_complete = False
+            contract_paths.update(
+                Path(contract_path).resolve()
+                for contract_path in CONTRACT_PATH_LITERAL_PATTERN.findall(text)
+            )
+
+        for contract_path in contract_paths:
+            for file_path in self._get_contract_dependencies(contract_path):
+                if str(file_path) not in file_hashes:
+                    file_hashes[str(file_path)] = hash_file(file_path)
+
+        return TestSuiteDependencies(file_hashes=file_hashes, is_complete=is_complete)
+
+    def _get_contract_dependencies(self, contract_path: Path) -> Set[Path]:
+        if contract_path not in self._contracts_dependencies:
+            dependencies: Set[Path] = set()
+            if contract_path.is_file():
+                dependencies.add(contract_path)
+                try:
+                    dependencies.update(
+                        self._resolve_module(module_name)
+                        for module_name in self._collect_imported_modules(contract_path)
+                    )
+                except (ModuleNotFoundException, LocationError):
+                    # The contract doesn't compile, so the test suite fails until it's modified.
+                    pass
+            self._contracts_dependencies[contract_path] = dependencies
+        return self._contracts_dependencies[contract_path]
+
+    def _collect_imported_modules(self, file_path: Path) -> List[str]:
+        code = file_path.read_text("utf-8")
+        filename = str(file_path)
+
+        def read_file(name: str):
+            return (
+                (code, filename) if name == filename else self._module_reader.read(name)
+            )
+
+        return [
+            module_name
+            for module_name in collect_imports(filename, read_file=read_file)
+            if module_name != filename
+        ]
+
+    def _resolve_module(self, module_name: str) -> Path:
+        return Path(self._module_reader.module_to_file_path(module_name)).resolve()
+
+
+def hash_file(file_path: Path) -> str:
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
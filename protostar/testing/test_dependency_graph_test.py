@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import pytest
+
+from .test_dependency_graph import TestDependencyGraph
+
+
+@pytest.fixture(name="project_path")
+def project_path_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "utils.cairo").write_text(
+        "func add(a: felt, b: felt) -> felt {\n    return a + b;\n}\n"
+    )
+    (tmp_path / "src" / "main.cairo").write_text(
+        "%lang starknet\nfrom src.utils import add\n"
+    )
+    (tmp_path / "src" / "other.cairo").write_text("%lang starknet\n")
+    (tmp_path / "tests").mkdir()
+    return tmp_path
+
+
+def test_dependencies_include_imports_and_deployed_contracts(project_path: Path):
+    test_suite_path = project_path / "tests" / "test_main.cairo"
+    test_suite_path.write_text(
+        "%lang starknet\n"
+        "from src.utils import add\n"
+        "@external\n"
+        "func test_main() {\n"
+        '    %{ deploy_contract("./src/main.cairo") %}\n'
+        "    return ();\n"
+        "}\n"
+    )
+
+    dependencies = TestDependencyGraph(
+        include_paths=[str(project_path)]
+    ).get_test_suite_dependencies(test_suite_path)
+
+    assert dependencies.is_complete
+    assert dependencies.file_paths == {
+        str(test_suite_path.resolve()),
+        str((project_path / "src" / "utils.cairo").resolve()),
+        str((project_path / "src" / "main.cairo").resolve()),
+    }
+
+
+def test_dependencies_are_incomplete_when_contract_path_is_not_literal(
+    project_path: Path,
+):
+    test_suite_path = project_path / "tests" / "test_main.cairo"
+    test_suite_path.write_text(
+        "%lang starknet\n"
+        "@external\n"
+        "func test_main() {\n"
+        "    %{ deploy_contract(context.contract_path) %}\n"
+        "    return ();\n"
+        "}\n"
+    )
+
+    dependencies = TestDependencyGraph(
+        include_paths=[str(project_path)]
+    ).get_test_suite_dependencies(test_suite_path)
+
+    assert not dependencies.is_complete
+
+
+def test_using_modules_imported_during_collection(project_path: Path):
+    test_suite_path = project_path / "tests" / "test_main.cairo"
+    test_suite_path.write_text("%lang starknet\n")
+
+    dependencies = TestDependencyGraph(
+        include_paths=[str(project_path)]
+    ).get_test_suite_dependencies(test_suite_path, imported_modules=["src.other"])
+
+    assert dependencies.file_paths == {
+        str(test_suite_path.resolve()),
+        str((project_path / "src" / "other.cairo").resolve()),
+    }
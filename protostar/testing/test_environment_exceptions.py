@@ -1,5 +1,5 @@
 import re
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from starkware.starknet.business_logic.execution.objects import Event
 from typing_extensions import Literal
@@ -182,7 +182,7 @@ class ExpectedEventMissingException(ReportedException):
         self,
         matches: ExpectedEvent.MatchesList,
         missing: List[ExpectedEvent],
-        event_selector_to_name_map: Dict[int, str],
+        event_selector_to_name_map: Mapping[int, str],
         line_prefix="  ",
     ) -> None:
         self.matches = matches
@@ -35,6 +35,11 @@ class PassedTestCaseResult(TimedTestCaseResult):
     execution_resources: Optional[ExecutionResourcesSummary]
 
 
+@dataclass(frozen=True)
+class CachedPassedTestCaseResult(PassedTestCaseResult):
+    """A test case which passed in a previous run and none of its dependencies changed since then."""
+
+
 @dataclass(frozen=True)
 class FailedTestCaseResult(TimedTestCaseResult):
     exception: ReportedException
@@ -53,6 +58,7 @@ class SkippedTestCaseResult(TimedTestCaseResult):
 @dataclass(frozen=True)
 class FuzzResult:
     fuzz_runs_count: Optional[int]
+    fuzz_examples_per_second: Optional[float]
 
 
 @dataclass(frozen=True)
@@ -68,6 +74,7 @@ class PassedFuzzTestCaseResult(PassedTestCaseResult, FuzzResult):
             execution_resources=passed_test_case_result.execution_resources,
             execution_time=passed_test_case_result.execution_time,
             fuzz_runs_count=fuzz_result.fuzz_runs_count,
+            fuzz_examples_per_second=fuzz_result.fuzz_examples_per_second,
         )
 
 
@@ -80,6 +87,9 @@ class FailedFuzzTestCaseResult(FailedTestCaseResult, FuzzResult):
         fuzz_result: Optional[FuzzResult],
     ) -> Self:
         fuzz_runs_count = fuzz_result.fuzz_runs_count if fuzz_result else None
+        fuzz_examples_per_second = (
+            fuzz_result.fuzz_examples_per_second if fuzz_result else None
+        )
 
         return cls(
             file_path=failed_test_case_result.file_path,
@@ -88,6 +98,7 @@ class FailedFuzzTestCaseResult(FailedTestCaseResult, FuzzResult):
             exception=failed_test_case_result.exception,
             execution_time=failed_test_case_result.execution_time,
             fuzz_runs_count=fuzz_runs_count,
+            fuzz_examples_per_second=fuzz_examples_per_second,
         )
 
 
@@ -100,6 +111,9 @@ class BrokenFuzzTestCaseResult(BrokenTestCaseResult, FuzzResult):
         fuzz_result: Optional[FuzzResult],
     ) -> Self:
         fuzz_runs_count = fuzz_result.fuzz_runs_count if fuzz_result else None
+        fuzz_examples_per_second = (
+            fuzz_result.fuzz_examples_per_second if fuzz_result else None
+        )
 
         return cls(
             file_path=broken_test_case_result.file_path,
@@ -108,6 +122,7 @@ class BrokenFuzzTestCaseResult(BrokenTestCaseResult, FuzzResult):
             exception=broken_test_case_result.exception,
             execution_time=broken_test_case_result.execution_time,
             fuzz_runs_count=fuzz_runs_count,
+            fuzz_examples_per_second=fuzz_examples_per_second,
         )
 
 
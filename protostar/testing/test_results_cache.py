@@ -0,0 +1,161 @@
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+
+from .test_collector import TestCollector
+from .test_dependency_graph import TestDependencyGraph
+from .test_results import (
+    CachedPassedTestCaseResult,
+    PassedFuzzTestCaseResult,
+    PassedTestCaseResult,
+    TestCaseResult,
+    TestResult,
+)
+from .test_suite import TestSuite
+from .testing_seed import Seed
+
+
+class TestResultsCache:
+    """
+    Test cases which passed, keyed by a hash of everything the result depends on: files of
+    the test suite's `TestDependencyGraph`, protostar and cairo-lang versions, testing settings
+    and, for fuzz tests, the testing seed.
+    Test suites with dependencies which can't be found statically are never cached.
+    """
+
+    def __init__(self, cache_file_path: Path, protostar_version: Optional[str]):
+        self._cache_file_path = cache_file_path
+        self._protostar_version = protostar_version
+        self._test_suites_keys: Dict[str, str] = {}
+
+    def split(
+        self,
+        test_collector_result: TestCollector.Result,
+        dependency_graph: TestDependencyGraph,
+        settings: Dict[str, Any],
+        testing_seed: Seed,
+    ) -> Tuple[TestCollector.Result, List[CachedPassedTestCaseResult]]:
+        """
+        Split collected test cases into ones which have to be run and cached results of the others.
+        """
+        entries = self._load_entries()
+        test_suites_to_run: List[TestSuite] = []
+        cached_results: List[CachedPassedTestCaseResult] = []
+        for test_suite in test_collector_result.test_suites:
+            dependencies = dependency_graph.get_test_suite_dependencies(
+                test_suite.test_path,
+                test_collector_result.imported_modules.get(test_suite.test_path),
+            )
+            if not dependencies.is_complete:
+                test_suites_to_run.append(test_suite)
+                continue
+
+            test_suite_key = _hash(
+                {
+                    "dependencies": dependencies.file_hashes,
+                    "protostar_version": self._protostar_version,
+                    "cairo_lang_version": cairo_lang_version,
+                    "settings": settings,
+                }
+            )
+            self._test_suites_keys[_to_key(test_suite.test_path)] = test_suite_key
+            test_suite_entries = entries.get(_to_key(test_suite.test_path), {})
+
+            test_cases_to_run = []
+            for test_case in test_suite.test_cases:
+                entry = test_suite_entries.get(test_case.test_fn_name, {})
+                if entry.get("key") == _get_test_case_key(
+                    test_suite_key, testing_seed, entry.get("is_fuzz", True)
+                ):
+                    cached_results.append(
+                        CachedPassedTestCaseResult(
+                            file_path=test_suite.test_path,
+                            test_case_name=test_case.test_fn_name,
+                            captured_stdout={},
+                            execution_time=0.0,
+                            execution_resources=None,
+                        )
+                    )
+                else:
+                    test_cases_to_run.append(test_case)
+            if test_cases_to_run:
+                test_suites_to_run.append(
+                    dataclasses.replace(test_suite, test_cases=test_cases_to_run)
+                )
+
+        return (
+            TestCollector.Result(
+                test_suites=test_suites_to_run,
+                broken_test_suites=test_collector_result.broken_test_suites,
+                duration=test_collector_result.duration,
+                imported_modules=test_collector_result.imported_modules,
+            ),
+            cached_results,
+        )
+
+    def record(self, test_results: List[TestResult], testing_seed: Seed) -> None:
+        entries = self._load_entries()
+        for test_result in test_results:
+            if isinstance(test_result, CachedPassedTestCaseResult) or not isinstance(
+                test_result, TestCaseResult
+            ):
+                continue
+            test_suite_key = self._test_suites_keys.get(_to_key(test_result.file_path))
+            test_suite_entries = entries.setdefault(_to_key(test_result.file_path), {})
+            if test_suite_key is None or not isinstance(
+                test_result, PassedTestCaseResult
+            ):
+                test_suite_entries.pop(test_result.test_case_name, None)
+                continue
+            is_fuzz = isinstance(test_result, PassedFuzzTestCaseResult)
+            test_suite_entries[test_result.test_case_name] = {
+                "key": _get_test_case_key(test_suite_key, testing_seed, is_fuzz),
+                "is_fuzz": is_fuzz,
+            }
+        self._save_entries(entries)
+
+    def _load_entries(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        try:
+            entries = json.loads(self._cache_file_path.read_text("utf-8"))[
+                "test_suites"
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_entries(self, entries: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        try:
+            self._cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(
+                dir=self._cache_file_path.parent, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                    json.dump({"test_suites": entries}, file)
+                os.replace(tmp_path, self._cache_file_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+
+def _get_test_case_key(test_suite_key: str, testing_seed: Seed, is_fuzz: bool) -> str:
+    # Only results of fuzz tests depend on the seed.
+    return _hash(
+        {"test_suite": test_suite_key, "seed": testing_seed if is_fuzz else None}
+    )
+
+
+def _hash(data: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _to_key(test_path: Path) -> str:
+    return str(test_path.resolve())
@@ -0,0 +1,149 @@
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from protostar.starknet import ReportedException
+
+from .test_collector import TestCollector
+from .test_dependency_graph import TestDependencyGraph
+from .test_results import (
+    CachedPassedTestCaseResult,
+    FailedTestCaseResult,
+    PassedFuzzTestCaseResult,
+    PassedTestCaseResult,
+    TestResult,
+)
+from .test_results_cache import TestResultsCache
+from .test_suite import TestCase, TestSuite
+
+
+@pytest.fixture(name="project_path")
+def project_path_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.cairo").write_text("const A = 1;\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.cairo").write_text(
+        "%lang starknet\nfrom src.a import A\n"
+    )
+    return tmp_path
+
+
+def run_test_cases(test_collector_result: TestCollector.Result) -> List[TestResult]:
+    test_results: List[TestResult] = []
+    for test_suite in test_collector_result.test_suites:
+        for test_case in test_suite.test_cases:
+            if test_case.test_fn_name == "test_failing":
+                test_results.append(
+                    FailedTestCaseResult(
+                        file_path=test_suite.test_path,
+                        test_case_name=test_case.test_fn_name,
+                        captured_stdout={},
+                        execution_time=1.0,
+                        exception=ReportedException(),
+                    )
+                )
+            elif test_case.test_fn_name == "test_fuzz":
+                test_results.append(
+                    PassedFuzzTestCaseResult(
+                        file_path=test_suite.test_path,
+                        test_case_name=test_case.test_fn_name,
+                        captured_stdout={},
+                        execution_time=1.0,
+                        execution_resources=None,
+                        fuzz_runs_count=100,
+                        fuzz_examples_per_second=None,
+                    )
+                )
+            else:
+                test_results.append(
+                    PassedTestCaseResult(
+                        file_path=test_suite.test_path,
+                        test_case_name=test_case.test_fn_name,
+                        captured_stdout={},
+                        execution_time=1.0,
+                        execution_resources=None,
+                    )
+                )
+    return test_results
+
+
+def run_with_cache(
+    project_path: Path, testing_seed: int = 42
+) -> Tuple[List[str], List[str]]:
+    test_path = project_path / "tests" / "test_a.cairo"
+    test_collector_result = TestCollector.Result(
+        test_suites=[
+            TestSuite(
+                test_path=test_path,
+                test_cases=[
+                    TestCase(test_path=test_path, test_fn_name=test_fn_name)
+                    for test_fn_name in ["test_passing", "test_failing", "test_fuzz"]
+                ],
+            )
+        ]
+    )
+    cache = TestResultsCache(
+        project_path / ".protostar_cache" / "test_results.json",
+        protostar_version="0.5.0",
+    )
+    test_collector_result_to_run, cached_results = cache.split(
+        test_collector_result,
+        TestDependencyGraph(include_paths=[str(project_path)]),
+        settings={},
+        testing_seed=testing_seed,
+    )
+    assert all(
+        isinstance(cached_result, CachedPassedTestCaseResult)
+        for cached_result in cached_results
+    )
+    cache.record(
+        [*cached_results, *run_test_cases(test_collector_result_to_run)],
+        testing_seed,
+    )
+    return (
+        [
+            test_case.test_fn_name
+            for test_suite in test_collector_result_to_run.test_suites
+            for test_case in test_suite.test_cases
+        ],
+        [cached_result.test_case_name for cached_result in cached_results],
+    )
+
+
+def test_caching_passed_test_cases(project_path: Path):
+    assert run_with_cache(project_path) == (
+        ["test_passing", "test_failing", "test_fuzz"],
+        [],
+    )
+
+    assert run_with_cache(project_path) == (
+        ["test_failing"],
+        ["test_passing", "test_fuzz"],
+    )
+
+    assert run_with_cache(project_path, testing_seed=43) == (
+        ["test_failing", "test_fuzz"],
+        ["test_passing"],
+    )
+
+    (project_path / "src" / "a.cairo").write_text("const A = 2;\n")
+
+    assert run_with_cache(project_path, testing_seed=43) == (
+        ["test_passing", "test_failing", "test_fuzz"],
+        [],
+    )
+
+
+def test_not_caching_test_suites_with_incomplete_dependencies(project_path: Path):
+    (project_path / "tests" / "test_a.cairo").write_text(
+        "%lang starknet\n%{ deploy_contract(context.contract_path) %}\n"
+    )
+
+    run_with_cache(project_path)
+
+    assert run_with_cache(project_path) == (
+        ["test_passing", "test_failing", "test_fuzz"],
+        [],
+    )
@@ -1,20 +1,24 @@
 import asyncio
+import dataclasses
 import traceback
 from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
-from typing import List, Optional
+from typing import ClassVar, Dict, List, Optional, Tuple
 
 from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starkware_utils.error_handling import StarkException
 
 from protostar.protostar_exception import ProtostarException
+from protostar.utils.compiler.compilation_cache import CompilationCache
+from protostar.utils.compiler.compiler_profiler import CompilerProfiler
 from protostar.utils.compiler.pass_managers import (
     ProtostarPassMangerFactory,
     TestSuitePassMangerFactory,
 )
 from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
 
+from .cheatcodes.declare_cheatcode import DeclareCheatcode
 from .environments.setup_execution_environment import SetupExecutionEnvironment
 from .starkware.test_execution_state import TestExecutionState
 from .test_case_runners.setup_case_runner import run_setup_case
@@ -24,7 +28,9 @@ from .test_environment_exceptions import ReportedException
 from .test_results import (
     BrokenSetupCaseResult,
     BrokenTestSuiteResult,
+    PassedTestCaseResult,
     SkippedSetupCaseResult,
+    SkippedTestCaseResult,
     TestResult,
     UnexpectedBrokenTestSuiteResult,
 )
@@ -36,13 +42,27 @@ logger = getLogger()
 
 
 class TestRunner:
+    _prepared_test_suites: ClassVar[
+        Dict[Tuple[Path, Seed, bool], TestExecutionState]
+    ] = {}
+    """
+    Holds only the most recently prepared test suite in this process. When a test suite is split across
+    multiple worker tasks, a worker which picks up another part of the same test suite reuses
+    the compiled test contract and the state after ``__setup__`` instead of rebuilding them.
+    """
+    _workers_generation: ClassVar[int] = 0
+
     def __init__(
         self,
         shared_tests_state: SharedTestsState,
         include_paths: Optional[List[str]] = None,
         disable_hint_validation_in_user_contracts=False,
+        compilation_cache: Optional[CompilationCache] = None,
+        lazy_debug_info: bool = False,
+        compiler_profiler: Optional[CompilerProfiler] = None,
     ):
         self.shared_tests_state = shared_tests_state
+        self.lazy_debug_info = lazy_debug_info
         include_paths = include_paths or []
 
         self.tests_compiler = StarknetCompiler(
@@ -50,6 +70,8 @@ class TestRunner:
                 include_paths=include_paths, disable_hint_validation=True
             ),
             pass_manager_factory=TestSuitePassMangerFactory,
+            cache=compilation_cache,
+            profiler=compiler_profiler,
         )
 
         self.user_contracts_compiler = StarknetCompiler(
@@ -58,26 +80,46 @@ class TestRunner:
                 disable_hint_validation=disable_hint_validation_in_user_contracts,
             ),
             pass_manager_factory=ProtostarPassMangerFactory,
+            cache=compilation_cache,
+            profiler=compiler_profiler,
         )
 
+    # pylint: disable=too-many-instance-attributes
     @dataclass
     class WorkerArgs:
         test_suite: TestSuite
-        shared_tests_state: SharedTestsState
         include_paths: List[str]
         disable_hint_validation_in_user_contracts: bool
         testing_seed: Seed
+        compilation_cache: Optional[CompilationCache] = None
+        fuzz_processes_count: int = 1
+        fuzz_examples_databases_path: Optional[Path] = None
+        workers_generation: int = 0
+        lazy_debug_info: bool = False
+        compiler_profiler: Optional[CompilerProfiler] = None
+        use_flat_state_reader: bool = False
 
     @classmethod
     def worker(cls, args: "TestRunner.WorkerArgs"):
+        if args.workers_generation != TestRunner._workers_generation:
+            # A new run of reused workers, test suites and contracts might have been modified.
+            TestRunner._workers_generation = args.workers_generation
+            TestRunner._prepared_test_suites = {}
+            DeclareCheatcode.forget_prepared_declarations()
         asyncio.run(
             cls(
-                shared_tests_state=args.shared_tests_state,
+                shared_tests_state=SharedTestsState.from_worker(),
                 include_paths=args.include_paths,
                 disable_hint_validation_in_user_contracts=args.disable_hint_validation_in_user_contracts,
+                compilation_cache=args.compilation_cache,
+                lazy_debug_info=args.lazy_debug_info,
+                compiler_profiler=args.compiler_profiler,
             ).run_test_suite(
                 test_suite=args.test_suite,
                 testing_seed=args.testing_seed,
+                fuzz_processes_count=args.fuzz_processes_count,
+                fuzz_examples_databases_path=args.fuzz_examples_databases_path,
+                use_flat_state_reader=args.use_flat_state_reader,
             )
         )
 
@@ -85,27 +127,29 @@ class TestRunner:
         self,
         test_suite: TestSuite,
         testing_seed: Seed,
+        fuzz_processes_count: int = 1,
+        fuzz_examples_databases_path: Optional[Path] = None,
+        use_flat_state_reader: bool = False,
     ):
-        test_config = TestConfig(seed=testing_seed)
+        test_config = TestConfig(
+            seed=testing_seed,
+            fuzz_processes_count=fuzz_processes_count,
+            fuzz_examples_databases_path=fuzz_examples_databases_path,
+            use_flat_state_reader=use_flat_state_reader,
+        )
 
         try:
-            compiled_test = self.tests_compiler.compile_contract(
-                test_suite.test_path,
-                add_debug_info=True,
-            )
-
-            execution_state = await self._build_execution_state(
-                test_contract=compiled_test,
-                test_suite=test_suite,
-                test_config=test_config,
-                contract_path=test_suite.test_path,
-            )
-            if not execution_state:
-                return
-            await self._invoke_test_cases(
-                test_suite=test_suite,
-                execution_state=execution_state,
-            )
+            if self.lazy_debug_info:
+                await self._run_test_cases_with_lazy_debug_info(
+                    test_suite=test_suite,
+                    test_config=test_config,
+                )
+            else:
+                await self._run_test_cases(
+                    test_suite=test_suite,
+                    test_config=test_config,
+                    add_debug_info=True,
+                )
         except ProtostarException as ex:
             self.shared_tests_state.put_result(
                 BrokenTestSuiteResult(
@@ -135,12 +179,106 @@ class TestRunner:
                 )
             )
 
+        finally:
+            self.shared_tests_state.flush()
+
+    async def _run_test_cases(
+        self,
+        test_suite: TestSuite,
+        test_config: TestConfig,
+        add_debug_info: bool,
+    ) -> None:
+        execution_state = await self._get_or_build_execution_state(
+            test_suite=test_suite,
+            test_config=test_config,
+            add_debug_info=add_debug_info,
+        )
+        if not execution_state:
+            return
+        await self._invoke_test_cases(
+            test_suite=test_suite,
+            execution_state=execution_state,
+        )
+
+    async def _run_test_cases_with_lazy_debug_info(
+        self,
+        test_suite: TestSuite,
+        test_config: TestConfig,
+    ) -> None:
+        """
+        Run test cases of a test suite compiled without debug info, which is faster to compile and run.
+        Test cases which didn't pass are run again with debug info, to report errors with the Cairo traceback.
+        """
+        try:
+            execution_state = await self._get_or_build_execution_state(
+                test_suite=test_suite,
+                test_config=test_config,
+                add_debug_info=False,
+                report_errors=False,
+            )
+        except (ProtostarException, ReportedException):
+            execution_state = None
+        if not execution_state:
+            await self._run_test_cases(
+                test_suite=test_suite,
+                test_config=test_config,
+                add_debug_info=True,
+            )
+            return
+
+        test_cases_to_rerun: List[TestCase] = []
+        for test_case in test_suite.test_cases:
+            self.shared_tests_state.flush_if_delayed()
+            test_result = await self._invoke_test_case(test_case, execution_state)
+            if isinstance(test_result, (PassedTestCaseResult, SkippedTestCaseResult)):
+                self.shared_tests_state.put_result(test_result)
+            else:
+                test_cases_to_rerun.append(test_case)
+
+        if test_cases_to_rerun:
+            await self._run_test_cases(
+                test_suite=dataclasses.replace(
+                    test_suite, test_cases=test_cases_to_rerun
+                ),
+                test_config=test_config,
+                add_debug_info=True,
+            )
+
+    async def _get_or_build_execution_state(
+        self,
+        test_suite: TestSuite,
+        test_config: TestConfig,
+        add_debug_info: bool,
+        report_errors: bool = True,
+    ) -> Optional[TestExecutionState]:
+        cache_key = (test_suite.test_path, test_config.seed, add_debug_info)
+        prepared_execution_state = TestRunner._prepared_test_suites.get(cache_key)
+        if prepared_execution_state:
+            return prepared_execution_state
+
+        compiled_test = self.tests_compiler.compile_contract(
+            test_suite.test_path,
+            add_debug_info=add_debug_info,
+        )
+
+        execution_state = await self._build_execution_state(
+            test_contract=compiled_test,
+            test_suite=test_suite,
+            test_config=test_config,
+            contract_path=test_suite.test_path,
+            report_errors=report_errors,
+        )
+        if execution_state:
+            TestRunner._prepared_test_suites = {cache_key: execution_state}
+        return execution_state
+
     async def _build_execution_state(
         self,
         test_contract: ContractClass,
         test_suite: TestSuite,
         test_config: TestConfig,
         contract_path: Path,
+        report_errors: bool = True,
     ) -> Optional[TestExecutionState]:
         assert self.shared_tests_state, "Uninitialized reporter!"
 
@@ -158,6 +296,8 @@ class TestRunner:
 
             return execution_state
         except StarkException as ex:
+            if not report_errors:
+                return None
             self.shared_tests_state.put_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
@@ -174,6 +314,7 @@ class TestRunner:
         execution_state: TestExecutionState,
     ) -> None:
         for test_case in test_suite.test_cases:
+            self.shared_tests_state.flush_if_delayed()
             test_result = await self._invoke_test_case(test_case, execution_state)
             self.shared_tests_state.put_result(test_result)
 
@@ -1,10 +1,15 @@
 import multiprocessing
-import signal
-from typing import TYPE_CHECKING, Callable, List
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from protostar.utils.compiler.compilation_cache import CompilationCache
+from protostar.utils.compiler.compiler_profiler import CompilerProfiler
 
 from .test_collector import TestCollector
 from .test_runner import TestRunner
-from .test_shared_tests_state import SharedTestsState
+from .test_suite import TestSuite
+from .test_timings_history import TestTimingsHistory
+from .test_workers_pool import TestWorkersPool
 from .testing_seed import Seed
 
 if TYPE_CHECKING:
@@ -30,46 +35,88 @@ class TestScheduler:
         disable_hint_validation: bool,
         exit_first: bool,
         testing_seed: Seed,
+        split_test_suites: bool = False,
+        compilation_cache: Optional[CompilationCache] = None,
+        fuzz_processes_count: int = 1,
+        fuzz_examples_databases_path: Optional[Path] = None,
+        test_timings_history: Optional[TestTimingsHistory] = None,
+        workers_pool: Optional[TestWorkersPool] = None,
+        lazy_debug_info: bool = False,
+        compiler_profiler: Optional[CompilerProfiler] = None,
+        use_flat_state_reader: bool = False,
     ):
-        with multiprocessing.Manager() as manager:
-            shared_tests_state = SharedTestsState(
-                test_collector_result=test_collector_result, manager=manager
-            )
+        processes_count = multiprocessing.cpu_count()
+        test_suites = self._schedule_test_suites(
+            test_collector_result.test_suites,
+            parts_count=processes_count if split_test_suites else 1,
+            test_timings_history=test_timings_history,
+        )
+
+        # A test suite was broken
+        if exit_first and test_collector_result.broken_test_suites:
+            self._live_logger.log_testing_summary(test_collector_result)
+            return
+
+        is_workers_pool_owned = workers_pool is None
+        if workers_pool is None:
+            workers_pool = TestWorkersPool(processes_count)
+
+        try:
+            pool, shared_tests_state = workers_pool.acquire(test_collector_result)
             setups: List[TestRunner.WorkerArgs] = [
                 TestRunner.WorkerArgs(
                     test_suite,
-                    shared_tests_state=shared_tests_state,
                     include_paths=include_paths,
                     disable_hint_validation_in_user_contracts=disable_hint_validation,
                     testing_seed=testing_seed,
+                    compilation_cache=compilation_cache,
+                    fuzz_processes_count=fuzz_processes_count,
+                    fuzz_examples_databases_path=fuzz_examples_databases_path,
+                    workers_generation=workers_pool.generation,
+                    lazy_debug_info=lazy_debug_info,
+                    compiler_profiler=compiler_profiler,
+                    use_flat_state_reader=use_flat_state_reader,
                 )
-                for test_suite in test_collector_result.test_suites
+                for test_suite in test_suites
             ]
+            # Tasks are handed out one by one, so parts of a big test suite
+            # are picked up by different workers.
+            results = pool.map_async(self._worker, setups, chunksize=1)
 
-            # A test case was broken
-            if exit_first and shared_tests_state.any_failed_or_broken():
-                self._live_logger.log_testing_summary(test_collector_result)
-                return
-
-            try:
-                with multiprocessing.Pool(
-                    processes=multiprocessing.cpu_count(),
-                    initializer=_init_worker,
-                ) as pool:
-                    results = pool.map_async(self._worker, setups)
-
-                    self._live_logger.log(shared_tests_state, test_collector_result)
+            self._live_logger.log(shared_tests_state, test_collector_result)
 
-                    if exit_first and shared_tests_state.any_failed_or_broken():
-                        pool.terminate()
-                        return
-
-                    results.get()
-            except KeyboardInterrupt:
+            if exit_first and shared_tests_state.any_failed_or_broken():
+                workers_pool.close()
                 return
 
+            results.get()
+        except KeyboardInterrupt:
+            workers_pool.close()
+            # A caller reusing workers across runs (e.g. `--watch`) has to stop running tests too.
+            if not is_workers_pool_owned:
+                raise
+            return
+        finally:
+            if is_workers_pool_owned:
+                workers_pool.close()
 
-# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
-def _init_worker():
-    # Prevent showing a stacktrace on CMD/CTRL+C.
-    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    @staticmethod
+    def _schedule_test_suites(
+        test_suites: List[TestSuite],
+        parts_count: int,
+        test_timings_history: Optional[TestTimingsHistory] = None,
+    ) -> List[TestSuite]:
+        """
+        Test suites (or their parts) known to take the longest are scheduled first,
+        so a slow test suite doesn't start when other workers are about to finish.
+        """
+        scheduled_test_suites = [
+            test_suite_part
+            for test_suite in test_suites
+            for test_suite_part in test_suite.split(parts_count)
+        ]
+        if test_timings_history is not None:
+            scheduled_test_suites.sort(
+                key=test_timings_history.estimate_test_suite_duration, reverse=True
+            )
+        return scheduled_test_suites
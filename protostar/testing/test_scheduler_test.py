@@ -0,0 +1,99 @@
+# pylint: disable=protected-access
+
+from pathlib import Path
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .test_collector import TestCollector
+from .test_results import PassedTestCaseResult
+from .test_scheduler import TestScheduler
+from .test_suite import TestCase, TestSuite
+from .test_timings_history import TestTimingsHistory
+
+
+def create_test_suite(name: str) -> TestSuite:
+    test_path = Path(f"test_{name}.cairo")
+    return TestSuite(
+        test_path=test_path,
+        test_cases=[TestCase(test_path=test_path, test_fn_name="test_case")],
+    )
+
+
+def test_scheduling_longest_test_suites_first():
+    test_suites = [create_test_suite(name) for name in ["fast", "slow", "new"]]
+    history = TestTimingsHistory()
+    history.record(
+        [
+            PassedTestCaseResult(
+                file_path=Path(f"test_{name}.cairo"),
+                test_case_name="test_case",
+                captured_stdout={},
+                execution_time=execution_time,
+                execution_resources=None,
+            )
+            for name, execution_time in [("fast", 1.0), ("slow", 5.0)]
+        ]
+    )
+
+    scheduled_test_suites = TestScheduler._schedule_test_suites(
+        test_suites, parts_count=1, test_timings_history=history
+    )
+
+    assert [test_suite.test_path.name for test_suite in scheduled_test_suites] == [
+        "test_slow.cairo",
+        "test_new.cairo",
+        "test_fast.cairo",
+    ]
+
+
+def test_keeping_collected_order_without_history():
+    test_suites = [create_test_suite(name) for name in ["a", "b", "c"]]
+
+    assert (
+        TestScheduler._schedule_test_suites(test_suites, parts_count=1) == test_suites
+    )
+
+
+def run_interrupted_scheduler(workers_pool: Optional[MagicMock]):
+    live_logger = MagicMock()
+    live_logger.log.side_effect = KeyboardInterrupt()
+
+    TestScheduler(live_logger=live_logger, worker=MagicMock()).run(
+        test_collector_result=TestCollector.Result(
+            test_suites=[create_test_suite("a")]
+        ),
+        include_paths=[],
+        disable_hint_validation=False,
+        exit_first=False,
+        testing_seed=0,
+        workers_pool=workers_pool,
+    )
+
+
+@pytest.fixture(name="workers_pool")
+def workers_pool_fixture() -> MagicMock:
+    workers_pool = MagicMock()
+    workers_pool.acquire.return_value = (MagicMock(), MagicMock())
+    return workers_pool
+
+
+def test_propagating_interrupt_to_caller_reusing_workers(workers_pool: MagicMock):
+    with pytest.raises(KeyboardInterrupt):
+        run_interrupted_scheduler(workers_pool)
+
+    workers_pool.close.assert_called()
+
+
+def test_stopping_interrupted_run_with_own_workers(
+    workers_pool: MagicMock, mocker: MockerFixture
+):
+    mocker.patch(
+        "protostar.testing.test_scheduler.TestWorkersPool", return_value=workers_pool
+    )
+
+    run_interrupted_scheduler(workers_pool=None)
+
+    workers_pool.close.assert_called()
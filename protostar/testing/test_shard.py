@@ -0,0 +1,91 @@
+import heapq
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from protostar.protostar_exception import ProtostarException
+
+from .test_collector import TestCollector
+from .test_suite import TestSuite
+from .test_timings_history import TestTimingsHistory
+
+SHARD_PATTERN = re.compile(r"^(\d+)/(\d+)$")
+
+
+@dataclass(frozen=True)
+class TestShard:
+    """
+    One of ``total`` disjoint parts of collected test suites. ``index`` starts from 1.
+    """
+
+    index: int
+    total: int
+
+    @classmethod
+    def parse(cls, value: str) -> "TestShard":
+        match = SHARD_PATTERN.match(value.strip())
+        if match is None:
+            raise ProtostarException(
+                f'Invalid shard "{value}"', "Expected format: INDEX/TOTAL, e.g. 1/4."
+            )
+        index, total = int(match.group(1)), int(match.group(2))
+        if not 1 <= index <= total:
+            raise ProtostarException(
+                f'Invalid shard "{value}"',
+                "INDEX must be between 1 and TOTAL.",
+            )
+        return cls(index=index, total=total)
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.total}"
+
+    def select(
+        self,
+        test_collector_result: TestCollector.Result,
+        test_timings_history: Optional[TestTimingsHistory] = None,
+    ) -> TestCollector.Result:
+        """
+        Test suites are assigned to shards greedily, longest first, to the shard with the smallest
+        total duration. Durations are estimated from the test timings history if it isn't empty,
+        otherwise by the number of test cases. Every shard computes the same assignment,
+        as long as all shards collect the same test suites and use the same history.
+        """
+        shards_test_suites = self._partition(
+            test_collector_result.test_suites, test_timings_history
+        )
+        broken_test_suites = sorted(
+            test_collector_result.broken_test_suites,
+            key=lambda broken_test_suite: str(broken_test_suite.file_path),
+        )
+        return TestCollector.Result(
+            test_suites=shards_test_suites[self.index - 1],
+            broken_test_suites=broken_test_suites[self.index - 1 :: self.total],
+            duration=test_collector_result.duration,
+            imported_modules=test_collector_result.imported_modules,
+        )
+
+    def _partition(
+        self,
+        test_suites: List[TestSuite],
+        test_timings_history: Optional[TestTimingsHistory],
+    ) -> List[List[TestSuite]]:
+        def estimate_duration(test_suite: TestSuite) -> float:
+            if test_timings_history is None or test_timings_history.is_empty():
+                return len(test_suite.test_cases)
+            return test_timings_history.estimate_test_suite_duration(test_suite)
+
+        estimated_test_suites = sorted(
+            ((estimate_duration(test_suite), test_suite) for test_suite in test_suites),
+            key=lambda item: (-item[0], str(item[1].test_path)),
+        )
+        shards_test_suites: List[List[TestSuite]] = [[] for _ in range(self.total)]
+        shards_durations: List[Tuple[float, int]] = [
+            (0.0, shard_index) for shard_index in range(self.total)
+        ]
+        for estimated_duration, test_suite in estimated_test_suites:
+            duration, shard_index = heapq.heappop(shards_durations)
+            shards_test_suites[shard_index].append(test_suite)
+            heapq.heappush(
+                shards_durations, (duration + estimated_duration, shard_index)
+            )
+        return shards_test_suites
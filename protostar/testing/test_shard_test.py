@@ -0,0 +1,138 @@
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from protostar.protostar_exception import ProtostarException
+
+from .test_collector import TestCollector
+from .test_results import BrokenTestSuiteResult, PassedTestCaseResult
+from .test_shard import TestShard
+from .test_suite import TestCase, TestSuite
+from .test_timings_history import TestTimingsHistory
+
+
+def create_test_suite(name: str, test_cases_count: int) -> TestSuite:
+    test_path = Path(f"test_{name}.cairo")
+    return TestSuite(
+        test_path=test_path,
+        test_cases=[
+            TestCase(test_path=test_path, test_fn_name=f"test_{index}")
+            for index in range(test_cases_count)
+        ],
+    )
+
+
+def select_test_suite_names(
+    shard: TestShard,
+    test_suites: List[TestSuite],
+    test_timings_history: Optional[TestTimingsHistory] = None,
+) -> List[str]:
+    return [
+        test_suite.test_path.name
+        for test_suite in shard.select(
+            TestCollector.Result(test_suites=test_suites), test_timings_history
+        ).test_suites
+    ]
+
+
+def test_parsing():
+    assert TestShard.parse("2/3") == TestShard(index=2, total=3)
+    assert str(TestShard.parse("2/3")) == "2/3"
+
+
+@pytest.mark.parametrize("value", ["0/3", "4/3", "1", "a/b", "1/0"])
+def test_parsing_invalid_shard(value: str):
+    with pytest.raises(ProtostarException):
+        TestShard.parse(value)
+
+
+def test_shards_are_disjoint_and_cover_all_test_suites():
+    test_suites = [create_test_suite(str(index), index % 4 + 1) for index in range(10)]
+
+    selected_test_suites = [
+        select_test_suite_names(TestShard(index=index, total=3), test_suites)
+        for index in range(1, 4)
+    ]
+
+    all_selected_names = [name for names in selected_test_suites for name in names]
+    assert sorted(all_selected_names) == sorted(
+        test_suite.test_path.name for test_suite in test_suites
+    )
+
+
+def test_balancing_by_test_cases_count_without_history():
+    test_suites = [
+        create_test_suite("big", 4),
+        create_test_suite("medium", 3),
+        create_test_suite("small", 1),
+    ]
+
+    assert select_test_suite_names(TestShard(1, 2), test_suites) == ["test_big.cairo"]
+    assert select_test_suite_names(TestShard(2, 2), test_suites) == [
+        "test_medium.cairo",
+        "test_small.cairo",
+    ]
+
+
+def test_balancing_by_history():
+    test_suites = [create_test_suite("a", 1), create_test_suite("b", 3)]
+    history = TestTimingsHistory()
+    history.record(
+        [
+            PassedTestCaseResult(
+                file_path=Path("test_a.cairo"),
+                test_case_name="test_0",
+                captured_stdout={},
+                execution_time=10.0,
+                execution_resources=None,
+            )
+        ]
+    )
+
+    assert select_test_suite_names(TestShard(1, 2), test_suites, history) == [
+        "test_b.cairo"
+    ]
+    assert select_test_suite_names(TestShard(2, 2), test_suites, history) == [
+        "test_a.cairo"
+    ]
+
+
+def test_selection_does_not_depend_on_collection_order():
+    test_suites = [create_test_suite(str(index), 1) for index in range(5)]
+
+    assert select_test_suite_names(
+        TestShard(1, 2), test_suites
+    ) == select_test_suite_names(TestShard(1, 2), list(reversed(test_suites)))
+
+
+def test_broken_test_suites_are_distributed():
+    broken_test_suites = [
+        BrokenTestSuiteResult(
+            file_path=Path(f"test_{index}.cairo"),
+            test_case_names=[],
+            exception=Exception(),
+        )
+        for index in range(3)
+    ]
+    test_collector_result = TestCollector.Result(
+        test_suites=[], broken_test_suites=broken_test_suites
+    )
+
+    assert [
+        len(TestShard(index, 2).select(test_collector_result).broken_test_suites)
+        for index in [1, 2]
+    ] == [2, 1]
+
+
+def test_keeping_imported_modules_of_collected_test_suites():
+    test_suites = [create_test_suite(str(index), 1) for index in range(2)]
+    imported_modules = {
+        test_suite.test_path: ["src.library"] for test_suite in test_suites
+    }
+
+    selected = TestShard(index=1, total=2).select(
+        TestCollector.Result(test_suites=test_suites, imported_modules=imported_modules)
+    )
+
+    assert selected.imported_modules == imported_modules
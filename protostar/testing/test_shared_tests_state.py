@@ -1,29 +1,104 @@
 import ctypes
-from multiprocessing.managers import SyncManager
+import multiprocessing
+import queue
+import time
+from collections import deque
+from typing import ClassVar, Deque, List, Optional
 
 from .test_collector import TestCollector
 from .test_results import PassedTestCaseResult, TestResult
 
 
-class SharedTestsState:
-    def __init__(
-        self,
-        test_collector_result: "TestCollector.Result",
-        manager: SyncManager,
-    ) -> None:
-        self._shared_queue = manager.Queue()
-        self._any_failed_or_broken_shared_value = manager.Value(
+class SharedTestsState:  # pylint: disable=too-many-instance-attributes
+    """
+    Transports test results from workers to the main process through a pipe, in batches,
+    and shares the "any test failed or broken" flag in shared memory, so neither requires
+    a round trip to a manager process.
+
+    Pipes and shared memory can be passed to a process only when it is started, so pool workers
+    receive the state with ``register_in_worker`` called by the pool initializer.
+    """
+
+    BATCH_SIZE = 64
+    BATCH_MAX_DELAY = 0.05
+    """
+    Buffered results are sent when there are ``BATCH_SIZE`` of them, when ``BATCH_MAX_DELAY`` seconds
+    passed since results were sent last time (checked on every result and by ``flush_if_delayed``
+    before a test starts, so results aren't held back by a slow test), or when a test fails or breaks.
+    """
+
+    _worker_instance: ClassVar[Optional["SharedTestsState"]] = None
+
+    def __init__(self, test_collector_result: "TestCollector.Result") -> None:
+        self._results_reader, self._results_writer = multiprocessing.Pipe(duplex=False)
+        self._results_writer_lock = multiprocessing.Lock()
+        self._any_failed_or_broken_shared_value = multiprocessing.RawValue(
             ctypes.c_bool,
             (len(test_collector_result.broken_test_suites) > 0),
         )
+        self._received_results: Deque[TestResult] = deque()
+        self._buffered_results: List[TestResult] = []
+        self._last_flush_time = 0.0
+
+    def reset(self, test_collector_result: "TestCollector.Result") -> None:
+        """
+        Prepare the state for another run by the same workers.
+        All results of the previous run must have been received.
+        """
+        self._any_failed_or_broken_shared_value.value = (
+            len(test_collector_result.broken_test_suites) > 0
+        )
+        self._received_results.clear()
+
+    def register_in_worker(self) -> None:
+        SharedTestsState._worker_instance = self
+
+    @classmethod
+    def from_worker(cls) -> "SharedTestsState":
+        assert (
+            cls._worker_instance is not None
+        ), "SharedTestsState was not registered in this worker."
+        return cls._worker_instance
 
     def get_result(self) -> TestResult:
-        return self._shared_queue.get(block=True, timeout=1000)
+        if not self._received_results:
+            if not self._results_reader.poll(timeout=1000):
+                raise queue.Empty()
+            self._received_results.extend(self._results_reader.recv())
+        return self._received_results.popleft()
 
     def put_result(self, item: TestResult) -> None:
-        if not isinstance(item, PassedTestCaseResult):
+        is_passed = isinstance(item, PassedTestCaseResult)
+        if not is_passed:
             self._any_failed_or_broken_shared_value.value = True
-        self._shared_queue.put(item)
+
+        self._buffered_results.append(item)
+
+        if not is_passed or len(self._buffered_results) >= self.BATCH_SIZE:
+            self.flush()
+        else:
+            self.flush_if_delayed()
+
+    def flush_if_delayed(self) -> None:
+        """
+        Send buffered results if ``BATCH_MAX_DELAY`` seconds passed since results were sent last time.
+        """
+        if (
+            self._buffered_results
+            and time.perf_counter() - self._last_flush_time >= self.BATCH_MAX_DELAY
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Send buffered results to the main process.
+        """
+        if not self._buffered_results:
+            return
+        with self._results_writer_lock:
+            self._results_writer.send(self._buffered_results)
+        self._buffered_results = []
+        self._last_flush_time = time.perf_counter()
 
     def any_failed_or_broken(self) -> bool:
         return self._any_failed_or_broken_shared_value.value
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+
+from .test_collector import TestCollector
+from .test_results import BrokenTestSuiteResult, PassedTestCaseResult, TestResult
+from .test_shared_tests_state import SharedTestsState
+
+
+def passed_result(test_case_name: str) -> PassedTestCaseResult:
+    return PassedTestCaseResult(
+        file_path=Path("test_foo.cairo"),
+        test_case_name=test_case_name,
+        captured_stdout={},
+        execution_time=0.0,
+        execution_resources=None,
+    )
+
+
+def broken_result() -> TestResult:
+    return BrokenTestSuiteResult(
+        file_path=Path("test_foo.cairo"),
+        test_case_names=["test_broken"],
+        exception=Exception(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def never_flush_due_to_delay(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(SharedTestsState, "BATCH_MAX_DELAY", float("inf"))
+
+
+def test_passed_results_are_sent_in_batches():
+    state = SharedTestsState(TestCollector.Result(test_suites=[]))
+
+    for index in range(state.BATCH_SIZE - 1):
+        state.put_result(passed_result(f"test_{index}"))
+    assert not state._results_reader.poll()  # pylint: disable=protected-access
+
+    state.put_result(passed_result("test_last"))
+    results = [state.get_result() for _ in range(state.BATCH_SIZE)]
+
+    assert [result.test_case_name for result in results][-1] == "test_last"
+    assert not state.any_failed_or_broken()
+
+
+def test_broken_result_is_sent_immediately():
+    state = SharedTestsState(TestCollector.Result(test_suites=[]))
+
+    state.put_result(passed_result("test_passed"))
+    state.put_result(broken_result())
+
+    assert isinstance(state.get_result(), PassedTestCaseResult)
+    assert isinstance(state.get_result(), BrokenTestSuiteResult)
+    assert state.any_failed_or_broken()
+
+
+def test_flushing_sends_buffered_results():
+    state = SharedTestsState(TestCollector.Result(test_suites=[]))
+
+    state.put_result(passed_result("test_passed"))
+    state.flush()
+
+    assert state.get_result().test_case_name == "test_passed"
+
+
+def test_flushing_buffered_results_after_delay(monkeypatch: pytest.MonkeyPatch):
+    state = SharedTestsState(TestCollector.Result(test_suites=[]))
+    state.put_result(passed_result("test_passed"))
+    state.flush_if_delayed()
+    assert not state._results_reader.poll()  # pylint: disable=protected-access
+
+    monkeypatch.setattr(SharedTestsState, "BATCH_MAX_DELAY", 0.0)
+    state.flush_if_delayed()
+
+    assert state.get_result().test_case_name == "test_passed"
@@ -1,3 +1,4 @@
+import dataclasses
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
@@ -18,3 +19,25 @@ class TestSuite:
 
     def collect_test_case_names(self) -> List[str]:
         return [tc.test_fn_name for tc in self.test_cases]
+
+    def split(self, parts_count: int) -> List["TestSuite"]:
+        """
+        Splits test cases into at most ``parts_count`` contiguous, similarly sized test suites.
+        Each part keeps the path and the setup hook of this test suite.
+        """
+        assert (
+            parts_count > 0
+        ), "Test suite can only be split into positive number of parts."
+
+        parts_count = min(parts_count, len(self.test_cases)) or 1
+        part_size, remainder = divmod(len(self.test_cases), parts_count)
+
+        parts: List[TestSuite] = []
+        start = 0
+        for part_index in range(parts_count):
+            end = start + part_size + (1 if part_index < remainder else 0)
+            parts.append(
+                dataclasses.replace(self, test_cases=self.test_cases[start:end])
+            )
+            start = end
+        return parts
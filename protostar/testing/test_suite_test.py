@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from .test_suite import TestCase, TestSuite
+
+
+def make_test_suite(test_cases_count: int) -> TestSuite:
+    test_path = Path("test_foo.cairo")
+    return TestSuite(
+        test_path=test_path,
+        test_cases=[
+            TestCase(test_path=test_path, test_fn_name=f"test_{i}")
+            for i in range(test_cases_count)
+        ],
+        setup_fn_name="__setup__",
+    )
+
+
+def test_splitting_keeps_all_test_cases_in_order():
+    test_suite = make_test_suite(10)
+
+    parts = test_suite.split(3)
+
+    assert [len(part.test_cases) for part in parts] == [4, 3, 3]
+    assert [
+        test_case for part in parts for test_case in part.test_cases
+    ] == test_suite.test_cases
+    assert all(part.setup_fn_name == "__setup__" for part in parts)
+    assert all(part.test_path == test_suite.test_path for part in parts)
+
+
+def test_splitting_into_more_parts_than_test_cases():
+    parts = make_test_suite(2).split(8)
+
+    assert [part.collect_test_case_names() for part in parts] == [
+        ["test_0"],
+        ["test_1"],
+    ]
+
+
+def test_splitting_into_one_part():
+    test_suite = make_test_suite(3)
+
+    assert test_suite.split(1) == [test_suite]
+
+
+def test_splitting_empty_test_suite():
+    test_suite = make_test_suite(0)
+
+    assert test_suite.split(4) == [test_suite]
@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from statistics import mean
+from typing import Dict, Iterable, List, Optional
+
+from .test_results import (
+    CachedPassedTestCaseResult,
+    SkippedTestCaseResult,
+    TestResult,
+    TimedTestCaseResult,
+)
+from .test_suite import TestSuite
+
+TestSuiteTimings = Dict[str, List[float]]
+"""Recent execution times of each test case of a test suite, the latest last."""
+
+
+class TestTimingsHistory:
+    """
+    Execution times of test cases measured in recent runs, grouped by test suites.
+
+    A test case's execution time includes the `__setup__` hook of its test suite,
+    so the duration of a test suite (or a part of it) is estimated as a sum of estimated
+    durations of its test cases.
+    """
+
+    MAX_RECORDED_RUNS = 10
+
+    def __init__(self, test_suites: Optional[Dict[str, TestSuiteTimings]] = None):
+        self._test_suites: Dict[str, TestSuiteTimings] = test_suites or {}
+        self._average_test_case_duration: Optional[float] = None
+
+    @classmethod
+    def load(cls, file_path: Path) -> "TestTimingsHistory":
+        try:
+            content = json.loads(file_path.read_text("utf-8"))
+            return cls(
+                {
+                    test_suite_path: {
+                        test_case_name: [float(time) for time in times]
+                        for test_case_name, times in test_suite_timings.items()
+                    }
+                    for test_suite_path, test_suite_timings in content[
+                        "test_suites"
+                    ].items()
+                }
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # A missing or malformed history only makes scheduling less accurate.
+            return cls()
+
+    def save(self, file_path: Path) -> None:
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(
+                dir=file_path.parent, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                    json.dump({"test_suites": self._test_suites}, file)
+                os.replace(tmp_path, file_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def copy(self) -> "TestTimingsHistory":
+        return TestTimingsHistory(
+            {
+                test_suite_path: {
+                    test_case_name: list(times)
+                    for test_case_name, times in test_suite_timings.items()
+                }
+                for test_suite_path, test_suite_timings in self._test_suites.items()
+            }
+        )
+
+    def record(self, test_results: Iterable[TestResult]) -> None:
+        for test_result in test_results:
+            if not isinstance(test_result, TimedTestCaseResult) or isinstance(
+                test_result, (SkippedTestCaseResult, CachedPassedTestCaseResult)
+            ):
+                continue
+            times = self._test_suites.setdefault(
+                _to_key(test_result.file_path), {}
+            ).setdefault(test_result.test_case_name, [])
+            times.append(test_result.execution_time)
+            del times[: -self.MAX_RECORDED_RUNS]
+        self._average_test_case_duration = None
+
+    def is_empty(self) -> bool:
+        return not any(self._test_suites.values())
+
+    def get_test_case_times(self, test_path: Path, test_case_name: str) -> List[float]:
+        return self._test_suites.get(_to_key(test_path), {}).get(test_case_name, [])
+
+    def estimate_test_case_duration(
+        self, test_path: Path, test_case_name: str
+    ) -> Optional[float]:
+        times = self.get_test_case_times(test_path, test_case_name)
+        return mean(times) if times else None
+
+    def estimate_test_suite_duration(self, test_suite: TestSuite) -> float:
+        """
+        Test cases without recorded times are assumed to take as long as an average test case.
+        """
+        duration = 0.0
+        for test_case_name in test_suite.collect_test_case_names():
+            estimate = self.estimate_test_case_duration(
+                test_suite.test_path, test_case_name
+            )
+            if estimate is None:
+                estimate = self._get_average_test_case_duration()
+            duration += estimate
+        return duration
+
+    def _get_average_test_case_duration(self) -> float:
+        if self._average_test_case_duration is None:
+            estimates = [
+                mean(times)
+                for test_suite_timings in self._test_suites.values()
+                for times in test_suite_timings.values()
+                if times
+            ]
+            self._average_test_case_duration = mean(estimates) if estimates else 0.0
+        return self._average_test_case_duration
+
+
+def _to_key(test_path: Path) -> str:
+    return str(test_path.resolve())
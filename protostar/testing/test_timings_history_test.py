@@ -0,0 +1,122 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from .test_results import PassedTestCaseResult, SkippedTestCaseResult
+from .test_suite import TestCase, TestSuite
+from .test_timings_history import TestTimingsHistory
+
+
+def passed_result(
+    test_path: Path, test_case_name: str, execution_time: float
+) -> PassedTestCaseResult:
+    return PassedTestCaseResult(
+        file_path=test_path,
+        test_case_name=test_case_name,
+        captured_stdout={},
+        execution_time=execution_time,
+        execution_resources=None,
+    )
+
+
+def create_test_suite(test_path: Path, test_case_names: List[str]) -> TestSuite:
+    return TestSuite(
+        test_path=test_path,
+        test_cases=[
+            TestCase(test_path=test_path, test_fn_name=test_case_name)
+            for test_case_name in test_case_names
+        ],
+    )
+
+
+def test_estimating_test_case_duration_from_recent_runs(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(TestTimingsHistory, "MAX_RECORDED_RUNS", 2)
+    history = TestTimingsHistory()
+    test_path = Path("test_foo.cairo")
+
+    for execution_time in [10.0, 1.0, 3.0]:
+        history.record([passed_result(test_path, "test_a", execution_time)])
+
+    assert history.get_test_case_times(test_path, "test_a") == [1.0, 3.0]
+    assert history.estimate_test_case_duration(test_path, "test_a") == 2.0
+    assert history.estimate_test_case_duration(test_path, "test_b") is None
+
+
+def test_skipped_test_cases_are_not_recorded():
+    history = TestTimingsHistory()
+    test_path = Path("test_foo.cairo")
+
+    history.record(
+        [
+            SkippedTestCaseResult(
+                file_path=test_path,
+                test_case_name="test_skipped",
+                captured_stdout={},
+                execution_time=0.0,
+                reason=None,
+            )
+        ]
+    )
+
+    assert history.get_test_case_times(test_path, "test_skipped") == []
+
+
+def test_unknown_test_cases_are_estimated_as_average_test_case():
+    history = TestTimingsHistory()
+    test_path = Path("test_foo.cairo")
+    history.record(
+        [
+            passed_result(test_path, "test_a", 1.0),
+            passed_result(test_path, "test_b", 3.0),
+        ]
+    )
+
+    assert (
+        history.estimate_test_suite_duration(
+            create_test_suite(test_path, ["test_a", "test_new"])
+        )
+        == 3.0
+    )
+
+
+def test_saving_and_loading(tmp_path: Path):
+    history = TestTimingsHistory()
+    test_path = Path("test_foo.cairo")
+    history.record([passed_result(test_path, "test_a", 1.5)])
+    history_path = tmp_path / "cache" / "test_timings.json"
+
+    history.save(history_path)
+
+    assert TestTimingsHistory.load(history_path).get_test_case_times(
+        test_path, "test_a"
+    ) == [1.5]
+
+
+def test_loading_malformed_history(tmp_path: Path):
+    history_path = tmp_path / "test_timings.json"
+    history_path.write_text('{"test_suites": []}', encoding="utf-8")
+
+    history = TestTimingsHistory.load(history_path)
+
+    assert history.get_test_case_times(Path("test_foo.cairo"), "test_a") == []
+    assert (
+        TestTimingsHistory.load(tmp_path / "missing.json").estimate_test_case_duration(
+            Path("test_foo.cairo"), "test_a"
+        )
+        is None
+    )
+
+
+def test_copies_are_isolated():
+    history = TestTimingsHistory()
+    test_path = Path("test_foo.cairo")
+    history.record([passed_result(test_path, "test_a", 1.0)])
+
+    copied_history = history.copy()
+    copied_history.record([passed_result(test_path, "test_a", 3.0)])
+
+    assert history.get_test_case_times(test_path, "test_a") == [1.0]
+    assert copied_history.get_test_case_times(test_path, "test_a") == [1.0, 3.0]
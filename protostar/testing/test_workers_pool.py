@@ -0,0 +1,65 @@
+import multiprocessing
+import signal
+from multiprocessing.pool import Pool
+from typing import Optional, Tuple
+
+from .test_collector import TestCollector
+from .test_shared_tests_state import SharedTestsState
+
+
+class TestWorkersPool:
+    """
+    Worker processes which can be reused by consecutive test runs (e.g. in the watch mode),
+    so the interpreter start-up and objects built in workers, such as the empty state,
+    are paid for once.
+
+    Every run starts a new generation. Workers forget test suites and contracts prepared
+    by previous generations, because their sources might have changed in the meantime.
+    """
+
+    def __init__(self, processes_count: int):
+        self._processes_count = processes_count
+        self._pool: Optional[Pool] = None
+        self._shared_tests_state: Optional[SharedTestsState] = None
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def acquire(
+        self, test_collector_result: "TestCollector.Result"
+    ) -> Tuple[Pool, SharedTestsState]:
+        self._generation += 1
+        if self._pool is None or self._shared_tests_state is None:
+            self._shared_tests_state = SharedTestsState(
+                test_collector_result=test_collector_result
+            )
+            # The pool outlives a single run, so it's closed explicitly.
+            # pylint: disable=consider-using-with
+            self._pool = multiprocessing.Pool(
+                processes=self._processes_count,
+                initializer=_init_worker,
+                initargs=(self._shared_tests_state,),
+            )
+        else:
+            self._shared_tests_state.reset(test_collector_result)
+        return self._pool, self._shared_tests_state
+
+    def close(self) -> None:
+        """
+        Terminate workers, even if they are still running tests (e.g. after an interrupted run).
+        The next run starts new workers.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+        self._pool = None
+        self._shared_tests_state = None
+
+
+# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
+def _init_worker(shared_tests_state: SharedTestsState):
+    # Prevent showing a stacktrace on CMD/CTRL+C.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    shared_tests_state.register_in_worker()
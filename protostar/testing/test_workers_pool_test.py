@@ -0,0 +1,41 @@
+import multiprocessing
+import os
+
+from .test_collector import TestCollector
+from .test_workers_pool import TestWorkersPool
+
+
+def _get_pid(_: int) -> int:
+    return os.getpid()
+
+
+def test_reusing_workers_between_runs():
+    workers_pool = TestWorkersPool(processes_count=2)
+    try:
+        pool, first_shared_tests_state = workers_pool.acquire(TestCollector.Result([]))
+        pool.map(_get_pid, range(4), chunksize=1)
+        worker_pids = {process.pid for process in multiprocessing.active_children()}
+
+        pool, second_shared_tests_state = workers_pool.acquire(TestCollector.Result([]))
+        second_pids = set(pool.map(_get_pid, range(4), chunksize=1))
+
+        assert second_shared_tests_state is first_shared_tests_state
+        assert second_pids <= worker_pids
+        assert workers_pool.generation == 2
+    finally:
+        workers_pool.close()
+
+
+def test_starting_new_workers_after_closing():
+    workers_pool = TestWorkersPool(processes_count=1)
+    try:
+        pool, _ = workers_pool.acquire(TestCollector.Result([]))
+        first_pids = set(pool.map(_get_pid, range(2)))
+        workers_pool.close()
+
+        pool, _ = workers_pool.acquire(TestCollector.Result([]))
+        second_pids = set(pool.map(_get_pid, range(2)))
+
+        assert first_pids.isdisjoint(second_pids)
+    finally:
+        workers_pool.close()
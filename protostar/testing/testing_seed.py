@@ -1,3 +1,4 @@
+import hashlib
 import os
 from typing import Optional
 
@@ -10,3 +11,11 @@ def determine_testing_seed(seed: Optional[Seed]) -> Seed:
 
 def random_seed() -> Seed:
     return int.from_bytes(os.urandom(4), byteorder="little", signed=False)
+
+
+def derive_seed(seed: Seed, index: int) -> Seed:
+    """
+    Deterministically derive a distinct seed, e.g. for each of processes running the same fuzz test.
+    """
+    digest = hashlib.sha256(f"{seed}/{index}".encode()).digest()
+    return int.from_bytes(digest[:4], byteorder="little", signed=False)
@@ -1,7 +1,8 @@
+import dataclasses
 from collections import defaultdict
 from logging import Logger
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from protostar.protostar_exception import ProtostarExceptionSilent
 from protostar.testing.test_results import (
@@ -15,13 +16,20 @@ from protostar.testing.test_results import (
 )
 from protostar.utils.log_color_provider import LogColorProvider, log_color_provider
 
+from .test_timings_history import TestTimingsHistory
 from .testing_seed import Seed
 
 
 # pylint: disable=too-many-instance-attributes
 class TestingSummary:
-    def __init__(self, case_results: List[TestResult], testing_seed: Seed) -> None:
+    def __init__(
+        self,
+        case_results: List[TestResult],
+        testing_seed: Seed,
+        test_timings_history: Optional[TestTimingsHistory] = None,
+    ) -> None:
         self.testing_seed = testing_seed
+        self.test_timings_history = test_timings_history
         self.case_results = []
         self.test_suites_mapping: Dict[Path, List[TestResult]] = defaultdict(list)
         self.passed: List[PassedTestCaseResult] = []
@@ -32,8 +40,13 @@ class TestingSummary:
         self.extend(case_results)
 
     def extend(self, case_results: List[TestResult]):
-        self.case_results += case_results
         for case_result in case_results:
+            if isinstance(
+                case_result, BrokenTestSuiteResult
+            ) and self._merge_broken_test_suite_part(case_result):
+                continue
+
+            self.case_results.append(case_result)
             self.test_suites_mapping[case_result.file_path].append(case_result)
 
             if isinstance(case_result, PassedTestCaseResult):
@@ -47,6 +60,46 @@ class TestingSummary:
             if isinstance(case_result, SkippedTestCaseResult):
                 self.skipped.append(case_result)
 
+    def has_broken_test_suite(self, file_path: Path) -> bool:
+        return any(
+            broken_suite.file_path == file_path for broken_suite in self.broken_suites
+        )
+
+    def _merge_broken_test_suite_part(
+        self, broken_suite_part: BrokenTestSuiteResult
+    ) -> bool:
+        """
+        Parts of a split test suite break on the same compilation or ``__setup__`` error,
+        so the test suite is reported once, with test cases of all parts.
+        """
+        for index, broken_suite in enumerate(self.broken_suites):
+            if broken_suite.file_path != broken_suite_part.file_path:
+                continue
+            merged_broken_suite = dataclasses.replace(
+                broken_suite,
+                test_case_names=[
+                    *broken_suite.test_case_names,
+                    *broken_suite_part.test_case_names,
+                ],
+            )
+            self.broken_suites[index] = merged_broken_suite
+            self._replace_result(broken_suite, merged_broken_suite)
+            return True
+        return False
+
+    def _replace_result(self, old_result: TestResult, new_result: TestResult) -> None:
+        for results in (
+            self.case_results,
+            self.test_suites_mapping[old_result.file_path],
+        ):
+            results[
+                next(
+                    index
+                    for index, result in enumerate(results)
+                    if result is old_result
+                )
+            ] = new_result
+
     def log(
         self,
         logger: Logger,
@@ -213,6 +266,13 @@ class TestingSummary:
                 )
             )
 
+            if self.test_timings_history is not None:
+                row.append(
+                    self._format_execution_time_trend(
+                        test_case, local_log_color_provider
+                    )
+                )
+
             rows.append(row)
 
         column_widths = [max(map(len, col)) for col in zip(*rows)]
@@ -220,3 +280,29 @@ class TestingSummary:
             "  ".join((val.ljust(width) for val, width in zip(row, column_widths)))
             for row in rows
         )
+
+    def _format_execution_time_trend(
+        self,
+        test_case: TimedTestCaseResult,
+        local_log_color_provider: LogColorProvider,
+    ) -> str:
+        assert self.test_timings_history is not None
+        previous_execution_time = self.test_timings_history.estimate_test_case_duration(
+            test_case.file_path, test_case.test_case_name
+        )
+        if not previous_execution_time:
+            return ""
+        change = (
+            test_case.execution_time - previous_execution_time
+        ) / previous_execution_time
+        return "".join(
+            [
+                local_log_color_provider.colorize(
+                    "GRAY", f"(previous avg={previous_execution_time:.2f}s, "
+                ),
+                local_log_color_provider.colorize(
+                    "RED" if change > 0 else "GREEN", f"{change:+.0%}"
+                ),
+                local_log_color_provider.colorize("GRAY", ")"),
+            ]
+        )
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from .test_results import BrokenTestSuiteResult
+from .testing_summary import TestingSummary
+
+
+def test_merging_broken_parts_of_split_test_suite():
+    exception = Exception()
+    summary = TestingSummary(
+        [
+            BrokenTestSuiteResult(
+                file_path=Path("test_foo.cairo"),
+                test_case_names=["test_first"],
+                exception=exception,
+            )
+        ],
+        testing_seed=0,
+    )
+
+    summary.extend(
+        [
+            BrokenTestSuiteResult(
+                file_path=Path("test_foo.cairo"),
+                test_case_names=["test_second"],
+                exception=exception,
+            )
+        ]
+    )
+
+    assert summary.broken_suites == [
+        BrokenTestSuiteResult(
+            file_path=Path("test_foo.cairo"),
+            test_case_names=["test_first", "test_second"],
+            exception=exception,
+        )
+    ]
+    assert summary.case_results == summary.broken_suites
+    assert summary.test_suites_mapping[Path("test_foo.cairo")] == summary.broken_suites
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from starkware.cairo.lang.compiler.module_reader import ModuleNotFoundException
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+from starkware.starknet.services.api.contract_class import ContractClass
+
+from protostar.utils.compiler.module_index import get_indexed_module_reader
+
+ModuleName = str
+ModuleFingerprint = Tuple[str, str]
+"""Path of the file the module was resolved to and SHA-256 of its content."""
+
+
+class CompilationCache:
+    """
+    Content-addressed store of compiled contracts.
+
+    An entry is addressed by the source files, the compilation settings and the cairo-lang version.
+    Each entry also records the modules imported (transitively) by the sources, so the entry is
+    discarded as soon as any of those modules is modified or resolves to a different file.
+    """
+
+    def __init__(self, cache_dir_path: Path):
+        self._cache_dir_path = cache_dir_path
+
+    def get(
+        self,
+        source_paths: Sequence[Path],
+        include_paths: List[str],
+        settings: Dict[str, Any],
+    ) -> Optional[ContractClass]:
+        cached = self.get_with_dependencies(source_paths, include_paths, settings)
+        return cached[0] if cached is not None else None
+
+    def get_with_dependencies(
+        self,
+        source_paths: Sequence[Path],
+        include_paths: List[str],
+        settings: Dict[str, Any],
+    ) -> Optional[Tuple[ContractClass, List[ModuleName]]]:
+        """
+        Return the cached contract and names of modules it imports (transitively).
+        """
+        try:
+            entry_path = self._get_entry_path(source_paths, include_paths, settings)
+            entry = json.loads(entry_path.read_text("utf-8"))
+            if not are_modules_up_to_date(entry["dependencies"], include_paths):
+                return None
+            return ContractClass.load(entry["contract_class"]), list(
+                entry["dependencies"]
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(
+        self,
+        source_paths: Sequence[Path],
+        include_paths: List[str],
+        settings: Dict[str, Any],
+        dependencies: Iterable[ModuleName],
+        contract_class: ContractClass,
+    ) -> None:
+        try:
+            entry_path = self._get_entry_path(source_paths, include_paths, settings)
+            entry = {
+                "dependencies": fingerprint_modules(dependencies, include_paths),
+                "contract_class": contract_class.dump(),
+            }
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomically(entry_path, json.dumps(entry))
+        except (OSError, ModuleNotFoundException):
+            # The cache is an optimization, failing to populate it must not fail the compilation.
+            pass
+
+    def _get_entry_path(
+        self,
+        source_paths: Sequence[Path],
+        include_paths: List[str],
+        settings: Dict[str, Any],
+    ) -> Path:
+        key_data = {
+            "sources": [
+                [str(path.resolve()), hash_file(str(path))] for path in source_paths
+            ],
+            "include_paths": [os.path.abspath(path) for path in include_paths],
+            "settings": settings,
+            "cairo_lang_version": cairo_lang_version,
+        }
+        key = hashlib.sha256(
+            json.dumps(key_data, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return self._cache_dir_path / f"{key}.json"
+
+    @staticmethod
+    def _write_atomically(path: Path, content: str) -> None:
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+
+def fingerprint_modules(
+    module_names: Iterable[ModuleName], include_paths: List[str]
+) -> Dict[ModuleName, ModuleFingerprint]:
+    module_reader = get_indexed_module_reader(cairo_path=include_paths)
+    result: Dict[ModuleName, ModuleFingerprint] = {}
+    for module_name in module_names:
+        file_path = module_reader.module_to_file_path(module_name)
+        result[module_name] = (file_path, hash_file(file_path))
+    return result
+
+
+def are_modules_up_to_date(
+    fingerprints: Mapping[ModuleName, Sequence[str]], include_paths: List[str]
+) -> bool:
+    """
+    Check if modules still resolve to the same files with the same content.
+    """
+    module_reader = get_indexed_module_reader(cairo_path=include_paths)
+    for module_name, (file_path, file_hash) in fingerprints.items():
+        try:
+            if module_reader.module_to_file_path(module_name) != file_path:
+                return False
+        except ModuleNotFoundException:
+            return False
+        try:
+            if hash_file(file_path) != file_hash:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def hash_file(file_path: str) -> str:
+    with open(file_path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from protostar.utils.compiler.compilation_cache import CompilationCache
+from protostar.utils.compiler.pass_managers import StarknetPassManagerFactory
+from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
+
+CONTRACT_CODE = """%lang starknet
+
+from library import get_value
+
+@view
+func read_value() -> (res: felt) {
+    return (res=get_value());
+}
+"""
+
+LIBRARY_CODE_TEMPLATE = """func get_value() -> felt {{
+    return {value};
+}}
+"""
+
+
+@pytest.fixture(name="project_path")
+def project_path_fixture(tmp_path: Path) -> Path:
+    (tmp_path / "contract.cairo").write_text(CONTRACT_CODE)
+    (tmp_path / "library.cairo").write_text(LIBRARY_CODE_TEMPLATE.format(value=42))
+    return tmp_path
+
+
+@pytest.fixture(name="compiler")
+def compiler_fixture(project_path: Path) -> StarknetCompiler:
+    return StarknetCompiler(
+        config=CompilerConfig(
+            include_paths=[str(project_path)], disable_hint_validation=False
+        ),
+        pass_manager_factory=StarknetPassManagerFactory,
+        cache=CompilationCache(project_path / ".protostar_cache"),
+    )
+
+
+def test_reusing_compiled_contract(
+    compiler: StarknetCompiler, project_path: Path, mocker: MockerFixture
+):
+    contract_class = compiler.compile_contract(project_path / "contract.cairo")
+    run_pass_manager_spy = mocker.spy(compiler, "_run_pass_manager")
+
+    cached_contract_class = compiler.compile_contract(project_path / "contract.cairo")
+
+    run_pass_manager_spy.assert_not_called()
+    assert cached_contract_class.dumps() == contract_class.dumps()
+
+
+def test_recompiling_when_imported_module_changes(
+    compiler: StarknetCompiler, project_path: Path, mocker: MockerFixture
+):
+    contract_class = compiler.compile_contract(project_path / "contract.cairo")
+    (project_path / "library.cairo").write_text(LIBRARY_CODE_TEMPLATE.format(value=7))
+    run_pass_manager_spy = mocker.spy(compiler, "_run_pass_manager")
+
+    recompiled_contract_class = compiler.compile_contract(
+        project_path / "contract.cairo"
+    )
+
+    run_pass_manager_spy.assert_called_once()
+    assert recompiled_contract_class.dumps() != contract_class.dumps()
+
+
+def test_recompiling_when_debug_info_flag_changes(
+    compiler: StarknetCompiler, project_path: Path, mocker: MockerFixture
+):
+    compiler.compile_contract(project_path / "contract.cairo")
+    run_pass_manager_spy = mocker.spy(compiler, "_run_pass_manager")
+
+    contract_class = compiler.compile_contract(
+        project_path / "contract.cairo", add_debug_info=True
+    )
+
+    run_pass_manager_spy.assert_called_once()
+    assert contract_class.program.debug_info is not None
+
+
+def test_ignoring_corrupted_entries(compiler: StarknetCompiler, project_path: Path):
+    contract_class = compiler.compile_contract(project_path / "contract.cairo")
+    for entry_path in (project_path / ".protostar_cache").iterdir():
+        entry_path.write_text("{")
+
+    recompiled_contract_class = compiler.compile_contract(
+        project_path / "contract.cairo"
+    )
+
+    assert recompiled_contract_class.dumps() == contract_class.dumps()
+
+
+def test_reusing_compiled_contract_with_dependencies(
+    compiler: StarknetCompiler, project_path: Path, mocker: MockerFixture
+):
+    _, dependencies = compiler.compile_contract_with_dependencies(
+        project_path / "contract.cairo"
+    )
+    run_pass_manager_spy = mocker.spy(compiler, "_run_pass_manager")
+
+    _, cached_dependencies = compiler.compile_contract_with_dependencies(
+        project_path / "contract.cairo"
+    )
+
+    run_pass_manager_spy.assert_not_called()
+    assert "library" in dependencies
+    assert sorted(cached_dependencies) == sorted(dependencies)
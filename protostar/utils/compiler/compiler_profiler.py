@@ -0,0 +1,182 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from starkware.cairo.lang.compiler.preprocessor.pass_manager import (
+    PassManager,
+    PassManagerContext,
+    Stage,
+)
+
+ASSEMBLY_STAGE_NAME = "assembly"
+
+
+@dataclass
+class StageProfile:
+    calls_count: int = 0
+    total_time: float = 0.0
+    """Wall time in seconds."""
+    allocated_bytes: int = 0
+    """Sum of peaks of memory traced by `tracemalloc` during each call, above the memory traced before the call."""
+    max_allocated_bytes: int = 0
+
+    def add(self, other: "StageProfile") -> None:
+        self.calls_count += other.calls_count
+        self.total_time += other.total_time
+        self.allocated_bytes += other.allocated_bytes
+        self.max_allocated_bytes = max(
+            self.max_allocated_bytes, other.max_allocated_bytes
+        )
+
+
+@dataclass
+class CompilerProfile:
+    stages: Dict[str, StageProfile] = field(default_factory=dict)
+    """Profiles of stages in order of their first call."""
+
+    def add(self, other: "CompilerProfile") -> None:
+        for stage_name, stage_profile in other.stages.items():
+            self.stages.setdefault(stage_name, StageProfile()).add(stage_profile)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "stages": {
+                stage_name: asdict(stage_profile)
+                for stage_name, stage_profile in self.stages.items()
+            }
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CompilerProfile":
+        return cls(
+            stages={
+                stage_name: StageProfile(**stage_profile)
+                for stage_name, stage_profile in data["stages"].items()
+            }
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_json(), indent=2), "utf-8")
+
+    def format(self) -> str:
+        total_time = sum(stage.total_time for stage in self.stages.values())
+        rows: List[List[str]] = [
+            ["Compiler stage", "Calls", "Time", "Time %", "Allocated", "Max allocated"]
+        ]
+        for stage_name, stage in self.stages.items():
+            rows.append(
+                [
+                    stage_name,
+                    str(stage.calls_count),
+                    f"{stage.total_time:.3f}s",
+                    f"{stage.total_time / total_time:.0%}" if total_time else "-",
+                    _format_bytes(stage.allocated_bytes),
+                    _format_bytes(stage.max_allocated_bytes),
+                ]
+            )
+        rows.append(["Total", "", f"{total_time:.3f}s", "", "", ""])
+
+        column_widths = [max(map(len, col)) for col in zip(*rows)]
+        return "\n".join(
+            "  ".join(
+                [row[0].ljust(column_widths[0])]
+                + [val.rjust(width) for val, width in zip(row[1:], column_widths[1:])]
+            ).rstrip()
+            for row in rows
+        )
+
+
+def _format_bytes(bytes_count: int) -> str:
+    return f"{bytes_count / 2**20:.1f}MiB"
+
+
+class CompilerProfiler:
+    """
+    Measures wall time and memory allocated by each stage of pass managers of instrumented compilers,
+    and by the assembly.
+
+    The profiler is pickled together with compilers sent to worker processes. Every process saves
+    its measurements in the profile directory after each compilation, so `collect` gathers
+    compilations from all processes.
+    """
+
+    def __init__(self, profile_dir_path: Optional[Path] = None):
+        self._profile_dir_path = profile_dir_path or Path(
+            tempfile.mkdtemp(prefix="protostar_compiler_profile_")
+        )
+        self._profile = CompilerProfile()
+
+    def instrument(self, pass_manager: PassManager) -> None:
+        pass_manager.stages = [
+            (stage_name, ProfiledStage(stage_name, stage, profiler=self))
+            for stage_name, stage in pass_manager.stages
+        ]
+
+    @contextmanager
+    def measure(self, stage_name: str) -> Iterator[None]:
+        # Tracing slows down Python code several times, so it's enabled only while measuring.
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        traced_memory_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            total_time = time.perf_counter() - start_time
+            _, peak_traced_memory = tracemalloc.get_traced_memory()
+            allocated_bytes = max(peak_traced_memory - traced_memory_before, 0)
+            if not was_tracing:
+                tracemalloc.stop()
+            self._profile.stages.setdefault(stage_name, StageProfile()).add(
+                StageProfile(
+                    calls_count=1,
+                    total_time=total_time,
+                    allocated_bytes=allocated_bytes,
+                    max_allocated_bytes=allocated_bytes,
+                )
+            )
+
+    def flush(self) -> None:
+        """
+        Save measurements made since the last flush to a new file in the profile directory.
+        """
+        if not self._profile.stages:
+            return
+        file_descriptor, _ = tempfile.mkstemp(
+            dir=self._profile_dir_path, prefix=f"{os.getpid()}_", suffix=".json"
+        )
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump(self._profile.to_json(), file)
+        self._profile = CompilerProfile()
+
+    def collect(self) -> CompilerProfile:
+        """
+        Merge measurements saved by all processes and remove the profile directory.
+        """
+        self.flush()
+        profile = CompilerProfile()
+        for path in sorted(self._profile_dir_path.glob("*.json")):
+            profile.add(CompilerProfile.from_json(json.loads(path.read_text("utf-8"))))
+        shutil.rmtree(self._profile_dir_path, ignore_errors=True)
+        return profile
+
+
+class ProfiledStage(Stage):
+    def __init__(self, stage_name: str, stage: Stage, profiler: CompilerProfiler):
+        self.stage_name = stage_name
+        self.stage = stage
+        self._profiler = profiler
+
+    def run(self, context: PassManagerContext):
+        with self._profiler.measure(self.stage_name):
+            return self.stage.run(context)
@@ -0,0 +1,77 @@
+import json
+import tracemalloc
+from pathlib import Path
+
+from protostar.utils.compiler.compiler_profiler import (
+    ASSEMBLY_STAGE_NAME,
+    CompilerProfile,
+    CompilerProfiler,
+    StageProfile,
+)
+from protostar.utils.compiler.pass_managers import StarknetPassManagerFactory
+from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
+
+CONTRACT_CODE = """%lang starknet
+
+@view
+func get_value() -> (res: felt) {
+    return (res=42);
+}
+"""
+
+
+def test_measuring_compilation_stages(tmp_path: Path):
+    contract_path = tmp_path / "contract.cairo"
+    contract_path.write_text(CONTRACT_CODE)
+    profiler = CompilerProfiler(tmp_path / "profile")
+    (tmp_path / "profile").mkdir()
+    compiler = StarknetCompiler(
+        config=CompilerConfig(include_paths=[], disable_hint_validation=False),
+        pass_manager_factory=StarknetPassManagerFactory,
+        profiler=profiler,
+    )
+
+    contract_class = compiler.compile_contract(contract_path)
+    compiler.compile_contract(contract_path)
+    profile = profiler.collect()
+
+    assert [entry["name"] for entry in contract_class.abi] == ["get_value"]
+    assert list(profile.stages) == [
+        *[stage_name for stage_name, _ in compiler.pass_manager.stages],
+        ASSEMBLY_STAGE_NAME,
+    ]
+    for stage_profile in profile.stages.values():
+        assert stage_profile.calls_count == 2
+        assert stage_profile.total_time > 0
+    assert profile.stages["module_collector"].max_allocated_bytes > 0
+    assert not tracemalloc.is_tracing()
+    assert not (tmp_path / "profile").exists()
+
+
+def test_merging_profiles_saved_by_processes(tmp_path: Path):
+    for index in range(2):
+        (tmp_path / f"{index}.json").write_text(
+            json.dumps(
+                CompilerProfile(
+                    stages={
+                        "preprocessor": StageProfile(
+                            calls_count=1,
+                            total_time=1.5,
+                            allocated_bytes=10 * (index + 1),
+                            max_allocated_bytes=10 * (index + 1),
+                        )
+                    }
+                ).to_json()
+            )
+        )
+
+    profile = CompilerProfiler(tmp_path).collect()
+
+    assert profile.stages == {
+        "preprocessor": StageProfile(
+            calls_count=2, total_time=3.0, allocated_bytes=30, max_allocated_bytes=20
+        )
+    }
+    formatted_profile = profile.format()
+    assert "preprocessor" in formatted_profile
+    assert "100%" in formatted_profile
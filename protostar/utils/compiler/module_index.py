@@ -0,0 +1,85 @@
+import os
+from typing import Callable, ClassVar, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from starkware.cairo.lang.compiler.cairo_compile import get_module_reader
+from starkware.cairo.lang.compiler.module_reader import ModuleReader
+
+DirectoryListing = Tuple[Optional[int], FrozenSet[str]]
+"""Modification time of a directory in nanoseconds and names of files in it."""
+
+
+class CairoPathModuleIndex:
+    """
+    Listings of directories on the cairo path, shared by all compilations in this process,
+    so resolving a module looks names up in memory instead of probing every include path.
+
+    Each index checks the modification time of a directory once, when it's first visited,
+    so a long-lived process notices added and removed modules in the next compilation.
+    """
+
+    _listings: ClassVar[Dict[str, DirectoryListing]] = {}
+
+    def __init__(self):
+        self._validated_directories: Set[str] = set()
+
+    def isfile(self, path: str) -> bool:
+        directory, name = os.path.split(path)
+        return name in self._list_files(directory)
+
+    def _list_files(self, directory: str) -> FrozenSet[str]:
+        listing = CairoPathModuleIndex._listings.get(directory)
+        if listing is not None and directory in self._validated_directories:
+            return listing[1]
+
+        mtime = self._get_mtime(directory)
+        if listing is None or listing[0] != mtime:
+            listing = (mtime, self._scan_files(directory))
+            CairoPathModuleIndex._listings[directory] = listing
+        self._validated_directories.add(directory)
+        return listing[1]
+
+    @staticmethod
+    def _get_mtime(directory: str) -> Optional[int]:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _scan_files(directory: str) -> FrozenSet[str]:
+        try:
+            with os.scandir(directory) as entries:
+                return frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError:
+            return frozenset()
+
+
+class IndexedModuleReader(ModuleReader):
+    """
+    `ModuleReader` resolving modules with `CairoPathModuleIndex`.
+    """
+
+    def __init__(
+        self, paths: List[str], cairo_suffix: str, module_index: CairoPathModuleIndex
+    ):
+        super().__init__(paths, cairo_suffix)
+        self._module_index = module_index
+
+    def module_to_file_path(
+        self, module_name: str, isfile: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        return super().module_to_file_path(
+            module_name, isfile=isfile or self._module_index.isfile
+        )
+
+
+def get_indexed_module_reader(cairo_path: List[str]) -> IndexedModuleReader:
+    """
+    `starkware.cairo.lang.compiler.cairo_compile.get_module_reader` resolving modules with a fresh `CairoPathModuleIndex`.
+    """
+    module_reader = get_module_reader(cairo_path=cairo_path)
+    return IndexedModuleReader(
+        paths=module_reader.paths,
+        cairo_suffix=module_reader.cairo_suffix,
+        module_index=CairoPathModuleIndex(),
+    )
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+from starkware.cairo.lang.compiler.module_reader import ModuleNotFoundException
+
+from protostar.utils.compiler.module_index import (
+    CairoPathModuleIndex,
+    get_indexed_module_reader,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_listings_fixture(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(CairoPathModuleIndex, "_listings", {})
+
+
+def test_resolving_modules_by_order_of_paths(tmp_path: Path):
+    (tmp_path / "lib_a" / "utils").mkdir(parents=True)
+    (tmp_path / "lib_b" / "utils").mkdir(parents=True)
+    (tmp_path / "lib_a" / "utils" / "math.cairo").write_text("")
+    (tmp_path / "lib_b" / "utils" / "math.cairo").write_text("")
+    (tmp_path / "lib_b" / "utils" / "string.cairo").write_text("")
+
+    module_reader = get_indexed_module_reader(
+        cairo_path=[str(tmp_path / "lib_a"), str(tmp_path / "lib_b")]
+    )
+
+    assert module_reader.module_to_file_path("utils.math") == str(
+        tmp_path / "lib_a" / "utils" / "math.cairo"
+    )
+    assert module_reader.module_to_file_path("utils.string") == str(
+        tmp_path / "lib_b" / "utils" / "string.cairo"
+    )
+    with pytest.raises(ModuleNotFoundException):
+        module_reader.module_to_file_path("utils.array")
+
+
+def test_ignoring_directories_named_like_modules(tmp_path: Path):
+    (tmp_path / "utils.cairo").mkdir()
+
+    module_reader = get_indexed_module_reader(cairo_path=[str(tmp_path)])
+
+    with pytest.raises(ModuleNotFoundException):
+        module_reader.module_to_file_path("utils")
+
+
+def test_noticing_new_modules_in_next_index(tmp_path: Path):
+    (tmp_path / "utils").mkdir()
+    with pytest.raises(ModuleNotFoundException):
+        get_indexed_module_reader(cairo_path=[str(tmp_path)]).module_to_file_path(
+            "utils.math"
+        )
+
+    (tmp_path / "utils" / "math.cairo").write_text("")
+
+    assert get_indexed_module_reader(
+        cairo_path=[str(tmp_path)]
+    ).module_to_file_path("utils.math") == str(tmp_path / "utils" / "math.cairo")
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Callable, ClassVar, Dict, Optional, Sequence, Set, Tuple
+
+from starkware.cairo.lang.compiler.ast.module import CairoFile, CairoModule
+from starkware.cairo.lang.compiler.ast.visitor import get_lang_from_file
+from starkware.cairo.lang.compiler.error_handling import Location
+from starkware.cairo.lang.compiler.import_loader import (
+    DirectDependenciesCollector,
+    ImportLoaderError,
+    ImportsCollector,
+    UsingCycleError,
+)
+from starkware.cairo.lang.compiler.module_reader import ModuleNotFoundException
+from starkware.cairo.lang.compiler.parser import parse_file
+from starkware.cairo.lang.compiler.preprocessor.default_pass_manager import (
+    ModuleCollector,
+)
+from starkware.cairo.lang.compiler.preprocessor.pass_manager import PassManagerContext
+from starkware.cairo.lang.compiler.scoped_name import ScopedName
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+
+
+class ParsedModulesCache:
+    """
+    ASTs of Cairo files parsed in this process, keyed by the file name and content,
+    shared by all compilations, so common libraries are parsed once rather than once per contract.
+
+    ASTs are kept pickled: compilation stages may modify the AST they get, so every compilation
+    needs its own copy, and unpickling is several times faster than parsing.
+    With a directory, pickled ASTs are also persisted and reused by following builds.
+    """
+
+    _pickled_files: ClassVar[Dict[str, bytes]] = {}
+
+    def __init__(self, cache_dir_path: Optional[Path] = None):
+        self._cache_dir_path = cache_dir_path
+
+    def parse_file(self, code: str, filename: str) -> CairoFile:
+        key = hashlib.sha256(
+            json.dumps([cairo_lang_version, filename, code]).encode("utf-8")
+        ).hexdigest()
+
+        pickled_file = ParsedModulesCache._pickled_files.get(key)
+        if pickled_file is None:
+            pickled_file = self._read_persisted(key)
+            if pickled_file is not None:
+                ParsedModulesCache._pickled_files[key] = pickled_file
+        if pickled_file is not None:
+            return pickle.loads(pickled_file)
+
+        parsed_file = parse_file(code, filename=filename)
+        pickled_file = pickle.dumps(parsed_file, protocol=pickle.HIGHEST_PROTOCOL)
+        ParsedModulesCache._pickled_files[key] = pickled_file
+        self._persist(key, pickled_file)
+        return parsed_file
+
+    def collect_imports(
+        self, curr_pkg_name: str, read_file: Callable[[str], Tuple[str, str]]
+    ) -> Dict[str, CairoFile]:
+        """
+        `starkware.cairo.lang.compiler.import_loader.collect_imports` parsing files with this cache.
+        """
+        collector = _CachingImportsCollector(read_file, parsed_modules_cache=self)
+        collector.collect(curr_pkg_name)
+        return collector.collected_data
+
+    def _read_persisted(self, key: str) -> Optional[bytes]:
+        if self._cache_dir_path is None:
+            return None
+        try:
+            return (self._cache_dir_path / f"{key}.pickle").read_bytes()
+        except OSError:
+            return None
+
+    def _persist(self, key: str, pickled_file: bytes) -> None:
+        if self._cache_dir_path is None:
+            return
+        try:
+            self._cache_dir_path.mkdir(parents=True, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(
+                dir=self._cache_dir_path, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(file_descriptor, "wb") as file:
+                    file.write(pickled_file)
+                os.replace(tmp_path, self._cache_dir_path / f"{key}.pickle")
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # The cache is an optimization, failing to populate it must not fail the compilation.
+            pass
+
+
+class _CachingImportsCollector(ImportsCollector):
+    def __init__(
+        self,
+        read_file: Callable[[str], Tuple[str, str]],
+        parsed_modules_cache: ParsedModulesCache,
+    ):
+        super().__init__(read_file)
+        self._parsed_modules_cache = parsed_modules_cache
+
+    def collect(self, curr_pkg_name: str, location: Optional[Location] = None):
+        # Check for circular dependencies.
+        if curr_pkg_name in self.curr_ancestors:
+            raise UsingCycleError(self.curr_ancestors + [curr_pkg_name])
+
+        if curr_pkg_name in self.collected_data:
+            # File already parsed.
+            return
+
+        try:
+            code, filename = self.read_file(curr_pkg_name)
+        except ModuleNotFoundException as ex:
+            raise ImportLoaderError(str(ex), location=location) from ex
+        except Exception as ex:
+            raise ImportLoaderError(
+                f"Could not load module '{curr_pkg_name}'.\nError: {ex}",
+                location=location,
+            ) from ex
+
+        # region Modified Starknet code.
+        parsed_file = self._parsed_modules_cache.parse_file(code, filename=filename)
+        # endregion
+
+        lang = get_lang_from_file(parsed_file)
+
+        # Get current file dependencies.
+        collector = DirectDependenciesCollector()
+        collector.get_using_pkgs_in_block(parsed_file.code_block)
+
+        # Add current package to ancestors list before scanning its dependencies.
+        self.curr_ancestors.append(curr_pkg_name)
+
+        # Collect ASTs recursively.
+        for pkg_name, pkg_location in collector.packages:
+            self.collect(pkg_name, location=pkg_location)
+            if not (self.lang[pkg_name] is None or self.lang[pkg_name] == lang):
+                raise ImportLoaderError(
+                    f"Importing modules with %lang directive '{self.lang[pkg_name]}' must "
+                    "be from a module with the same directive.",
+                    location=pkg_location,
+                )
+
+        # Pop current package from ancestors list after scanning its dependencies.
+        self.curr_ancestors.pop()
+        self.collected_data[curr_pkg_name] = parsed_file
+        self.lang[curr_pkg_name] = lang
+
+
+class CachingModuleCollector(ModuleCollector):
+    """
+    `ModuleCollector` parsing modules with `ParsedModulesCache`.
+    """
+
+    def __init__(
+        self,
+        read_module: Callable[[str], Tuple[str, str]],
+        parsed_modules_cache: ParsedModulesCache,
+        additional_modules: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(read_module, additional_modules)
+        self.parsed_modules_cache = parsed_modules_cache
+
+    def collect_module(
+        self,
+        code: str,
+        filename: str,
+        context: PassManagerContext,
+        visited_modules: Set[str],
+    ):
+        def read_file_fixed(name):
+            return (code, filename) if name == filename else self.read_module(name)
+
+        # region Modified Starknet code.
+        files = self.parsed_modules_cache.collect_imports(
+            filename, read_file=read_file_fixed
+        )
+        # endregion
+        for module_name, ast in files.items():
+            is_main_scope = module_name == filename
+            if is_main_scope:
+                scope = context.main_scope
+            else:
+                scope = ScopedName.from_string(module_name)
+                if module_name in visited_modules:
+                    continue
+                visited_modules.add(module_name)
+            context.modules.append(CairoModule(cairo_file=ast, module_name=scope))
+
+    def run(self, context: PassManagerContext):
+        visited_modules: Set[str] = set()
+        for code, filename in context.start_codes:
+            self.collect_module(
+                code=code,
+                filename=filename,
+                context=context,
+                visited_modules=visited_modules,
+            )
+
+        for additional_module in self.additional_modules:
+            # region Modified Starknet code.
+            files = self.parsed_modules_cache.collect_imports(
+                additional_module, read_file=self.read_module
+            )
+            # endregion
+            for module_name, ast in files.items():
+                if module_name in visited_modules:
+                    continue
+                visited_modules.add(module_name)
+                scope = ScopedName.from_string(module_name)
+                context.modules.append(CairoModule(cairo_file=ast, module_name=scope))
+
+        for code, filename in context.codes:
+            self.collect_module(
+                code=code,
+                filename=filename,
+                context=context,
+                visited_modules=visited_modules,
+            )
@@ -0,0 +1,94 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from protostar.utils.compiler import parsed_modules_cache
+from protostar.utils.compiler.parsed_modules_cache import ParsedModulesCache
+from protostar.utils.compiler.pass_managers import StarknetPassManagerFactory
+from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
+
+LIBRARY_CODE = """func get_value() -> felt {
+    return 42;
+}
+"""
+
+CONTRACT_CODE_TEMPLATE = """%lang starknet
+
+from library import get_value
+
+@view
+func read_value_{index}() -> (res: felt) {{
+    return (res=get_value());
+}}
+"""
+
+
+@pytest.fixture(name="project_path")
+def project_path_fixture(tmp_path: Path) -> Path:
+    (tmp_path / "library.cairo").write_text(LIBRARY_CODE)
+    for index in range(2):
+        (tmp_path / f"contract_{index}.cairo").write_text(
+            CONTRACT_CODE_TEMPLATE.format(index=index)
+        )
+    return tmp_path
+
+
+@pytest.fixture(name="parse_file_spy")
+def parse_file_spy_fixture(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ParsedModulesCache, "_pickled_files", {})
+    return mocker.spy(parsed_modules_cache, "parse_file")
+
+
+def build_compiler(project_path: Path) -> StarknetCompiler:
+    return StarknetCompiler(
+        config=CompilerConfig(
+            include_paths=[str(project_path)],
+            disable_hint_validation=False,
+            parsed_modules_cache_dir=project_path / ".protostar_cache",
+        ),
+        pass_manager_factory=StarknetPassManagerFactory,
+    )
+
+
+def get_parsed_file_names(parse_file_spy) -> List[str]:
+    return [Path(call.kwargs["filename"]).name for call in parse_file_spy.mock_calls]
+
+
+def test_parsing_shared_modules_once(project_path: Path, parse_file_spy):
+    build_compiler(project_path).compile_contract(project_path / "contract_0.cairo")
+    parsed_file_names = get_parsed_file_names(parse_file_spy)
+    assert "library.cairo" in parsed_file_names
+    assert "syscalls.cairo" in parsed_file_names
+    parse_file_spy.reset_mock()
+
+    contract_class = build_compiler(project_path).compile_contract(
+        project_path / "contract_1.cairo"
+    )
+
+    assert get_parsed_file_names(parse_file_spy) == ["contract_1.cairo"]
+    assert [entry["name"] for entry in contract_class.abi] == ["read_value_1"]
+
+
+def test_reusing_persisted_modules(
+    project_path: Path, parse_file_spy, monkeypatch: pytest.MonkeyPatch
+):
+    build_compiler(project_path).compile_contract(project_path / "contract_0.cairo")
+    monkeypatch.setattr(ParsedModulesCache, "_pickled_files", {})
+    parse_file_spy.reset_mock()
+
+    build_compiler(project_path).compile_contract(project_path / "contract_0.cairo")
+
+    assert get_parsed_file_names(parse_file_spy) == []
+
+
+def test_returning_independent_copies(parse_file_spy):
+    cache = ParsedModulesCache()
+
+    parsed_file = cache.parse_file(LIBRARY_CODE, filename="library.cairo")
+    cached_parsed_file = cache.parse_file(LIBRARY_CODE, filename="library.cairo")
+
+    assert parse_file_spy.call_count == 1
+    assert cached_parsed_file is not parsed_file
+    assert cached_parsed_file.format() == parsed_file.format()
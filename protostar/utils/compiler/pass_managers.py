@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, replace
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, List
 from starkware.starknet.public.abi_structs import (
     prepare_type_for_abi,
 )
@@ -11,7 +11,6 @@ from starkware.starknet.compiler.starknet_preprocessor import StarknetPreprocess
 
 from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
 from starkware.cairo.lang.compiler.ast.code_elements import CodeElementFunction
-from starkware.cairo.lang.compiler.cairo_compile import get_module_reader
 from starkware.cairo.lang.compiler.preprocessor.pass_manager import (
     PassManager,
     PassManagerContext,
@@ -26,7 +25,6 @@ from starkware.starknet.security.hints_whitelist import get_hints_whitelist
 
 
 from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
-from starkware.cairo.lang.compiler.cairo_compile import get_module_reader
 from starkware.cairo.lang.compiler.preprocessor.pass_manager import (
     PassManager,
     VisitorStage,
@@ -51,6 +49,12 @@ from starkware.starknet.compiler.external_wrapper import (
 )
 from starkware.cairo.lang.compiler.ast.code_elements import CodeBlock
 
+from protostar.utils.compiler.module_index import get_indexed_module_reader
+from protostar.utils.compiler.parsed_modules_cache import (
+    CachingModuleCollector,
+    ParsedModulesCache,
+)
+
 if TYPE_CHECKING:
     from protostar.utils.starknet_compilation import CompilerConfig
 
@@ -62,15 +66,33 @@ class PassManagerFactory(ABC):
         ...
 
 
+def use_parsed_modules_cache(manager: PassManager, config: "CompilerConfig") -> None:
+    """
+    Make the module collector of the `manager` reuse ASTs parsed by previous compilations.
+    """
+    module_collector = manager.stages[manager.get_stage_index("module_collector")][1]
+    assert isinstance(module_collector, ModuleCollector)
+    manager.replace(
+        "module_collector",
+        CachingModuleCollector(
+            read_module=module_collector.read_module,
+            parsed_modules_cache=ParsedModulesCache(config.parsed_modules_cache_dir),
+            additional_modules=module_collector.additional_modules,
+        ),
+    )
+
+
 class StarknetPassManagerFactory(PassManagerFactory):
     @staticmethod
     def build(config: "CompilerConfig") -> PassManager:
-        read_module = get_module_reader(cairo_path=config.include_paths).read
-        return starknet_pass_manager(
+        read_module = get_indexed_module_reader(cairo_path=config.include_paths).read
+        manager = starknet_pass_manager(
             DEFAULT_PRIME,
             read_module,
             disable_hint_validation=config.disable_hint_validation,
         )
+        use_parsed_modules_cache(manager, config)
+        return manager
 
 
 class TestCollectorPassManagerFactory(StarknetPassManagerFactory):
@@ -80,13 +102,16 @@ class TestCollectorPassManagerFactory(StarknetPassManagerFactory):
 
     @staticmethod
     def build(config: "CompilerConfig") -> PassManager:
-        read_module = get_module_reader(cairo_path=config.include_paths).read
+        read_module = get_indexed_module_reader(cairo_path=config.include_paths).read
 
         manager = PassManager()
         manager.add_stage(
             "module_collector",
-            ModuleCollector(
+            CachingModuleCollector(
                 read_module=read_module,
+                parsed_modules_cache=ParsedModulesCache(
+                    config.parsed_modules_cache_dir
+                ),
                 additional_modules=[],
             ),
         )
@@ -104,7 +129,7 @@ class ProtostarPassMangerFactory(StarknetPassManagerFactory):
 
     @staticmethod
     def build(config: "CompilerConfig") -> PassManager:
-        read_module = get_module_reader(cairo_path=config.include_paths).read
+        read_module = get_indexed_module_reader(cairo_path=config.include_paths).read
         manager = starknet_pass_manager(
             DEFAULT_PRIME,
             read_module,
@@ -122,6 +147,7 @@ class ProtostarPassMangerFactory(StarknetPassManagerFactory):
                 dict(hint_whitelist=hint_whitelist),
             ),
         )
+        use_parsed_modules_cache(manager, config)
         return manager
 
 
@@ -177,14 +203,21 @@ class TestCollectorStage(VisitorStage):
         super().__init__(TestCollectorPreprocessor, modify_ast=True)
 
     def run(self, context: PassManagerContext):
+        imported_modules = [
+            str(module.module_name)
+            for module in context.modules
+            if module.module_name != context.main_scope
+        ]
         visitor = super().run(context)
-        context.preprocessed_program = visitor.get_program()
+        context.preprocessed_program = visitor.get_program(imported_modules)
         return visitor
 
 
 @dataclass
 class TestCollectorPreprocessedProgram:
     abi: AbiType
+    imported_modules: List[str] = field(default_factory=list)
+    """Names of modules (transitively) imported by the test suite, collected by `ModuleCollector`."""
 
 
 class TestCollectorPreprocessor(Visitor):
@@ -220,8 +253,10 @@ class TestCollectorPreprocessor(Visitor):
                 external_decorator_name=external_decorator.name,
             )
 
-    def get_program(self):
-        return TestCollectorPreprocessedProgram(abi=self.abi)
+    def get_program(self, imported_modules: List[str]):
+        return TestCollectorPreprocessedProgram(
+            abi=self.abi, imported_modules=imported_modules
+        )
 
     def _visit_default(self, obj):
         pass
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple, Type, Union
+from typing import List, Optional, Tuple, Type, Union
 
 from starkware.cairo.lang.compiler.constants import MAIN_SCOPE
 from starkware.cairo.lang.compiler.identifier_manager import IdentifierManager
@@ -17,6 +17,11 @@ from starkware.starknet.compiler.starknet_preprocessor import (
 from starkware.starknet.services.api.contract_class import ContractClass
 
 from protostar.protostar_exception import ProtostarException
+from protostar.utils.compiler.compilation_cache import CompilationCache
+from protostar.utils.compiler.compiler_profiler import (
+    ASSEMBLY_STAGE_NAME,
+    CompilerProfiler,
+)
 from protostar.utils.compiler.pass_managers import (
     PassManagerFactory,
     TestCollectorPreprocessedProgram,
@@ -27,6 +32,8 @@ from protostar.utils.compiler.pass_managers import (
 class CompilerConfig:
     include_paths: List[str]
     disable_hint_validation: bool
+    parsed_modules_cache_dir: Optional[Path] = None
+    """Directory persisting ASTs of parsed modules between runs, see `ParsedModulesCache`."""
 
 
 class StarknetCompiler:
@@ -34,12 +41,33 @@ class StarknetCompiler:
         self,
         config: CompilerConfig,
         pass_manager_factory: Type[PassManagerFactory],
+        cache: Optional[CompilationCache] = None,
+        profiler: Optional[CompilerProfiler] = None,
     ):
         self.pass_manager = pass_manager_factory.build(config)
+        self._config = config
+        self._pass_manager_factory = pass_manager_factory
+        self._cache = cache
+        self._profiler = profiler
+        if profiler is not None:
+            profiler.instrument(self.pass_manager)
 
     class FileNotFoundException(ProtostarException):
         pass
 
+    @property
+    def include_paths(self) -> List[str]:
+        return self._config.include_paths
+
+    @property
+    def config_key(self) -> Tuple[Tuple[str, ...], bool, Type[PassManagerFactory]]:
+        """Hashable identity of settings affecting the compilation output."""
+        return (
+            tuple(self._config.include_paths),
+            self._config.disable_hint_validation,
+            self._pass_manager_factory,
+        )
+
     @staticmethod
     def build_context(codes: List[Tuple[str, str]]) -> PassManagerContext:
         return PassManagerContext(
@@ -59,6 +87,13 @@ class StarknetCompiler:
     def preprocess_contract(
         self, *cairo_file_paths: Path
     ) -> Union[StarknetPreprocessedProgram, TestCollectorPreprocessedProgram]:
+        try:
+            return self._run_pass_manager(*cairo_file_paths).preprocessed_program
+        finally:
+            if self._profiler is not None:
+                self._profiler.flush()
+
+    def _run_pass_manager(self, *cairo_file_paths: Path) -> PassManagerContext:
         try:
             codes = self.build_codes(*cairo_file_paths)
             context = self.build_context(codes)
@@ -67,7 +102,7 @@ class StarknetCompiler:
                 context.preprocessed_program,
                 (StarknetPreprocessedProgram, TestCollectorPreprocessedProgram),
             )
-            return context.preprocessed_program
+            return context
         except FileNotFoundError as err:
             raise StarknetCompiler.FileNotFoundException(
                 message=(f"Couldn't find file '{err.filename}'")
@@ -104,10 +139,70 @@ class StarknetCompiler:
         *sources: Path,
         add_debug_info: bool = False,
     ) -> ContractClass:
-        preprocessed = self.preprocess_contract(*sources)
-        assert isinstance(preprocessed, StarknetPreprocessedProgram)
-        assembled = self.compile_preprocessed_contract(preprocessed, add_debug_info)
-        return assembled
+        return self.compile_contract_with_dependencies(
+            *sources, add_debug_info=add_debug_info
+        )[0]
+
+    def compile_contract_with_dependencies(
+        self,
+        *sources: Path,
+        add_debug_info: bool = False,
+    ) -> Tuple[ContractClass, List[str]]:
+        """
+        Compile the contract and return names of modules it imports (transitively).
+        """
+        if self._cache is None:
+            return self._compile_contract(*sources, add_debug_info=add_debug_info)
+
+        settings = {
+            "disable_hint_validation": self._config.disable_hint_validation,
+            "pass_manager_factory": f"{self._pass_manager_factory.__module__}."
+            f"{self._pass_manager_factory.__qualname__}",
+            "add_debug_info": add_debug_info,
+        }
+        cached = self._cache.get_with_dependencies(
+            sources, self._config.include_paths, settings
+        )
+        if cached is not None:
+            return cached
+
+        assembled, dependencies = self._compile_contract(
+            *sources, add_debug_info=add_debug_info
+        )
+        self._cache.put(
+            sources,
+            self._config.include_paths,
+            settings,
+            dependencies=dependencies,
+            contract_class=assembled,
+        )
+        return assembled, dependencies
+
+    def _compile_contract(
+        self, *sources: Path, add_debug_info: bool
+    ) -> Tuple[ContractClass, List[str]]:
+        try:
+            context = self._run_pass_manager(*sources)
+            preprocessed = context.preprocessed_program
+            assert isinstance(preprocessed, StarknetPreprocessedProgram)
+            if self._profiler is None:
+                assembled = self.compile_preprocessed_contract(
+                    preprocessed, add_debug_info
+                )
+            else:
+                with self._profiler.measure(ASSEMBLY_STAGE_NAME):
+                    assembled = self.compile_preprocessed_contract(
+                        preprocessed, add_debug_info
+                    )
+        finally:
+            if self._profiler is not None:
+                self._profiler.flush()
+        dependencies = [
+            str(module.module_name)
+            for module in context.modules
+            if module.module_name != MAIN_SCOPE
+        ]
+        return assembled, dependencies
 
     @staticmethod
     def get_function_names(
@@ -1,18 +1,26 @@
 import asyncio
-import multiprocessing
 import threading
 from contextlib import asynccontextmanager
-from multiprocessing.managers import SyncManager
 from pathlib import Path
 from string import Template
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, cast
 
 import pytest
+from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo
 from starkware.starknet.services.api.contract_class import ContractClass
 
-from protostar.testing import SharedTestsState, TestCollector, TestRunner
+from protostar.commands.test.testing_live_logger import TestingLiveLogger
+from protostar.starknet import DelayedBuilder
+from protostar.starknet.cheatable_cairo_function_runner import (
+    CheatableCairoFunctionRunner,
+)
+from protostar.starknet.forkable_starknet import ForkableStarknet
+from protostar.starknet.lazy_hint_locals import LazyHintLocals
+from protostar.testing import SharedTestsState, TestCollector, TestRunner, TestScheduler
 from protostar.testing.starkware.test_execution_state import TestExecutionState
 from protostar.testing.test_config import TestConfig
+from protostar.testing.test_results import PassedTestCaseResult
 from protostar.testing.test_suite import TestCase, TestSuite
 from protostar.utils.compiler.pass_managers import ProtostarPassMangerFactory
 from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
@@ -103,11 +111,10 @@ def build_test_suite(
 
 
 async def prepare_suite(
-    manager: SyncManager, test_suite: TestSuite, contract: ContractClass
+    test_suite: TestSuite, contract: ContractClass
 ) -> Tuple[TestRunner, SharedTestsState, Optional[TestExecutionState]]:
     tests_state = SharedTestsState(
         test_collector_result=TestCollector.Result(test_suites=[test_suite]),
-        manager=manager,
     )
     runner = TestRunner(
         shared_tests_state=tests_state,
@@ -125,6 +132,7 @@ async def prepare_suite(
 
 
 def wait_for_completion(test_suite: TestSuite, tests_state: SharedTestsState):
+    tests_state.flush()
     tests_left = len(test_suite.test_cases)
     while tests_left:
         tests_state.get_result()
@@ -185,20 +193,19 @@ def aio_benchmark_fixture(benchmark):
 
 @asynccontextmanager
 async def prepare_tests(contract_class: ContractClass, test_suite: TestSuite):
-    with multiprocessing.Manager() as manager:
-        runner, shared_state, execution_state = await prepare_suite(
-            manager, test_suite, contract_class
-        )
-        if not execution_state:
-            return
+    runner, shared_state, execution_state = await prepare_suite(
+        test_suite, contract_class
+    )
+    if not execution_state:
+        return
 
-        async def run():
-            # pylint: disable=protected-access
-            await runner._invoke_test_cases(test_suite, execution_state)
+    async def run():
+        # pylint: disable=protected-access
+        await runner._invoke_test_cases(test_suite, execution_state)
 
-        yield run
+    yield run
 
-        wait_for_completion(test_suite, shared_state)
+    wait_for_completion(test_suite, shared_state)
 
 
 async def test_deploy_perf(aio_benchmark, tmp_path, basic_contract_path):
@@ -490,3 +497,150 @@ async def test_collecting_tests_perf(aio_benchmark, tmp_path):
     test_collector = TestCollector(starknet_compiler=get_test_starknet_compiler())
     result = aio_benchmark(test_collector.collect, [str(tmp_path)])
     assert result.test_cases_count == 195
+
+
+HINTS_COUNT = 2000
+
+
+def test_hints_execution_perf(benchmark):
+    program = compile_cairo(
+        """
+        func count_down(n: felt) {
+            if (n == 0) {
+                return ();
+            }
+            %{ value = 1 %}
+            return count_down(n - 1);
+        }
+        """,
+        prime=DEFAULT_PRIME,
+    )
+    # Mimics the hint locals of a test case: a delayed cheatcode and many regular ones.
+    hint_locals = {
+        "reflect": DelayedBuilder(lambda exec_locals: exec_locals["ids"]),
+        **{f"cheatcode_{i}": lambda: None for i in range(50)},
+    }
+
+    def run_hints():
+        runner = CheatableCairoFunctionRunner(program=program, layout="all")
+        runner.run("count_down", HINTS_COUNT, hint_locals=hint_locals)
+
+    benchmark.pedantic(run_hints, rounds=ROUNDS_NUMBER)
+    benchmark.extra_info["hints_per_second"] = HINTS_COUNT / benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("lazy_hint_locals", [False, True])
+def test_hints_using_builtins_execution_perf(benchmark, lazy_hint_locals: bool):
+    program = compile_cairo(
+        """
+        func count_down(n: felt) {
+            if (n == 0) {
+                return ();
+            }
+            %{ value = len(range(min(ids.n, 3))) + int(isinstance(ids.n, int)) %}
+            return count_down(n - 1);
+        }
+        """,
+        prime=DEFAULT_PRIME,
+    )
+
+    def build_hint_locals():
+        return {f"cheatcode_{i}": lambda: None for i in range(50)}
+
+    def run_hints():
+        # Without lazy hint locals, cheatcodes are built before the run, as they were before `LazyHintLocals`.
+        hint_locals = (
+            LazyHintLocals({}, build_hint_locals=build_hint_locals)
+            if lazy_hint_locals
+            else build_hint_locals()
+        )
+        runner = CheatableCairoFunctionRunner(program=program, layout="all")
+        runner.run("count_down", HINTS_COUNT, hint_locals=hint_locals)
+
+    benchmark.pedantic(run_hints, rounds=ROUNDS_NUMBER)
+    benchmark.extra_info["hints_per_second"] = HINTS_COUNT / benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("declared_contracts_count", [10, 100, 1000])
+def test_forking_state_perf(benchmark, declared_contracts_count: int):
+    starknet = asyncio.run(ForkableStarknet.empty())
+    cheatable_state = starknet.cheatable_state.cheatable_state
+    # Mimics maps filled by the `declare` cheatcode in `__setup__`.
+    for class_hash in range(declared_contracts_count):
+        abi = [{"name": f"fn_{i}", "type": "function"} for i in range(20)]
+        cheatable_state.class_hash_to_contract_abi_map[class_hash] = abi
+        cheatable_state.class_hash_to_contract_path_map[class_hash] = Path(
+            f"contract_{class_hash}.cairo"
+        )
+        cheatable_state.contract_address_to_class_hash_map[class_hash] = class_hash
+        cheatable_state.event_selector_to_name_map[class_hash] = f"event_{class_hash}"
+        cheatable_state.event_name_to_contract_abi_map[f"event_{class_hash}"] = abi
+
+    def fork_and_apply():
+        forked_starknet = starknet.fork()
+        with forked_starknet.cheatable_state.cheatable_state.copy_and_apply() as state:
+            state.pranked_contracts_map[0] = 1
+
+    benchmark.pedantic(fork_and_apply, rounds=ROUNDS_NUMBER)
+
+
+TRIVIAL_TESTS_COUNT = 10_000
+
+
+def _report_passed_test_cases(args: TestRunner.WorkerArgs):
+    shared_tests_state = SharedTestsState.from_worker()
+    for test_case in args.test_suite.test_cases:
+        shared_tests_state.put_result(
+            PassedTestCaseResult(
+                file_path=test_case.test_path,
+                test_case_name=test_case.test_fn_name,
+                captured_stdout={},
+                execution_time=0.0,
+                execution_resources=None,
+            )
+        )
+    shared_tests_state.flush()
+
+
+class ResultsConsumingLogger:
+    def log(
+        self,
+        shared_tests_state: SharedTestsState,
+        test_collector_result: TestCollector.Result,
+    ):
+        for _ in range(test_collector_result.test_cases_count):
+            shared_tests_state.get_result()
+            shared_tests_state.any_failed_or_broken()
+
+    def log_testing_summary(self, test_collector_result: TestCollector.Result):
+        pass
+
+
+def test_transporting_test_results_perf(benchmark):
+    test_suites = []
+    for suite_index in range(TRIVIAL_TESTS_COUNT // 100):
+        test_path = Path(f"test_{suite_index}.cairo")
+        test_suites.append(
+            TestSuite(
+                test_path=test_path,
+                test_cases=[
+                    TestCase(test_path=test_path, test_fn_name=f"test_{case_index}")
+                    for case_index in range(100)
+                ],
+            )
+        )
+    test_collector_result = TestCollector.Result(test_suites=test_suites)
+
+    def run_tests():
+        TestScheduler(
+            cast(TestingLiveLogger, ResultsConsumingLogger()),
+            worker=_report_passed_test_cases,
+        ).run(
+            test_collector_result=test_collector_result,
+            include_paths=[],
+            disable_hint_validation=False,
+            exit_first=False,
+            testing_seed=0,
+        )
+
+    benchmark.pedantic(run_tests, rounds=ROUNDS_NUMBER)
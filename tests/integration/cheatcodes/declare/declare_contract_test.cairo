@@ -71,3 +71,25 @@ func test_deploy_declared_contract_in_proxy{syscall_ptr: felt*, range_check_ptr}
     assert balance = 12;
     return ();
 }
+
+@external
+func test_declaring_same_contract_twice{syscall_ptr: felt*, range_check_ptr}() {
+    alloc_locals;
+
+    local first_class_hash: felt;
+    local second_class_hash: felt;
+    %{
+        ids.first_class_hash = declare("./tests/integration/cheatcodes/declare/basic_contract.cairo").class_hash
+        ids.second_class_hash = declare("./tests/integration/cheatcodes/declare/basic_contract.cairo").class_hash
+    %}
+    assert first_class_hash = second_class_hash;
+
+    let (local calldata: felt*) = alloc();
+    let (contract_address) = deploy(second_class_hash, 42, 0, calldata, 0);
+
+    BasicContract.increase_balance(contract_address, 12);
+
+    let (balance) = BasicContract.get_balance(contract_address);
+    assert balance = 12;
+    return ();
+}
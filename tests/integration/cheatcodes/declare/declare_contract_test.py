@@ -20,6 +20,7 @@ async def test_declare_contract(run_cairo_test_runner: RunCairoTestRunnerFixture
             "test_deploy_declared_contract",
             "test_deploy_declared_contract_in_proxy",
             "test_deploy_declared_contract_deploy_zero_flag",
+            "test_declaring_same_contract_twice",
         ],
         expected_failed_test_cases_names=[],
     )
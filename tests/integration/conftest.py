@@ -103,6 +103,12 @@ class RunCairoTestRunnerFixture(Protocol):
         cairo_path: Optional[List[Path]] = None,
         test_cases: Optional[List[str]] = None,
         ignored_test_cases: Optional[List[str]] = None,
+        split_test_suites: bool = False,
+        fuzz_processes_count: int = 1,
+        fuzz_examples_databases_path: Optional[Path] = None,
+        test_timings_history_path: Optional[Path] = None,
+        lazy_debug_info: bool = False,
+        use_flat_state_reader: bool = False,
     ) -> TestingSummary:
         ...
 
@@ -125,6 +131,12 @@ def run_cairo_test_runner_fixture(
         cairo_path: Optional[List[Path]] = None,
         test_cases: Optional[List[str]] = None,
         ignored_test_cases: Optional[List[str]] = None,
+        split_test_suites: bool = False,
+        fuzz_processes_count: int = 1,
+        fuzz_examples_databases_path: Optional[Path] = None,
+        test_timings_history_path: Optional[Path] = None,
+        lazy_debug_info: bool = False,
+        use_flat_state_reader: bool = False,
     ) -> TestingSummary:
         protostar_directory_mock = mocker.MagicMock()
         protostar_directory_mock.protostar_test_only_cairo_packages_path = Path()
@@ -154,12 +166,18 @@ def run_cairo_test_runner_fixture(
             project_cairo_path_builder=project_cairo_path_builder,
             logger=getLogger(),
             log_color_provider=log_color_provider,
+            fuzz_examples_databases_path=fuzz_examples_databases_path,
+            test_timings_history_path=test_timings_history_path,
         ).test(
             targets=targets,
             ignored_targets=ignored_targets,
             seed=seed,
             disable_hint_validation=disable_hint_validation,
             cairo_path=cairo_path or [],
+            split_test_suites=split_test_suites,
+            fuzz_processes_count=fuzz_processes_count,
+            lazy_debug_info=lazy_debug_info,
+            use_flat_state_reader=use_flat_state_reader,
         )
 
     return run_cairo_test_runner
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+from protostar.testing.fuzzing.fuzz_input_exception_metadata import (
+    FuzzInputExceptionMetadata,
+)
 from protostar.testing.test_results import PassedFuzzTestCaseResult
 from tests.integration.conftest import (
     RunCairoTestRunnerFixture,
@@ -21,6 +24,10 @@ async def test_basic(run_cairo_test_runner: RunCairoTestRunnerFixture):
     )
 
     assert testing_summary.testing_seed == seed
+    [passed_result] = testing_summary.passed
+    assert isinstance(passed_result, PassedFuzzTestCaseResult)
+    assert passed_result.fuzz_examples_per_second is not None
+    assert passed_result.fuzz_examples_per_second > 0
 
 
 async def test_non_felt_parameter(run_cairo_test_runner: RunCairoTestRunnerFixture):
@@ -122,3 +129,61 @@ async def test_should_not_share_state(
         testing_summary,
         expected_passed_test_cases_names=["test_context"],
     )
+
+
+async def test_fuzzing_in_multiple_processes(
+    run_cairo_test_runner: RunCairoTestRunnerFixture,
+):
+    async def run_basic_test():
+        return await run_cairo_test_runner(
+            Path(__file__).parent / "basic_test.cairo",
+            seed=10,
+            fuzz_processes_count=2,
+        )
+
+    testing_summary = await run_basic_test()
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_fuzz_pass"],
+        expected_failed_test_cases_names=["test_fuzz_fails"],
+    )
+    [passed_result] = testing_summary.passed
+    assert isinstance(passed_result, PassedFuzzTestCaseResult)
+    assert passed_result.fuzz_runs_count is not None
+    assert 2 <= passed_result.fuzz_runs_count <= 5
+
+    [failed_result] = testing_summary.failed
+    [same_seed_failed_result] = (await run_basic_test()).failed
+    fuzz_inputs = failed_result.exception.get_metadata_by_type(
+        FuzzInputExceptionMetadata
+    )
+    assert fuzz_inputs is not None
+    assert fuzz_inputs == same_seed_failed_result.exception.get_metadata_by_type(
+        FuzzInputExceptionMetadata
+    )
+
+
+async def test_replaying_failures_from_example_database(
+    run_cairo_test_runner: RunCairoTestRunnerFixture, tmp_path: Path
+):
+    async def run_failing_test(seed: int):
+        testing_summary = await run_cairo_test_runner(
+            Path(__file__).parent / "basic_test.cairo",
+            seed=seed,
+            test_cases=["test_fuzz_fails"],
+            fuzz_examples_databases_path=tmp_path,
+        )
+        [failed_result] = testing_summary.failed
+        return failed_result
+
+    first_result = await run_failing_test(seed=10)
+    replayed_result = await run_failing_test(seed=3)
+
+    assert any(tmp_path.iterdir())
+    assert first_result.exception.get_metadata_by_type(
+        FuzzInputExceptionMetadata
+    ) == replayed_result.exception.get_metadata_by_type(FuzzInputExceptionMetadata)
+    assert first_result.fuzz_runs_count is not None
+    assert replayed_result.fuzz_runs_count is not None
+    assert replayed_result.fuzz_runs_count < first_result.fuzz_runs_count
@@ -117,3 +117,46 @@ def test_handling_not_existing_main_files(tmp_path: Path, datadir: Path, create_
                 relative_cairo_path=[project_root_path]
             ),
         ).compile_project(output_dir=tmp_path)
+
+
+def test_skipping_up_to_date_contracts(tmp_path: Path, datadir: Path, create_loader):
+    project_root_path = datadir / "importing"
+    project_compiler = ProjectCompiler(
+        project_root_path,
+        project_cairo_path_builder=ProjectCairoPathBuilder(
+            project_root_path,
+            project_section_loader=create_loader(
+                ProtostarProjectSection(libs_relative_path=Path("./modules"))
+            ),
+        ),
+        contracts_section_loader=create_loader(
+            ProtostarContractsSection(
+                contract_name_to_paths={"main": [Path("./entry_point.cairo")]}
+            )
+        ),
+        build_manifest_path=tmp_path / "build_manifest.json",
+    )
+    output_dir = tmp_path / "build"
+
+    def get_artifact_modification_time() -> int:
+        return (output_dir / "main.json").stat().st_mtime_ns
+
+    project_compiler.compile_project(output_dir=output_dir)
+    first_build_time = get_artifact_modification_time()
+
+    project_compiler.compile_project(output_dir=output_dir)
+    assert get_artifact_modification_time() == first_build_time
+
+    constants_path = project_root_path / "modules" / "some_lib" / "constants.cairo"
+    constants_path.write_text(constants_path.read_text() + "\n")
+    project_compiler.compile_project(output_dir=output_dir)
+    second_build_time = get_artifact_modification_time()
+    assert second_build_time != first_build_time
+
+    project_compiler.compile_project(
+        output_dir=output_dir,
+        config=ProjectCompilerConfig(
+            relative_cairo_path=[], debugging_info_attached=True
+        ),
+    )
+    assert get_artifact_modification_time() != second_build_time
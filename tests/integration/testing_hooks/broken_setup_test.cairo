@@ -0,0 +1,22 @@
+%lang starknet
+
+@external
+func __setup__() {
+    %{ assert False %}
+    return ();
+}
+
+@external
+func test_first() {
+    return ();
+}
+
+@external
+func test_second() {
+    return ();
+}
+
+@external
+func test_third() {
+    return ();
+}
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from protostar.testing.test_environment_exceptions import StarknetRevertableException
 from tests.integration.conftest import (
     RunCairoTestRunnerFixture,
     assert_cairo_test_cases,
@@ -43,3 +44,75 @@ async def test_invalid_setup(run_cairo_test_runner: RunCairoTestRunnerFixture):
     )
 
     assert len(testing_summary.broken_suites) == 1
+
+
+async def test_setup_case_with_split_test_suites(
+    run_cairo_test_runner: RunCairoTestRunnerFixture,
+):
+    testing_summary = await run_cairo_test_runner(
+        Path(__file__).parent / "setup_case_test.cairo",
+        split_test_suites=True,
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=[
+            "test_setup_case",
+            "test_setup_hook_only",
+        ],
+        expected_broken_test_cases_names=[
+            "test_setup_case_fails",
+        ],
+    )
+
+
+async def test_setup_case_with_lazy_debug_info(
+    run_cairo_test_runner: RunCairoTestRunnerFixture,
+):
+    testing_summary = await run_cairo_test_runner(
+        Path(__file__).parent / "setup_case_test.cairo",
+        lazy_debug_info=True,
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=[
+            "test_setup_case",
+            "test_setup_hook_only",
+        ],
+        expected_broken_test_cases_names=[
+            "test_setup_case_fails",
+        ],
+    )
+    # The broken test case is rerun with debug info, so its error points to the Cairo source.
+    exception = testing_summary.broken[0].exception
+    assert isinstance(exception, StarknetRevertableException)
+    assert exception.details is not None
+    assert "setup_case_test.cairo:" in exception.details
+
+
+async def test_invalid_setup_with_lazy_debug_info(
+    run_cairo_test_runner: RunCairoTestRunnerFixture,
+):
+    testing_summary = await run_cairo_test_runner(
+        Path(__file__).parent / "invalid_setup_test.cairo",
+        lazy_debug_info=True,
+    )
+
+    assert len(testing_summary.broken_suites) == 1
+
+
+async def test_broken_setup_with_split_test_suites(
+    run_cairo_test_runner: RunCairoTestRunnerFixture,
+):
+    testing_summary = await run_cairo_test_runner(
+        Path(__file__).parent / "broken_setup_test.cairo",
+        split_test_suites=True,
+    )
+
+    assert len(testing_summary.broken_suites) == 1
+    assert sorted(testing_summary.broken_suites[0].test_case_names) == [
+        "test_first",
+        "test_second",
+        "test_third",
+    ]
@@ -66,3 +66,29 @@ async def test_output_when_slowest_tests_count_is_zero(testing_summary: TestingS
     # Zero should yield no result
     test0 = testing_summary._format_slow_test_cases_list(0)
     assert test0 == ""
+
+
+async def test_slowest_tests_trend_is_based_on_previous_runs(
+    run_cairo_test_runner: RunCairoTestRunnerFixture,
+    no_color_log_color_provider: LogColorProvider,
+    tmp_path: Path,
+):
+    test_timings_history_path = tmp_path / "test_timings.json"
+    test_suite_path = Path(__file__).parent / "testing_timing_test.cairo"
+
+    first_testing_summary = await run_cairo_test_runner(
+        test_suite_path, test_timings_history_path=test_timings_history_path
+    )
+    second_testing_summary = await run_cairo_test_runner(
+        test_suite_path, test_timings_history_path=test_timings_history_path
+    )
+
+    assert test_timings_history_path.exists()
+    assert "previous avg=" not in first_testing_summary._format_slow_test_cases_list(
+        4, no_color_log_color_provider
+    )
+    second_run_logs = second_testing_summary._format_slow_test_cases_list(
+        4, no_color_log_color_provider
+    )
+    assert_exec_times_in_desc_order(second_run_logs)
+    assert second_run_logs.count("previous avg=") == 4